@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import random
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime, timedelta
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
 
 try:
     from .load_data import Cargo, Flight
@@ -13,7 +14,7 @@ except ImportError:
     from ga_route import CargoAssignment, GAResult
 
 
-@dataclass
+@dataclass(slots=True)
 class RecommendationOption:
     option_type: str
     description: str
@@ -26,7 +27,7 @@ class RecommendationOption:
     required_actions: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class CargoRecommendation:
     cargo_id: str
     cargo_priority: str
@@ -36,102 +37,371 @@ class CargoRecommendation:
     recommended_option: Optional[RecommendationOption]
 
 
+@dataclass
+class FlightTable:
+    """Structure-of-arrays view of a flight set used by the option scorers.
+
+    Rows are ordered by departure time so time-window filters can start from a
+    binary search instead of testing every flight. Airports are also encoded as
+    integer codes so they can be compared against a whole batch of cargo at
+    once. The table only depends on the flights, so it can be built once per
+    pipeline run and reused.
+    """
+
+    flight_ids: List[str]
+    departure_ts: np.ndarray
+    arrival_ts: np.ndarray
+    weight_capacity: np.ndarray
+    volume_capacity: np.ndarray
+    swap_extra_weight: np.ndarray
+    swap_extra_volume: np.ndarray
+    airport_codes: Dict[str, int]
+    origin_code: np.ndarray
+    destination_code: np.ndarray
+
+    def encode_airports(self, airports: Iterable[str], count: int) -> np.ndarray:
+        """Integer codes for ``airports``; airports no flight serves get -1."""
+        codes = self.airport_codes
+        return np.fromiter((codes.get(airport, -1) for airport in airports), dtype=np.int32, count=count)
+
+
+def build_flight_table(flights: Dict[str, Flight]) -> FlightTable:
+    """Flatten flights into NumPy columns in a single pass."""
+    ordered = sorted(flights.values(), key=attrgetter("departure_time"))
+    count = len(ordered)
+    departure_ts = np.empty(count, dtype=np.float64)
+    arrival_ts = np.empty(count, dtype=np.float64)
+    weight_capacity = np.empty(count, dtype=np.float64)
+    volume_capacity = np.empty(count, dtype=np.float64)
+    swap_weight = np.empty(count, dtype=np.float64)
+    swap_volume = np.empty(count, dtype=np.float64)
+    airport_codes: Dict[str, int] = {}
+    origin_code = np.empty(count, dtype=np.int32)
+    destination_code = np.empty(count, dtype=np.int32)
+
+    for idx, flight in enumerate(ordered):
+        origin_code[idx] = airport_codes.setdefault(flight.origin, len(airport_codes))
+        destination_code[idx] = airport_codes.setdefault(flight.destination, len(airport_codes))
+        departure_ts[idx] = flight.departure_time.timestamp()
+        arrival_ts[idx] = flight.arrival_time.timestamp()
+        weight_capacity[idx] = flight.weight_capacity_kg
+        volume_capacity[idx] = flight.volume_capacity_m3
+        swap_weight[idx] = flight.aircraft_swap_capacity_kg
+        swap_volume[idx] = flight.aircraft_swap_volume_m3
+
+    return FlightTable(
+        flight_ids=[flight.flight_id for flight in ordered],
+        departure_ts=departure_ts,
+        arrival_ts=arrival_ts,
+        weight_capacity=weight_capacity,
+        volume_capacity=volume_capacity,
+        swap_extra_weight=swap_weight - weight_capacity,
+        swap_extra_volume=swap_volume - volume_capacity,
+        airport_codes=airport_codes,
+        origin_code=origin_code,
+        destination_code=destination_code,
+    )
+
+
+@dataclass
+class _FlightArrays:
+    """A flight table together with the spare capacity left by one GA result."""
+
+    table: FlightTable
+    weight_available: np.ndarray
+    volume_available: np.ndarray
+
+
+def _apply_loads(table: FlightTable, result: GAResult) -> _FlightArrays:
+    """Subtract the loads selected in ``result`` from the table capacities."""
+    count = len(table.flight_ids)
+    weight_loaded = np.zeros(count, dtype=np.float64)
+    volume_loaded = np.zeros(count, dtype=np.float64)
+    for idx, flight_id in enumerate(table.flight_ids):
+        # The knapsack already totals each selection, so reuse its aggregates
+        flight_load = result.flight_loads.get(flight_id)
+        if flight_load:
+            weight_loaded[idx] = flight_load.total_weight
+            volume_loaded[idx] = flight_load.total_volume
+
+    return _FlightArrays(
+        table=table,
+        weight_available=table.weight_capacity - weight_loaded,
+        volume_available=table.volume_capacity - volume_loaded,
+    )
+
+
+@dataclass
+class _FlightScan:
+    """Per-cargo aggregates gathered from one pass over the flight arrays."""
+
+    available_count: int
+    earliest_arrival_ts: Optional[float]
+    upgrade_count: int
+    next_departure_ts: Optional[float]
+
+
+# Cargo rows per broadcast pass in _scan_flights; bounds each cargo x flight
+# matrix to this many rows however many cargo need recommendations
+_SCAN_BLOCK_ROWS = 512
+
+
+def _scan_flights(cargos: List[Cargo], flight_arrays: _FlightArrays) -> List[_FlightScan]:
+    """Collect everything the flight-based options need for a batch of cargo.
+
+    Every cargo is independent, so the batch is evaluated as cargo x flight
+    matrices in broadcast passes over fixed blocks of cargo rows, rather
+    than one scan per cargo or one matrix over every cargo at once.
+    """
+    scans: List[_FlightScan] = []
+    for start in range(0, len(cargos), _SCAN_BLOCK_ROWS):
+        scans.extend(_scan_flight_block(cargos[start : start + _SCAN_BLOCK_ROWS], flight_arrays))
+    return scans
+
+
+def _scan_flight_block(cargos: List[Cargo], flight_arrays: _FlightArrays) -> List[_FlightScan]:
+    """One broadcast pass of _scan_flights over a block of cargo rows."""
+    table = flight_arrays.table
+    count = len(cargos)
+    if not len(table.flight_ids):
+        return [_FlightScan(0, None, 0, None) for _ in range(count)]
+
+    weight = np.fromiter((c.weight_kg for c in cargos), dtype=np.float64, count=count)[:, None]
+    volume = np.fromiter((c.volume_m3 for c in cargos), dtype=np.float64, count=count)[:, None]
+    ready_ts = np.fromiter((c.ready_time.timestamp() for c in cargos), dtype=np.float64, count=count)
+    due_ts = np.fromiter((c.due_by.timestamp() for c in cargos), dtype=np.float64, count=count)
+    high_priority = np.fromiter((c.priority == "High" for c in cargos), dtype=bool, count=count)
+    origin = table.encode_airports((c.origin for c in cargos), count)[:, None]
+    destination = table.encode_airports((c.destination for c in cargos), count)[:, None]
+
+    departure_ts = table.departure_ts
+    arriving = table.destination_code == destination
+    lane = (table.origin_code == origin) | arriving
+
+    # Alternative routing: flights after ready time with enough spare capacity
+    available = (
+        (departure_ts >= ready_ts[:, None])
+        & (flight_arrays.weight_available >= weight)
+        & (flight_arrays.volume_available >= volume)
+    )
+    available_count = np.count_nonzero(available, axis=1)
+    earliest_arrival = np.min(
+        np.where(available & arriving, table.arrival_ts, np.inf), axis=1
+    )
+
+    # Capacity upgrade: lane flights whose aircraft swap frees enough space,
+    # only offered for high priority cargo
+    upgrade_count = np.where(
+        high_priority,
+        np.count_nonzero(
+            lane
+            & (table.swap_extra_weight >= weight)
+            & (table.swap_extra_volume >= volume),
+            axis=1,
+        ),
+        0,
+    )
+
+    # Delay acceptance: first lane flight departing after the due date. Rows
+    # are sorted by departure, so bisect to each due date and take the first hit.
+    after_due = np.searchsorted(departure_ts, due_ts, side="right")
+    future_lane = lane & (np.arange(departure_ts.size) >= after_due[:, None])
+    next_idx = np.argmax(future_lane, axis=1)
+    has_next = future_lane[np.arange(count), next_idx]
+
+    return [
+        _FlightScan(
+            available_count=int(available_count[row]),
+            earliest_arrival_ts=(
+                float(earliest_arrival[row]) if np.isfinite(earliest_arrival[row]) else None
+            ),
+            upgrade_count=int(upgrade_count[row]),
+            next_departure_ts=float(departure_ts[next_idx[row]]) if has_next[row] else None,
+        )
+        for row in range(count)
+    ]
+
+
+PRIORITY_CODES = {"Low": 0, "Medium": 1, "High": 2}
+
+
+@dataclass
+class _OptionEconomics:
+    """Flight-independent option economics for a batch of cargo, one entry per cargo."""
+
+    charter_cost: np.ndarray
+    charter_recovery: np.ndarray
+    charter_feasibility: np.ndarray
+    upgrade_cost: np.ndarray
+    delay_compensation: np.ndarray
+    negotiation_recovery: np.ndarray
+    negotiation_feasibility: np.ndarray
+    partial_share: np.ndarray
+
+
+def _score_option_economics(cargos: List[Cargo], seed: Optional[int] = 42) -> _OptionEconomics:
+    """Evaluate the cost model of every option for all cargo in one vectorised pass."""
+    count = len(cargos)
+    weight = np.fromiter((c.weight_kg for c in cargos), dtype=np.float64, count=count)
+    volume = np.fromiter((c.volume_m3 for c in cargos), dtype=np.float64, count=count)
+    revenue = np.fromiter((c.revenue_inr for c in cargos), dtype=np.float64, count=count)
+    priority = np.fromiter(
+        (PRIORITY_CODES.get(c.priority, 0) for c in cargos), dtype=np.int8, count=count
+    )
+
+    # Charter: base cost plus cost per ton and per cubic meter; recovery is
+    # revenue net of the charter, feasibility the recovery/cost ratio
+    charter_cost = 800000 + weight / 1000 * 15000 + volume * 8000
+    charter_recovery = np.maximum(0, revenue - charter_cost)
+    charter_feasibility = np.minimum(1.0, charter_recovery / charter_cost)
+
+    # Capacity upgrade: base aircraft swap cost plus additional operational cost
+    upgrade_cost = 150000 + weight * 8
+
+    # Delay acceptance: customer compensation of max 10% or ₹50k
+    delay_compensation = np.minimum(revenue * 0.1, 50000)
+
+    # Negotiation: max 15% or ₹100k rate increase plus flexible timing bonus,
+    # minus staff time and effort
+    negotiation_recovery = revenue + np.minimum(revenue * 0.15, 100000) + 25000 - 5000
+    negotiation_feasibility = np.where(priority >= PRIORITY_CODES["Medium"], 0.6, 0.4)
+
+    # Partial shipment: assume we can ship 60-80% immediately, drawn once per batch
+    partial_share = np.random.default_rng(seed).uniform(0.6, 0.8, count)
+
+    return _OptionEconomics(
+        charter_cost=charter_cost,
+        charter_recovery=charter_recovery,
+        charter_feasibility=charter_feasibility,
+        upgrade_cost=upgrade_cost,
+        delay_compensation=delay_compensation,
+        negotiation_recovery=negotiation_recovery,
+        negotiation_feasibility=negotiation_feasibility,
+        partial_share=partial_share,
+    )
+
+
 def generate_ai_recommendations(
     result: GAResult,
     cargo_map: Dict[str, Cargo],
     flights: Dict[str, Flight],
+    seed: Optional[int] = 42,
+    flight_table: Optional[FlightTable] = None,
 ) -> List[CargoRecommendation]:
-    """Generate AI-powered recommendations for denied and rolled cargo."""
-    recommendations = []
-    
-    # Analyze denied and rolled cargo
-    for cargo_id, assignment in result.assignments.items():
-        if assignment.status in ["denied", "rolled"]:
-            cargo = cargo_map[cargo_id]
-            recommendation = _generate_cargo_recommendation(
-                cargo, assignment, flights, result
-            )
-            if recommendation:
-                recommendations.append(recommendation)
+    """Generate AI-powered recommendations for denied and rolled cargo.
+
+    ``flight_table`` may be passed when the caller has already built one for
+    ``flights``; otherwise it is built here.
+    """
+    recommendations: List[CargoRecommendation] = []
+
+    # Analyze denied and rolled cargo; nothing to do on a clean plan
+    problem_ids = result.problem_cargo_ids
+    if not problem_ids:
+        return recommendations
+
+    problem_cargo = [
+        (cargo_map[cargo_id], result.assignments[cargo_id]) for cargo_id in problem_ids
+    ]
+
+    if flight_table is None:
+        flight_table = build_flight_table(flights)
+    problem_cargos = [cargo for cargo, _ in problem_cargo]
+    scans = _scan_flights(problem_cargos, _apply_loads(flight_table, result))
+    economics = _score_option_economics(problem_cargos, seed)
+
+    for idx, (cargo, assignment) in enumerate(problem_cargo):
+        recommendation = _generate_cargo_recommendation(
+            cargo, assignment, scans[idx], economics, idx
+        )
+        if recommendation:
+            recommendations.append(recommendation)
     
     return recommendations
 
 
+_IMPACT_KEY = itemgetter(0)
+_FEASIBILITY_KEY = itemgetter(1)
+
+
 def _generate_cargo_recommendation(
     cargo: Cargo,
     assignment: CargoAssignment,
-    flights: Dict[str, Flight],
-    result: GAResult,
+    scan: _FlightScan,
+    economics: _OptionEconomics,
+    idx: int,
 ) -> Optional[CargoRecommendation]:
     """Generate specific recommendations for a single cargo item."""
 
     denial_reason = assignment.reason or "Capacity constraints"
 
-    options = []
+    options: List[RecommendationOption] = []
 
     # Option 1: Charter Flight
     if cargo.priority in ["High", "Medium"] and cargo.revenue_inr > 500000:
-        charter_option = _generate_charter_option(cargo, flights)
+        charter_option = _generate_charter_option(cargo, economics, idx)
         if charter_option:
             options.append(charter_option)
 
     # Option 2: Alternative Routing
-    alt_routing_option = _generate_alternative_routing_option(cargo, flights, result)
+    alt_routing_option = _generate_alternative_routing_option(cargo, scan)
     if alt_routing_option:
         options.append(alt_routing_option)
 
     # Option 3: Capacity Upgrade
     if cargo.priority == "High":
-        capacity_option = _generate_capacity_upgrade_option(cargo, flights, result)
+        capacity_option = _generate_capacity_upgrade_option(cargo, scan, economics, idx)
         if capacity_option:
             options.append(capacity_option)
 
     # Option 4: Delay Acceptance
-    delay_option = _generate_delay_acceptance_option(cargo, flights)
+    delay_option = _generate_delay_acceptance_option(cargo, scan, economics, idx)
     if delay_option:
         options.append(delay_option)
 
     # Option 5: Partial Shipment
     if cargo.weight_kg > 5000 or cargo.volume_m3 > 25:
-        partial_option = _generate_partial_shipment_option(cargo, flights)
+        partial_option = _generate_partial_shipment_option(cargo, economics, idx)
         if partial_option:
             options.append(partial_option)
 
     # Option 6: Customer Negotiation
-    negotiation_option = _generate_customer_negotiation_option(cargo, denial_reason)
+    negotiation_option = _generate_customer_negotiation_option(
+        cargo, denial_reason, economics, idx
+    )
     if negotiation_option:
         options.append(negotiation_option)
     
     if not options:
         return None
     
-    # Select recommended option based on feasibility and impact
-    recommended = max(options, key=lambda x: x.feasibility_score * x.estimated_revenue_recovery)
-    
+    # Select recommended option based on feasibility and impact; score each
+    # option once and reuse the keys for both the argmax and the ordering.
+    scored = [
+        (option.feasibility_score * option.estimated_revenue_recovery, option.feasibility_score, option)
+        for option in options
+    ]
+    recommended = max(scored, key=_IMPACT_KEY)[2]
+    scored.sort(key=_FEASIBILITY_KEY, reverse=True)
+
     return CargoRecommendation(
         cargo_id=cargo.cargo_id,
         cargo_priority=cargo.priority,
         denial_reason=denial_reason,
         revenue_at_risk=cargo.revenue_inr,
-        options=sorted(options, key=lambda x: x.feasibility_score, reverse=True),
+        options=[entry[2] for entry in scored],
         recommended_option=recommended,
     )
 
 
-def _generate_charter_option(cargo: Cargo, flights: Dict[str, Flight]) -> Optional[RecommendationOption]:
+def _generate_charter_option(
+    cargo: Cargo, economics: _OptionEconomics, idx: int
+) -> Optional[RecommendationOption]:
     """Generate charter flight recommendation."""
-    # Estimate charter cost based on cargo size and route
-    base_charter_cost = 800000  # Base cost for charter
-    weight_factor = cargo.weight_kg / 1000 * 15000  # Cost per ton
-    volume_factor = cargo.volume_m3 * 8000  # Cost per cubic meter
-    
-    estimated_cost = base_charter_cost + weight_factor + volume_factor
-    
-    # Revenue recovery would be full revenue minus charter cost
-    revenue_recovery = max(0, cargo.revenue_inr - estimated_cost)
-    
-    # Feasibility depends on revenue vs cost ratio
-    feasibility = min(1.0, revenue_recovery / estimated_cost) if estimated_cost > 0 else 0
+    # Charter cost, net recovery and feasibility are scored for the whole batch
+    estimated_cost = float(economics.charter_cost[idx])
+    revenue_recovery = float(economics.charter_recovery[idx])
+    feasibility = float(economics.charter_feasibility[idx])
     
     if feasibility < 0.1:  # Not feasible if recovery is too low
         return None
@@ -156,29 +426,12 @@ def _generate_charter_option(cargo: Cargo, flights: Dict[str, Flight]) -> Option
 
 
 def _generate_alternative_routing_option(
-    cargo: Cargo, flights: Dict[str, Flight], result: GAResult
+    cargo: Cargo, scan: _FlightScan
 ) -> Optional[RecommendationOption]:
     """Generate alternative routing recommendation."""
     
-    # Analyze available flights for alternative routes
-    available_flights = []
-    for flight in flights.values():
-        if flight.departure_time >= cargo.ready_time:
-            # Check if flight has available capacity
-            flight_load = result.flight_loads.get(flight.flight_id)
-            if flight_load:
-                used_weight = sum(c.weight_kg for c in flight_load.selected)
-                used_volume = sum(c.volume_m3 for c in flight_load.selected)
-                weight_available = flight.weight_capacity_kg - used_weight
-                volume_available = flight.volume_capacity_m3 - used_volume
-            else:
-                weight_available = flight.weight_capacity_kg
-                volume_available = flight.volume_capacity_m3
-            
-            if weight_available >= cargo.weight_kg and volume_available >= cargo.volume_m3:
-                available_flights.append(flight)
-    
-    if not available_flights:
+    available_count = scan.available_count
+    if not available_count:
         return None
     
     # Estimate additional costs for alternative routing
@@ -186,18 +439,19 @@ def _generate_alternative_routing_option(
     delay_penalty = 0
     
     # Check if alternative routing would cause delays
-    earliest_arrival = min(f.arrival_time for f in available_flights if f.destination == cargo.destination)
-    if earliest_arrival > cargo.due_by:
-        delay_hours = (earliest_arrival - cargo.due_by).total_seconds() / 3600
-        delay_penalty = delay_hours * cargo.sla_penalty_per_hour
+    if scan.earliest_arrival_ts is not None:
+        delay_seconds = scan.earliest_arrival_ts - cargo.due_by.timestamp()
+        if delay_seconds > 0:
+            delay_hours = delay_seconds / 3600
+            delay_penalty = delay_hours * cargo.sla_penalty_per_hour
     
     total_cost = additional_cost + delay_penalty
     revenue_recovery = cargo.revenue_inr - total_cost
-    feasibility = 0.8 if len(available_flights) > 2 else 0.6
+    feasibility = 0.8 if available_count > 2 else 0.6
     
     return RecommendationOption(
         option_type="alternative_routing",
-        description=f"Route via alternative flights with {len(available_flights)} options available",
+        description=f"Route via alternative flights with {available_count} options available",
         impact_description=f"Potential delivery with ₹{revenue_recovery:,.0f} net recovery",
         estimated_cost=total_cost,
         estimated_revenue_recovery=revenue_recovery,
@@ -214,35 +468,21 @@ def _generate_alternative_routing_option(
 
 
 def _generate_capacity_upgrade_option(
-    cargo: Cargo, flights: Dict[str, Flight], result: GAResult
+    cargo: Cargo, scan: _FlightScan, economics: _OptionEconomics, idx: int
 ) -> Optional[RecommendationOption]:
     """Generate aircraft capacity upgrade recommendation."""
     
-    # Find flights that could be upgraded
-    upgrade_candidates = []
-    for flight_id, flight in flights.items():
-        if flight.origin == cargo.origin or flight.destination == cargo.destination:
-            # Check if aircraft swap would help
-            additional_weight = flight.aircraft_swap_capacity_kg - flight.weight_capacity_kg
-            additional_volume = flight.aircraft_swap_volume_m3 - flight.volume_capacity_m3
-            
-            if additional_weight >= cargo.weight_kg and additional_volume >= cargo.volume_m3:
-                upgrade_candidates.append(flight)
-    
-    if not upgrade_candidates:
+    upgrade_count = scan.upgrade_count
+    if not upgrade_count:
         return None
     
-    # Estimate upgrade costs
-    upgrade_cost = 150000  # Base aircraft swap cost
-    operational_cost = cargo.weight_kg * 8  # Additional operational cost
-    
-    total_cost = upgrade_cost + operational_cost
+    total_cost = float(economics.upgrade_cost[idx])
     revenue_recovery = cargo.revenue_inr - total_cost
     feasibility = 0.7  # Moderate feasibility due to operational complexity
     
     return RecommendationOption(
         option_type="capacity_upgrade",
-        description=f"Upgrade aircraft capacity on {len(upgrade_candidates)} potential flights",
+        description=f"Upgrade aircraft capacity on {upgrade_count} potential flights",
         impact_description=f"Create additional capacity with ₹{revenue_recovery:,.0f} net recovery",
         estimated_cost=total_cost,
         estimated_revenue_recovery=revenue_recovery,
@@ -259,26 +499,19 @@ def _generate_capacity_upgrade_option(
     )
 
 
-def _generate_delay_acceptance_option(cargo: Cargo, flights: Dict[str, Flight]) -> Optional[RecommendationOption]:
+def _generate_delay_acceptance_option(
+    cargo: Cargo, scan: _FlightScan, economics: _OptionEconomics, idx: int
+) -> Optional[RecommendationOption]:
     """Generate delay acceptance recommendation."""
     
-    # Find next available flights after due date
-    future_flights = [
-        f for f in flights.values() 
-        if f.departure_time > cargo.due_by and 
-        (f.origin == cargo.origin or f.destination == cargo.destination)
-    ]
-    
-    if not future_flights:
+    if scan.next_departure_ts is None:
         return None
     
-    # Calculate delay penalty
-    next_flight = min(future_flights, key=lambda f: f.departure_time)
-    delay_hours = (next_flight.departure_time - cargo.due_by).total_seconds() / 3600
+    # Calculate delay penalty against the next lane flight after the due date
+    delay_hours = (scan.next_departure_ts - cargo.due_by.timestamp()) / 3600
     delay_penalty = delay_hours * cargo.sla_penalty_per_hour
     
-    # Estimate customer compensation
-    customer_compensation = min(cargo.revenue_inr * 0.1, 50000)  # Max 10% or ₹50k
+    customer_compensation = float(economics.delay_compensation[idx])
     
     total_cost = delay_penalty + customer_compensation
     revenue_recovery = cargo.revenue_inr - total_cost
@@ -303,15 +536,17 @@ def _generate_delay_acceptance_option(cargo: Cargo, flights: Dict[str, Flight])
     )
 
 
-def _generate_partial_shipment_option(cargo: Cargo, flights: Dict[str, Flight]) -> Optional[RecommendationOption]:
+def _generate_partial_shipment_option(
+    cargo: Cargo, economics: _OptionEconomics, idx: int
+) -> Optional[RecommendationOption]:
     """Generate partial shipment recommendation."""
     
     # Only applicable for large cargo
     if cargo.weight_kg < 5000 and cargo.volume_m3 < 25:
         return None
     
-    # Assume we can ship 60-80% immediately
-    partial_percentage = random.uniform(0.6, 0.8)
+    # Share shipped immediately, pre-drawn for the whole batch
+    partial_percentage = float(economics.partial_share[idx])
     immediate_revenue = cargo.revenue_inr * partial_percentage
     
     # Remaining portion ships later with delay penalty
@@ -345,22 +580,23 @@ def _generate_partial_shipment_option(cargo: Cargo, flights: Dict[str, Flight])
     )
 
 
-def _generate_customer_negotiation_option(cargo: Cargo, denial_reason: str) -> Optional[RecommendationOption]:
+# Denial reasons that point at our own capacity, where negotiation does not help
+_CAPACITY_DENIAL_TOKENS = ("capacity", "roll-over")
+
+
+def _generate_customer_negotiation_option(
+    cargo: Cargo, denial_reason: str, economics: _OptionEconomics, idx: int
+) -> Optional[RecommendationOption]:
     """Generate customer negotiation recommendation."""
 
     # Don't recommend negotiation if denial was due to our capacity constraints
-    if denial_reason and ("capacity" in denial_reason.lower() or "roll-over" in denial_reason.lower()):
+    reason = denial_reason.lower() if denial_reason else ""
+    if any(token in reason for token in _CAPACITY_DENIAL_TOKENS):
         return None
 
-    # Estimate potential outcomes
-    rate_increase_potential = min(cargo.revenue_inr * 0.15, 100000)  # Max 15% or ₹100k
-    flexibility_bonus = 25000  # Bonus for flexible timing
-    
-    # Negotiation costs
     negotiation_cost = 5000  # Staff time and effort
-    
-    revenue_recovery = cargo.revenue_inr + rate_increase_potential + flexibility_bonus - negotiation_cost
-    feasibility = 0.6 if cargo.priority in ["High", "Medium"] else 0.4
+    revenue_recovery = float(economics.negotiation_recovery[idx])
+    feasibility = float(economics.negotiation_feasibility[idx])
     
     return RecommendationOption(
         option_type="customer_negotiation",
@@ -381,10 +617,30 @@ def _generate_customer_negotiation_option(cargo: Cargo, denial_reason: str) -> O
     )
 
 
-def format_recommendations_for_ui(recommendations: List[CargoRecommendation]) -> Dict:
+# UI key -> RecommendationOption attribute, fetched in one attrgetter call
+_OPTION_UI_FIELDS = {
+    "type": "option_type",
+    "description": "description",
+    "impact": "impact_description",
+    "cost": "estimated_cost",
+    "recovery": "estimated_revenue_recovery",
+    "feasibility": "feasibility_score",
+    "time_hours": "implementation_time_hours",
+    "risk": "risk_level",
+    "actions": "required_actions",
+}
+_OPTION_UI_KEYS = tuple(_OPTION_UI_FIELDS)
+_option_ui_values = attrgetter(*_OPTION_UI_FIELDS.values())
+
+
+def _format_option(option: RecommendationOption) -> Dict[str, Any]:
+    return dict(zip(_OPTION_UI_KEYS, _option_ui_values(option)))
+
+
+def format_recommendations_for_ui(recommendations: List[CargoRecommendation]) -> Dict[str, Any]:
     """Format recommendations for frontend consumption."""
     
-    formatted = {
+    formatted: Dict[str, Any] = {
         "summary": {
             "total_cargo_at_risk": len(recommendations),
             "total_revenue_at_risk": sum(r.revenue_at_risk for r in recommendations),
@@ -395,38 +651,18 @@ def format_recommendations_for_ui(recommendations: List[CargoRecommendation]) ->
         "recommendations": []
     }
     
+    formatted_recs: List[Dict[str, Any]] = formatted["recommendations"]
     for rec in recommendations:
         formatted_rec = {
             "cargo_id": rec.cargo_id,
             "priority": rec.cargo_priority,
             "denial_reason": rec.denial_reason,
             "revenue_at_risk": rec.revenue_at_risk,
-            "recommended_option": {
-                "type": rec.recommended_option.option_type,
-                "description": rec.recommended_option.description,
-                "impact": rec.recommended_option.impact_description,
-                "cost": rec.recommended_option.estimated_cost,
-                "recovery": rec.recommended_option.estimated_revenue_recovery,
-                "feasibility": rec.recommended_option.feasibility_score,
-                "time_hours": rec.recommended_option.implementation_time_hours,
-                "risk": rec.recommended_option.risk_level,
-                "actions": rec.recommended_option.required_actions
-            } if rec.recommended_option else None,
-            "all_options": [
-                {
-                    "type": opt.option_type,
-                    "description": opt.description,
-                    "impact": opt.impact_description,
-                    "cost": opt.estimated_cost,
-                    "recovery": opt.estimated_revenue_recovery,
-                    "feasibility": opt.feasibility_score,
-                    "time_hours": opt.implementation_time_hours,
-                    "risk": opt.risk_level,
-                    "actions": opt.required_actions
-                }
-                for opt in rec.options
-            ]
+            "recommended_option": (
+                _format_option(rec.recommended_option) if rec.recommended_option else None
+            ),
+            "all_options": [_format_option(opt) for opt in rec.options],
         }
-        formatted["recommendations"].append(formatted_rec)
+        formatted_recs.append(formatted_rec)
     
-    return formatted
\ No newline at end of file
+    return formatted
@@ -1,14 +1,263 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated, Any, Dict, Iterator, List, Literal, Mapping, Optional, Set, Tuple
+
+import orjson
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
 
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+try:
+    from .disruptions import DisruptionEvent
+    from .load_data import (
+        DataValidationError,
+        append_cargo_rows,
+        load_cargo_ids,
+        parse_iso_datetime,
+    )
+    from .pipeline import PipelineConfig, result_to_payload, run_pipeline
+except ImportError:
+    from disruptions import DisruptionEvent
+    from load_data import (
+        DataValidationError,
+        append_cargo_rows,
+        load_cargo_ids,
+        parse_iso_datetime,
+    )
+    from pipeline import PipelineConfig, result_to_payload, run_pipeline
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = PROJECT_ROOT / "data"
+OUTPUT_DIR = PROJECT_ROOT / "outputs"
+
+
+class _CargoAppendQueue:
+    """Group-commits cargo CSV appends off the event loop.
+
+    Requests await their row being durable, but rows queued while a batch is
+    being written share the next write and fsync instead of paying one each.
+    """
+
+    def __init__(self, max_batch: int = 256) -> None:
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue[Tuple[Path, Mapping[str, object], asyncio.Future[None]]] | None = None
+
+    async def append(self, path: Path, row: Mapping[str, object]) -> None:
+        if self._queue is None:
+            raise RuntimeError("Cargo append queue is not running")
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put((path, row, done))
+        await done
+
+    async def run(self) -> None:
+        self._queue = asyncio.Queue()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            by_path: Dict[Path, List[Tuple[Mapping[str, object], asyncio.Future[None]]]] = {}
+            for path, row, done in batch:
+                by_path.setdefault(path, []).append((row, done))
+
+            for path, entries in by_path.items():
+                try:
+                    await asyncio.to_thread(append_cargo_rows, path, [row for row, _ in entries])
+                except Exception as exc:  # surface the failure to every waiting request
+                    for _, done in entries:
+                        if not done.done():
+                            done.set_exception(exc)
+                else:
+                    for _, done in entries:
+                        if not done.done():
+                            done.set_result(None)
 
-app = FastAPI(title="Cargo Route Planner API", version="0.1.0")
+
+cargo_appends = _CargoAppendQueue()
+
+
+@asynccontextmanager
+async def _lifespan(_: FastAPI):
+    writer = asyncio.create_task(cargo_appends.run())
+    try:
+        yield
+    finally:
+        writer.cancel()
+
+
+app = FastAPI(
+    title="Cargo Route Planner API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
+
+# Explicit origins for the Vite dev server and a CRA-style dev port; a wildcard
+# cannot be combined with credentials and forces per-request origin handling.
+ALLOWED_ORIGINS = [
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+    "http://localhost:3000",
+]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
+
+
+class PlanRequest(BaseModel):
+    # Pydantic v2 validates straight into the pipeline dataclass, so events
+    # need no intermediate model or re-construction per request.
+    events: List[DisruptionEvent] = Field(default_factory=list)
+    seed: Optional[int] = 42
+    write_outputs: bool = False
+    skip_baseline: bool = False
+    data_dir: Optional[str] = None
+    output_dir: Optional[str] = None
+
+
+# Whitespace is stripped before the length checks, so a blank id is refused
+# here rather than written to cargo.csv, where load_cargo would reject it
+CargoId = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+AirportCode = Annotated[
+    str, StringConstraints(strip_whitespace=True, to_upper=True, min_length=3, max_length=3)
+]
+
+
+class CargoInputModel(BaseModel):
+    cargo_id: CargoId
+    origin: AirportCode
+    destination: AirportCode
+    weight_kg: float = Field(gt=0)
+    volume_m3: float = Field(gt=0)
+    revenue_inr: float = Field(gt=0)
+    priority: Literal["Low", "Medium", "High"]
+    perishable: bool = False
+    max_transit_hours: float = Field(gt=0)
+    ready_time: str
+    due_by: str
+    handling_cost_per_kg: float = Field(gt=0)
+    sla_penalty_per_hour: float = Field(gt=0)
+
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _iter_payload_json(payload: Mapping[str, Any]) -> Iterator[bytes]:
+    """Encode ``payload`` as a JSON object one top-level section at a time.
+
+    The summary goes out first and no single buffer for the whole plan is
+    ever built, which keeps the memory peak down on large plans.
+    """
+    separator = b"{"
+    for key, value in payload.items():
+        yield separator + orjson.dumps(key) + b":" + orjson.dumps(value, option=_ORJSON_OPTIONS)
+        separator = b","
+    yield b"}" if separator == b"," else b"{}"
+
+
+def _plan(config: PipelineConfig) -> StreamingResponse:
+    try:
+        result = run_pipeline(config)
+    except (DataValidationError, FileNotFoundError) as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return StreamingResponse(
+        _iter_payload_json(result_to_payload(result)), media_type="application/json"
+    )
+
+
+@app.get("/health")
+def health() -> Dict[str, str]:
+    return {"status": "ok"}
+
+
+@app.post("/plan/run")
+def run_plan(request: PlanRequest) -> StreamingResponse:
+    config = PipelineConfig(
+        data_dir=Path(request.data_dir) if request.data_dir else DATA_DIR,
+        output_dir=Path(request.output_dir) if request.output_dir else OUTPUT_DIR,
+        events=request.events,
+        seed=request.seed,
+        write_outputs=request.write_outputs,
+        skip_baseline=request.skip_baseline,
+    )
+    return _plan(config)
+
+
+@app.post("/plan/sample")
+def run_sample_plan() -> StreamingResponse:
+    return _plan(PipelineConfig(data_dir=DATA_DIR, output_dir=OUTPUT_DIR, write_outputs=False))
+
+
+def parse_datetime(dt_str: str, field: str = "datetime") -> datetime:
+    """Parse an ISO 8601 timestamp from the client, defaulting to Asia/Calcutta (+05:30)."""
+    try:
+        return parse_iso_datetime(dt_str, field)
+    except DataValidationError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+# Cargo ids accepted but still waiting on the append queue, so a concurrent
+# request with the same id is rejected before either row reaches the file.
+_pending_cargo_ids: Set[str] = set()
+
+
+@app.post("/cargo/add")
+async def add_cargo(cargo: CargoInputModel) -> Dict[str, str]:
+    cargo_id = cargo.cargo_id
+    origin = cargo.origin
+    destination = cargo.destination
+    if origin == destination:
+        raise HTTPException(status_code=400, detail="Origin and destination must be different")
+
+    ready_time = parse_datetime(cargo.ready_time, "ready_time")
+    due_by = parse_datetime(cargo.due_by, "due_by")
+    if due_by <= ready_time:
+        raise HTTPException(status_code=400, detail="due_by must be after ready_time")
+
+    cargo_path = DATA_DIR / "cargo.csv"
+    try:
+        existing_ids = await asyncio.to_thread(load_cargo_ids, cargo_path)
+    except (OSError, DataValidationError, ValueError) as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to read cargo data: {exc}") from exc
+    # Pending ids are checked after the read, which yields to other requests
+    if cargo_id in _pending_cargo_ids or cargo_id in existing_ids:
+        raise HTTPException(status_code=400, detail=f"Cargo ID {cargo_id} already exists")
+
+    row = {
+        "cargo_id": cargo_id,
+        "origin": origin,
+        "destination": destination,
+        "weight_kg": cargo.weight_kg,
+        "volume_m3": cargo.volume_m3,
+        "revenue_inr": cargo.revenue_inr,
+        "priority": cargo.priority,
+        "perishable": "true" if cargo.perishable else "false",
+        "max_transit_hours": cargo.max_transit_hours,
+        "ready_time": ready_time.isoformat(),
+        "due_by": due_by.isoformat(),
+        "handling_cost_per_kg": cargo.handling_cost_per_kg,
+        "sla_penalty_per_hour": cargo.sla_penalty_per_hour,
+    }
+    _pending_cargo_ids.add(cargo_id)
+    try:
+        await cargo_appends.append(cargo_path, row)
+    except (OSError, DataValidationError, ValueError) as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to save cargo: {exc}") from exc
+    finally:
+        _pending_cargo_ids.discard(cargo_id)
+
+    return {
+        "message": f"Cargo {cargo_id} added successfully",
+        "cargo_id": cargo_id,
+        "status": "success",
+    }
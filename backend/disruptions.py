@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
-from typing import Dict, Iterable, List, Literal, Optional, Tuple
+from sys import intern
+from typing import Callable, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
+
+import numpy as np
 
 try:
     # When running as part of the FastAPI app
-    from .ga_route import GAResult, run_ga
+    from .ga_route import DEFAULT_MAX_ROUTES_PER_CARGO, GAResult, run_ga
     from .load_data import Cargo, ConnectionRule, Flight
 except ImportError:
     # When running as standalone scripts
-    from ga_route import GAResult, run_ga
+    from ga_route import DEFAULT_MAX_ROUTES_PER_CARGO, GAResult, run_ga
     from load_data import Cargo, ConnectionRule, Flight
 
 
@@ -18,7 +24,7 @@ AlertSeverity = Literal["info", "warning", "critical"]
 DisruptionType = Literal["delay", "cancel", "swap"]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class DisruptionEvent:
     event_type: DisruptionType
     flight_id: str
@@ -27,224 +33,412 @@ class DisruptionEvent:
     new_volume_capacity_m3: Optional[float] = None
 
 
-@dataclass(frozen=True)
+class LazyMessage:
+    """Alert text rendered by ``render(*args)`` on first ``str()``, not at construction.
+
+    Consumers that filter alerts before display never pay for formatting the
+    ones they drop.
+    """
+
+    __slots__ = ("_render", "_args", "_text")
+
+    def __init__(self, render: Callable[..., str], *args: object) -> None:
+        self._render = render
+        self._args = args
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._render(*self._args)
+        return self._text
+
+    def __repr__(self) -> str:
+        return repr(str(self))
+
+    # Equal to any message with the same text, lazy or not
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (str, LazyMessage)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+
+@dataclass(slots=True)
 class Alert:
     alert_type: str
     severity: AlertSeverity
-    message: str
+    message: str | LazyMessage
     cargo_id: Optional[str] = None
     flight_id: Optional[str] = None
     status: Optional[str] = None
     margin_delta: Optional[float] = None
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
+    def __hash__(self) -> int:
+        # Alerts are not mutated once raised, so the identity hash used for
+        # dedup is computed on first use and kept; computing it eagerly would
+        # force every lazy message to render.
+        if self._hash is None:
+            self._hash = hash((self.alert_type, self.flight_id, self.cargo_id, self.message))
+        return self._hash
 
-def _adjust_flights(
+
+# Wording used when an event names a flight that is not in the schedule
+_UNKNOWN_FLIGHT_LABELS: Dict[str, str] = {
+    "delay": "Delay",
+    "cancel": "Cancellation",
+    "swap": "Aircraft swap",
+}
+
+
+def _flight_alert(alert_type: str, severity: AlertSeverity, message: str, flight_id: str) -> Alert:
+    # Positional construction; flight alerts never carry cargo fields
+    return Alert(alert_type, severity, message, None, flight_id)
+
+
+class _ScheduleChanges:
+    """Pending edits to a flight schedule.
+
+    The schedule is copied on the first structural change only, and delays are
+    summed per flight and shifted onto the schedule once in ``finish``.
+    """
+
+    __slots__ = ("_base", "flights", "delay_minutes")
+
+    def __init__(self, base: Dict[str, Flight]) -> None:
+        self._base = base
+        self.flights = base
+        self.delay_minutes: Dict[str, int] = {}
+
+    def writable(self) -> Dict[str, Flight]:
+        if self.flights is self._base:
+            self.flights = dict(self._base)
+        return self.flights
+
+    def finish(self) -> Dict[str, Flight]:
+        if self.delay_minutes:
+            flights = self.writable()
+            for flight_id, minutes in self.delay_minutes.items():
+                flights[flight_id] = flights[flight_id].shifted(timedelta(minutes=minutes))
+        return self.flights
+
+
+def _apply_delay(
+    event: DisruptionEvent, flight: Flight, changes: _ScheduleChanges, alerts: List[Alert]
+) -> None:
+    if event.delay_minutes <= 0:
+        return
+    delays = changes.delay_minutes
+    delays[flight.flight_id] = delays.get(flight.flight_id, 0) + event.delay_minutes
+    alerts.append(
+        _flight_alert(
+            "delay",
+            "info",
+            f"Flight {flight.flight_id} delayed by {event.delay_minutes} minutes",
+            flight.flight_id,
+        )
+    )
+
+
+def _apply_cancel(
+    event: DisruptionEvent, flight: Flight, changes: _ScheduleChanges, alerts: List[Alert]
+) -> None:
+    changes.writable().pop(flight.flight_id)
+    changes.delay_minutes.pop(flight.flight_id, None)
+    alerts.append(
+        _flight_alert("cancel", "critical", f"Flight {flight.flight_id} cancelled", flight.flight_id)
+    )
+
+
+def _apply_swap(
+    event: DisruptionEvent, flight: Flight, changes: _ScheduleChanges, alerts: List[Alert]
+) -> None:
+    # Capacity and timing are independent, so a pending delay still applies
+    new_weight = event.new_weight_capacity_kg or flight.weight_capacity_kg
+    new_volume = event.new_volume_capacity_m3 or flight.volume_capacity_m3
+    changes.writable()[flight.flight_id] = flight.with_capacity(new_weight, new_volume)
+    alerts.append(
+        _flight_alert(
+            "swap",
+            "warning",
+            (
+                f"Aircraft swap on {flight.flight_id}: capacity set to "
+                f"{new_weight:.0f} kg / {new_volume:.0f} m³"
+            ),
+            flight.flight_id,
+        )
+    )
+
+
+_EventHandler = Callable[[DisruptionEvent, Flight, _ScheduleChanges, List[Alert]], None]
+
+_EVENT_HANDLERS: Dict[str, _EventHandler] = {
+    "delay": _apply_delay,
+    "cancel": _apply_cancel,
+    "swap": _apply_swap,
+}
+
+
+def _adjust_delays_only(
     flights: Dict[str, Flight],
-    events: Iterable[DisruptionEvent],
+    events: List[DisruptionEvent],
 ) -> Tuple[Dict[str, Flight], List[Alert]]:
-    adjusted = dict(flights)
+    # Delays never remove or replace flights, so membership is checked against
+    # the input schedule and no handler dispatch or copy-on-write is needed
+    delays: Dict[str, int] = {}
     alerts: List[Alert] = []
-
     for event in events:
-        flight = adjusted.get(event.flight_id)
-        if event.event_type == "delay":
-            if flight is None:
-                alerts.append(
-                    Alert(
-                        alert_type="delay",
-                        severity="warning",
-                        message=f"Delay reported for unknown flight {event.flight_id}",
-                        flight_id=event.flight_id,
-                    )
-                )
-                continue
-            if event.delay_minutes <= 0:
-                continue
-            delta = timedelta(minutes=event.delay_minutes)
-            adjusted[flight.flight_id] = replace(
-                flight,
-                departure_time=flight.departure_time + delta,
-                arrival_time=flight.arrival_time + delta,
-            )
+        flight_id = event.flight_id
+        if flight_id not in flights:
             alerts.append(
-                Alert(
-                    alert_type="delay",
-                    severity="info",
-                    message=(
-                        f"Flight {flight.flight_id} delayed by {event.delay_minutes} minutes"
-                    ),
-                    flight_id=flight.flight_id,
-                )
-            )
-        elif event.event_type == "cancel":
-            if flight is None:
-                alerts.append(
-                    Alert(
-                        alert_type="cancel",
-                        severity="warning",
-                        message=f"Cancellation reported for unknown flight {event.flight_id}",
-                        flight_id=event.flight_id,
-                    )
-                )
-                continue
-            adjusted.pop(flight.flight_id)
-            alerts.append(
-                Alert(
-                    alert_type="cancel",
-                    severity="critical",
-                    message=f"Flight {flight.flight_id} cancelled",
-                    flight_id=flight.flight_id,
-                )
-            )
-        elif event.event_type == "swap":
-            if flight is None:
-                alerts.append(
-                    Alert(
-                        alert_type="swap",
-                        severity="warning",
-                        message=f"Aircraft swap reported for unknown flight {event.flight_id}",
-                        flight_id=event.flight_id,
-                    )
+                _flight_alert(
+                    "delay", "warning", f"Delay reported for unknown flight {flight_id}", flight_id
                 )
-                continue
-            new_weight = event.new_weight_capacity_kg or flight.weight_capacity_kg
-            new_volume = event.new_volume_capacity_m3 or flight.volume_capacity_m3
-            adjusted[flight.flight_id] = replace(
-                flight,
-                weight_capacity_kg=new_weight,
-                volume_capacity_m3=new_volume,
             )
+            continue
+        minutes = event.delay_minutes
+        if minutes <= 0:
+            continue
+        delays[flight_id] = delays.get(flight_id, 0) + minutes
+        alerts.append(
+            _flight_alert("delay", "info", f"Flight {flight_id} delayed by {minutes} minutes", flight_id)
+        )
+
+    if not delays:
+        return flights, alerts
+    adjusted = dict(flights)
+    for flight_id, minutes in delays.items():
+        adjusted[flight_id] = adjusted[flight_id].shifted(timedelta(minutes=minutes))
+    return adjusted, alerts
+
+
+def _adjust_flights(
+    flights: Dict[str, Flight],
+    events: Iterable[DisruptionEvent],
+) -> Tuple[Dict[str, Flight], List[Alert]]:
+    """Apply ``events`` to the schedule, copying it only once a flight actually changes.
+
+    When no event changes a known flight the input mapping is returned as-is.
+    """
+    events = list(events)
+    if all(event.event_type == "delay" for event in events):
+        return _adjust_delays_only(flights, events)
+
+    changes = _ScheduleChanges(flights)
+    alerts: List[Alert] = []
+
+    for event in events:
+        handler = _EVENT_HANDLERS.get(event.event_type)
+        if handler is None:
+            continue
+        flight = changes.flights.get(event.flight_id)
+        if flight is None:
+            label = _UNKNOWN_FLIGHT_LABELS[event.event_type]
             alerts.append(
-                Alert(
-                    alert_type="swap",
-                    severity="warning",
-                    message=(
-                        f"Aircraft swap on {flight.flight_id}: capacity set to "
-                        f"{new_weight:.0f} kg / {new_volume:.0f} m³"
-                    ),
-                    flight_id=flight.flight_id,
+                _flight_alert(
+                    event.event_type,
+                    "warning",
+                    f"{label} reported for unknown flight {event.flight_id}",
+                    event.flight_id,
                 )
             )
-    return adjusted, alerts
+            continue
+        handler(event, flight, changes, alerts)
+    return changes.finish(), alerts
+
+
+def _status_change_message(cargo_id: str, base_status: str, new_status: str) -> str:
+    return f"Cargo {cargo_id} status changed {base_status} → {new_status}"
+
+
+def _reroute_message(cargo_id: str, base_route: Tuple[str, ...], new_route: Tuple[str, ...]) -> str:
+    return (
+        f"Cargo {cargo_id} rerouted: {'-'.join(base_route) or 'NONE'} → "
+        f"{'-'.join(new_route) or 'NONE'}"
+    )
+
+
+def _margin_change_message(cargo_id: str, margin_delta: float) -> str:
+    return (
+        f"Cargo {cargo_id} margin {'decreased' if margin_delta < 0 else 'increased'} "
+        f"by ₹{abs(margin_delta):,.0f}"
+    )
 
 
-def _leg_sequence(route) -> Tuple[str, ...]:  # type: ignore[no-untyped-def]
-    return tuple(leg.flight.flight_id for leg in route.legs)
+# Per-cargo change kinds, in the precedence _compare_results reports them
+_NO_CHANGE, _MISSING, _STATUS_CHANGE, _REROUTE, _MARGIN_CHANGE = range(5)
+
+# Severity indexed by a boolean: (condition false, condition true)
+_STATUS_SEVERITY: Tuple[AlertSeverity, AlertSeverity] = ("info", "critical")  # not delivered
+_MARGIN_SEVERITY: Tuple[AlertSeverity, AlertSeverity] = ("info", "warning")  # margin fell
+
+
+def _classify_changes(
+    missing: np.ndarray,
+    status_changed: np.ndarray,
+    route_changed: np.ndarray,
+    has_base: np.ndarray,
+    base_margin: np.ndarray,
+    new_margin: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorised core of the baseline/scenario diff: change kind and margin delta per cargo."""
+    margin_delta = np.where(has_base, new_margin - base_margin, np.nan)
+    margin_changed = has_base & (np.abs(np.nan_to_num(margin_delta)) > 1e-3)
+    kind = np.select(
+        [missing, status_changed, route_changed, margin_changed],
+        [_MISSING, _STATUS_CHANGE, _REROUTE, _MARGIN_CHANGE],
+        _NO_CHANGE,
+    )
+    return kind, margin_delta
 
 
 def _compare_results(
     baseline: GAResult,
     scenario: GAResult,
-) -> List[Alert]:
-    alerts: List[Alert] = []
-    cargo_ids = set(baseline.assignments.keys()) | set(scenario.assignments.keys())
+) -> Iterator[Alert]:
+    """Yield alerts describing how ``scenario`` differs from ``baseline``, in cargo id order."""
+    # The baseline's sorted ids are cached on the result and shared by every
+    # scenario; only cargo unique to the scenario need sorting and merging in
+    cargo_ids = baseline.sorted_cargo_ids
+    extra_ids = scenario.assignments.keys() - baseline.assignments.keys()
+    if extra_ids:
+        cargo_ids = list(heapq.merge(cargo_ids, sorted(extra_ids)))
+    count = len(cargo_ids)
+
+    # Gather the per-cargo facts once; the comparison itself runs on arrays
+    base_assigns = [baseline.assignments.get(cargo_id) for cargo_id in cargo_ids]
+    new_assigns = [scenario.assignments.get(cargo_id) for cargo_id in cargo_ids]
+    missing = np.zeros(count, dtype=bool)
+    status_changed = np.zeros(count, dtype=bool)
+    route_changed = np.zeros(count, dtype=bool)
+    has_base = np.zeros(count, dtype=bool)
+    exception = np.zeros(count, dtype=bool)
+    base_margin = np.zeros(count, dtype=np.float64)
+    new_margin = np.zeros(count, dtype=np.float64)
 
-    for cargo_id in sorted(cargo_ids):
-        base_assign = baseline.assignments.get(cargo_id)
-        new_assign = scenario.assignments.get(cargo_id)
+    for idx, (base_assign, new_assign) in enumerate(zip(base_assigns, new_assigns)):
         if new_assign is None:
-            alerts.append(
-                Alert(
-                    alert_type="cargo_missing",
-                    severity="critical",
-                    message=f"Cargo {cargo_id} missing from disrupted solution",
-                    cargo_id=cargo_id,
-                )
+            missing[idx] = True
+            continue
+        new_margin[idx] = new_assign.margin
+        if base_assign is not None:
+            has_base[idx] = True
+            base_margin[idx] = base_assign.margin
+        base_status = base_assign.status if base_assign else "unknown"
+        status_changed[idx] = base_status != new_assign.status
+        if base_assign is None:
+            route_changed[idx] = bool(new_assign.route.legs)
+        else:
+            route_changed[idx] = not base_assign.route.same_legs(new_assign.route)
+        exception[idx] = new_assign.status != "delivered" and bool(new_assign.reason)
+
+    kind, margin_deltas = _classify_changes(
+        missing, status_changed, route_changed, has_base, base_margin, new_margin
+    )
+
+    # Only cargo with something to report reach the alert-building code
+    for idx in np.flatnonzero((kind != _NO_CHANGE) | exception):
+        cargo_id = cargo_ids[idx]
+        change = kind[idx]
+        if change == _MISSING:
+            yield Alert(
+                alert_type="cargo_missing",
+                severity="critical",
+                message=f"Cargo {cargo_id} missing from disrupted solution",
+                cargo_id=cargo_id,
             )
             continue
+
+        base_assign = base_assigns[idx]
+        new_assign = new_assigns[idx]
         base_status = base_assign.status if base_assign else "unknown"
         new_status = new_assign.status
-        margin_delta = None
-        if base_assign is not None:
-            margin_delta = new_assign.margin - base_assign.margin
+        margin_delta = float(margin_deltas[idx]) if has_base[idx] else None
 
-        base_route = _leg_sequence(base_assign.route) if base_assign else tuple()
-        new_route = _leg_sequence(new_assign.route)
-
-        if base_status != new_status:
-            severity: AlertSeverity = "critical" if new_status != "delivered" else "info"
-            alerts.append(
-                Alert(
-                    alert_type="status_change",
-                    severity=severity,
-                    message=(
-                        f"Cargo {cargo_id} status changed {base_status} → {new_status}"
-                    ),
-                    cargo_id=cargo_id,
-                    status=new_status,
-                    margin_delta=margin_delta,
-                )
+        if change == _STATUS_CHANGE:
+            severity = _STATUS_SEVERITY[new_status != "delivered"]
+            yield Alert(
+                alert_type="status_change",
+                severity=severity,
+                message=LazyMessage(_status_change_message, cargo_id, base_status, new_status),
+                cargo_id=cargo_id,
+                status=new_status,
+                margin_delta=margin_delta,
             )
-        elif base_route != new_route:
-            alerts.append(
-                Alert(
-                    alert_type="reroute",
-                    severity="warning",
-                    message=(
-                        f"Cargo {cargo_id} rerouted: {'-'.join(base_route) or 'NONE'} → "
-                        f"{'-'.join(new_route) or 'NONE'}"
-                    ),
-                    cargo_id=cargo_id,
-                    status=new_status,
-                    margin_delta=margin_delta,
-                )
+        elif change == _REROUTE:
+            base_route = base_assign.route.flight_ids if base_assign else ()
+            yield Alert(
+                alert_type="reroute",
+                severity="warning",
+                message=LazyMessage(
+                    _reroute_message, cargo_id, base_route, new_assign.route.flight_ids
+                ),
+                cargo_id=cargo_id,
+                status=new_status,
+                margin_delta=margin_delta,
             )
-        elif margin_delta and abs(margin_delta) > 1e-3:
-            severity = "warning" if margin_delta < 0 else "info"
-            alerts.append(
-                Alert(
-                    alert_type="margin_change",
-                    severity=severity,
-                    message=(
-                        f"Cargo {cargo_id} margin {'decreased' if margin_delta < 0 else 'increased'} "
-                        f"by ₹{abs(margin_delta):,.0f}"
-                    ),
-                    cargo_id=cargo_id,
-                    status=new_status,
-                    margin_delta=margin_delta,
-                )
+        elif change == _MARGIN_CHANGE:
+            severity = _MARGIN_SEVERITY[margin_delta < 0]
+            yield Alert(
+                alert_type="margin_change",
+                severity=severity,
+                message=LazyMessage(_margin_change_message, cargo_id, margin_delta),
+                cargo_id=cargo_id,
+                status=new_status,
+                margin_delta=margin_delta,
             )
 
-        if new_status != "delivered" and new_assign.reason:
-            alerts.append(
-                Alert(
-                    alert_type="exception",
-                    severity="critical",
-                    message=new_assign.reason,
-                    cargo_id=cargo_id,
-                    status=new_status,
-                    margin_delta=margin_delta,
-                )
+        if exception[idx]:
+            yield Alert(
+                alert_type="exception",
+                severity="critical",
+                message=new_assign.reason,
+                cargo_id=cargo_id,
+                status=new_status,
+                margin_delta=margin_delta,
             )
 
-    return alerts
-
 
 def baseline_alerts(result: GAResult) -> List[Alert]:
     alerts: List[Alert] = []
-    for cargo_id, assignment in result.assignments.items():
-        if assignment.status != "delivered":
-            alerts.append(
-                Alert(
-                    alert_type="baseline_exception",
-                    severity="warning",
-                    message=assignment.reason or f"Cargo {cargo_id} not delivered",
-                    cargo_id=cargo_id,
-                    status=assignment.status,
-                    margin_delta=None,
-                )
+    undelivered = np.flatnonzero(~result.delivered_mask)
+    if not undelivered.size:
+        return alerts
+    cargo_order = result.cargo_order
+    for idx in undelivered:
+        cargo_id = cargo_order[idx]
+        assignment = result.assignments[cargo_id]
+        alerts.append(
+            Alert(
+                alert_type="baseline_exception",
+                severity="warning",
+                message=assignment.reason or f"Cargo {cargo_id} not delivered",
+                cargo_id=cargo_id,
+                status=assignment.status,
+                margin_delta=None,
             )
+        )
     return alerts
 
 
+def scenario_alerts(baseline: GAResult, scenario: GAResult) -> List[Alert]:
+    """Alerts for every cargo whose plan differs between ``baseline`` and ``scenario``."""
+    return list(_compare_results(baseline, scenario))
+
+
 def apply_disruptions(
-    baseline: GAResult,
+    baseline: Optional[GAResult],
     cargo_map: Dict[str, Cargo],
     flights: Dict[str, Flight],
     connection_rules: Iterable[ConnectionRule],
     events: Iterable[DisruptionEvent],
     seed: Optional[int] = 123,
+    max_routes_per_cargo: Optional[int] = DEFAULT_MAX_ROUTES_PER_CARGO,
 ) -> Tuple[GAResult, Dict[str, Flight], List[Alert]]:
+    # Intern event flight ids so schedule lookups hit the identity fast path
+    events = [replace(event, flight_id=intern(event.flight_id)) for event in events]
     adjusted_flights, event_alerts = _adjust_flights(flights, events)
 
     scenario_result = run_ga(
@@ -252,8 +446,80 @@ def apply_disruptions(
         flights=adjusted_flights,
         connection_rules=connection_rules,
         seed=seed,
+        max_routes_per_cargo=max_routes_per_cargo,
+    )
+
+    # Without a baseline there is nothing to diff; only the event alerts remain
+    if baseline is not None:
+        event_alerts.extend(_compare_results(baseline, scenario_result))
+    return scenario_result, adjusted_flights, event_alerts
+
+
+ScenarioOutcome = Tuple[GAResult, Dict[str, Flight], List[Alert]]
+
+# Inputs shared by every scenario in a batch, installed once per worker process
+_worker_inputs: Optional[
+    Tuple[
+        Optional[GAResult],
+        Dict[str, Cargo],
+        Dict[str, Flight],
+        List[ConnectionRule],
+        Optional[int],
+        Optional[int],
+    ]
+] = None
+
+
+def _init_scenario_worker(
+    baseline: Optional[GAResult],
+    cargo_map: Dict[str, Cargo],
+    flights: Dict[str, Flight],
+    connection_rules: List[ConnectionRule],
+    seed: Optional[int],
+    max_routes_per_cargo: Optional[int],
+) -> None:
+    global _worker_inputs
+    _worker_inputs = (baseline, cargo_map, flights, connection_rules, seed, max_routes_per_cargo)
+
+
+def _apply_scenario(events: List[DisruptionEvent]) -> ScenarioOutcome:
+    assert _worker_inputs is not None, "scenario worker was not initialised"
+    baseline, cargo_map, flights, connection_rules, seed, max_routes_per_cargo = _worker_inputs
+    return apply_disruptions(
+        baseline, cargo_map, flights, connection_rules, events, seed, max_routes_per_cargo
     )
 
-    comparison_alerts = _compare_results(baseline, scenario_result)
 
-    return scenario_result, adjusted_flights, [*event_alerts, *comparison_alerts]
+def apply_disruptions_batch(
+    baseline: Optional[GAResult],
+    cargo_map: Dict[str, Cargo],
+    flights: Dict[str, Flight],
+    connection_rules: Iterable[ConnectionRule],
+    scenarios: Iterable[Iterable[DisruptionEvent]],
+    seed: Optional[int] = 123,
+    max_workers: Optional[int] = None,
+    max_routes_per_cargo: Optional[int] = DEFAULT_MAX_ROUTES_PER_CARGO,
+) -> List[ScenarioOutcome]:
+    """Evaluate independent disruption scenarios in parallel, one GA run per scenario.
+
+    The shared inputs are sent to each worker once through the pool
+    initializer rather than with every scenario. Results come back in
+    scenario order and match running ``apply_disruptions`` on each in turn.
+    ``max_workers`` of None means one worker per CPU; with one worker, or a
+    single scenario, everything runs in-process.
+    """
+    scenario_events = [list(events) for events in scenarios]
+    rules = list(connection_rules)
+    workers = min(len(scenario_events), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [
+            apply_disruptions(baseline, cargo_map, flights, rules, events, seed, max_routes_per_cargo)
+            for events in scenario_events
+        ]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_scenario_worker,
+        initargs=(baseline, cargo_map, flights, rules, seed, max_routes_per_cargo),
+    ) as executor:
+        return list(executor.map(_apply_scenario, scenario_events))
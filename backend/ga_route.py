@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import heapq
+import logging
+import os
 import random
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Iterable, List, Optional, Tuple
+from functools import cached_property, lru_cache
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import Dict, FrozenSet, Iterable, List, Literal, Optional, Sequence, Set, Tuple
+
+import numpy as np
 
 try:
     # When running as part of the FastAPI app
@@ -24,8 +35,10 @@ except ImportError:
         select_best_cargo,
     )
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RouteLeg:
     flight: Flight
     departure_time: datetime
@@ -33,7 +46,7 @@ class RouteLeg:
     dwell_hours_before: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RouteOption:
     cargo_id: str
     legs: Tuple[RouteLeg, ...]
@@ -45,11 +58,37 @@ class RouteOption:
     transit_hours: float
     arrival_time: datetime
     departure_time: datetime
-    revenue_density_by_flight: Dict[str, float]
-    dwell_by_flight: Dict[str, float]
+    # Revenue density on each leg's flight, in leg order (dwell is on the legs)
+    revenue_density_by_leg: Tuple[float, ...]
     rollover_penalty: float
     feasible: bool
     notes: str = ""
+    _flight_ids: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _leg_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def flight_ids(self) -> Tuple[str, ...]:
+        """Flight ids of the legs in order, built on first use and kept with the route."""
+        if self._flight_ids is None:
+            object.__setattr__(self, "_flight_ids", tuple(leg.flight.flight_id for leg in self.legs))
+        return self._flight_ids
+
+    @property
+    def leg_hash(self) -> int:
+        """Hash of ``flight_ids`` so unequal routes can be told apart in O(1)."""
+        if self._leg_hash is None:
+            object.__setattr__(self, "_leg_hash", hash(self.flight_ids))
+        return self._leg_hash
+
+    def same_legs(self, other: RouteOption) -> bool:
+        """Whether both routes fly the same flights, checking the hashes before the ids."""
+        return self is other or (
+            self.leg_hash == other.leg_hash and self.flight_ids == other.flight_ids
+        )
+
+
+# Assignment statuses that leave cargo without a completed itinerary
+PROBLEM_STATUSES = frozenset(("denied", "rolled"))
 
 
 @dataclass
@@ -67,11 +106,47 @@ class GAResult:
     assignments: Dict[str, CargoAssignment]
     flight_loads: Dict[str, FlightSelection]
 
+    @cached_property
+    def sorted_cargo_ids(self) -> List[str]:
+        """Assigned cargo ids in sorted order, computed once per result."""
+        return sorted(self.assignments)
+
+    @cached_property
+    def cargo_order(self) -> Tuple[str, ...]:
+        """Assigned cargo ids in assignment order; the index space of ``delivered_mask``."""
+        return tuple(self.assignments)
+
+    @cached_property
+    def delivered_mask(self) -> np.ndarray:
+        """Boolean array marking delivered cargo, aligned with ``cargo_order``."""
+        return np.fromiter(
+            (assignment.status == "delivered" for assignment in self.assignments.values()),
+            dtype=bool,
+            count=len(self.assignments),
+        )
 
-@dataclass
+    @cached_property
+    def undelivered_cargo_ids(self) -> Tuple[str, ...]:
+        """Ids of cargo with any status other than delivered, in assignment order."""
+        cargo_order = self.cargo_order
+        return tuple(cargo_order[idx] for idx in np.flatnonzero(~self.delivered_mask))
+
+    @cached_property
+    def problem_cargo_ids(self) -> List[str]:
+        """Ids of denied or rolled cargo, collected once per result on first use."""
+        return [
+            cargo_id
+            for cargo_id, assignment in self.assignments.items()
+            if assignment.status in PROBLEM_STATUSES
+        ]
+
+
+@dataclass(slots=True)
 class _CargoState:
     cargo: Cargo
     route: RouteOption
+    # Knapsack candidate for each leg of ``route``, shared by every individual
+    leg_candidates: Tuple[FlightCargoCandidate, ...] = ()
     next_leg_index: int = 0
     status: str = "pending"
     accumulated_margin: float = 0.0
@@ -89,141 +164,388 @@ def build_connection_index(
     return index
 
 
-def _hours_between(start: datetime, end: datetime) -> float:
-    return (end - start).total_seconds() / 3600.0
+# Both take epoch seconds (Flight.departure_ts and friends) rather than
+# datetimes, so no timedelta is built per call.
+def _hours_between(start_ts: float, end_ts: float) -> float:
+    return (end_ts - start_ts) / 3600.0
 
 
-def _minutes_between(start: datetime, end: datetime) -> float:
-    return (end - start).total_seconds() / 60.0
+def _minutes_between(start_ts: float, end_ts: float) -> float:
+    return (end_ts - start_ts) / 60.0
 
 
-def _build_route_option(
-    cargo: Cargo,
-    flights: List[Flight],
+# Connection window per connection airport for one cargo, as (minimum
+# connect minutes, maximum connect hours); key None holds the default rule
+_ConnectionLimits = Dict[Optional[str], Tuple[float, float]]
+
+
+def _connection_limits(
     connection_index: Dict[Tuple[str, str, Optional[str]], ConnectionRule],
-) -> Optional[RouteOption]:
+    relaxed: bool,
+) -> Dict[Tuple[str, str], _ConnectionLimits]:
+    """Connection windows for every (origin, destination) pair with rules."""
+    limits_by_od: Dict[Tuple[str, str], _ConnectionLimits] = {}
+    for (origin, destination, airport), rule in connection_index.items():
+        limits = limits_by_od.setdefault((origin, destination), {})
+        if relaxed:
+            # More flexible minimum and maximum connection times
+            limits[airport] = (
+                max(30, rule.min_connect_minutes - 15),
+                min(12, rule.max_connect_hours + 2),
+            )
+        else:
+            limits[airport] = (rule.min_connect_minutes, rule.max_connect_hours)
+    return limits_by_od
+
+
+def _route_dwells(
+    cargo: Cargo,
+    flights: Sequence[Flight],
+    limits: _ConnectionLimits,
+    transit_limit: float,
+) -> Optional[List[float]]:
+    """Dwell hours before each leg of ``flights``, or None if the path breaks a rule."""
     if not flights:
         return None
-    first_departure = flights[0].departure_time
-    last_arrival = flights[-1].arrival_time
-
-    transit_hours = _hours_between(first_departure, last_arrival)
-    if transit_hours > cargo.max_transit_hours:
+    transit_hours = _hours_between(flights[0].departure_ts, flights[-1].arrival_ts)
+    if transit_hours > transit_limit:
         return None
 
-    dwell_by_flight: Dict[str, float] = {}
-    legs: List[RouteLeg] = []
+    # Fall back to the rule without a connection airport for more flexibility
+    default_window = limits.get(None)
+    # Most pairs only have that default rule, and then no hop needs a lookup
+    has_overrides = len(limits) > (default_window is not None)
+    dwells: List[float] = []
     prev_arrival = None
 
     for idx, flight in enumerate(flights):
         if idx == 0:
-            dwell = max(0.0, _hours_between(cargo.ready_time, flight.departure_time))
-            if flight.departure_time < cargo.ready_time:
+            dwell = max(0.0, _hours_between(cargo.ready_ts, flight.departure_ts))
+            if flight.departure_ts < cargo.ready_ts:
                 return None
         else:
-            connection_airport = flights[idx - 1].destination
-            rule = connection_index.get((cargo.origin, cargo.destination, connection_airport))
-            if rule is None:
-                # Try without connection airport constraint for more flexibility
-                rule = connection_index.get((cargo.origin, cargo.destination, None))
-                if rule is None:
-                    return None
-            dwell_minutes = _minutes_between(prev_arrival, flight.departure_time)
-            if dwell_minutes < max(30, rule.min_connect_minutes - 15):  # More flexible minimum connection time
+            if has_overrides:
+                window = limits.get(flights[idx - 1].destination, default_window)
+            else:
+                window = default_window
+            if window is None:
+                return None
+            min_connect, max_connect = window
+            dwell_minutes = _minutes_between(prev_arrival, flight.departure_ts)
+            if dwell_minutes < min_connect:
                 return None
             dwell = dwell_minutes / 60.0
-            if dwell > min(12, rule.max_connect_hours + 2):  # More flexible maximum connection time
+            if dwell > max_connect:
                 return None
-        dwell_by_flight[flight.flight_id] = dwell
-        legs.append(
-            RouteLeg(
-                flight=flight,
-                departure_time=flight.departure_time,
-                arrival_time=flight.arrival_time,
-                dwell_hours_before=dwell,
+        dwells.append(dwell)
+        prev_arrival = flight.arrival_ts
+    return dwells
+
+
+def _score_routes(
+    cargo: Cargo,
+    paths: Sequence[Sequence[Flight]],
+    dwells: Sequence[Sequence[float]],
+    notes: str,
+    limit: Optional[int] = None,
+) -> List[RouteOption]:
+    """Cost a batch of validated paths for one cargo and build their route options.
+
+    Per-leg terms are laid out as (path, leg) arrays padded with zeros and
+    summed one leg column at a time, in leg order, so every figure matches
+    costing the route on its own to the last bit. Each path's flight columns
+    are written into the (path, leg, term) table in one assignment.
+
+    With ``limit``, only the ``limit`` highest-margin paths become route
+    options, picked from the margin array and kept in path order, with ties
+    going to the earlier path as in _best_routes.
+    """
+    count = len(paths)
+    if not count:
+        return []
+    width = max(len(flights) for flights in paths)
+    # Terms: operating cost per kg, handling penalty per hour, dwell hours,
+    # weight capacity, volume capacity. Padding capacities are 1 so the
+    # density ratios of missing legs stay finite.
+    leg_terms = np.zeros((count, width, 5))
+    leg_terms[:, :, 3:] = 1.0
+    leg_count = np.empty(count)
+    first_departure = np.empty(count)
+    last_arrival = np.empty(count)
+    for row, (flights, route_dwells) in enumerate(zip(paths, dwells)):
+        legs = len(flights)
+        leg_terms[row, :legs] = [
+            (
+                flight.operating_cost_per_kg,
+                flight.handling_penalty_per_hour,
+                dwell,
+                flight.weight_capacity_kg,
+                flight.volume_capacity_m3,
+            )
+            for flight, dwell in zip(flights, route_dwells)
+        ]
+        leg_count[row] = legs
+        first_departure[row] = flights[0].departure_ts
+        last_arrival[row] = flights[-1].arrival_ts
+    operating_per_kg = leg_terms[:, :, 0]
+    penalty_per_hour = leg_terms[:, :, 1]
+    dwell_hours = leg_terms[:, :, 2]
+    weight_capacity = leg_terms[:, :, 3]
+    volume_capacity = leg_terms[:, :, 4]
+
+    weight = cargo.weight_kg
+    revenue = cargo.revenue_inr
+    handling_per_leg = weight * cargo.handling_cost_per_kg
+
+    operating_cost = np.zeros(count)
+    handling_penalty = np.zeros(count)
+    for col in range(width):
+        operating_cost += weight * operating_per_kg[:, col]
+        handling_penalty += penalty_per_hour[:, col] * dwell_hours[:, col]
+    total_cost = operating_cost + handling_per_leg * leg_count + handling_penalty
+
+    sla_penalty = np.where(
+        last_arrival > cargo.due_ts,
+        (last_arrival - cargo.due_ts) / 3600.0 * cargo.sla_penalty_per_hour,
+        0.0,
+    )
+    total_margin = revenue - total_cost - sla_penalty
+    if limit is not None and count > limit:
+        # A stable sort on the negated margins puts equal margins in path order
+        keep = np.sort(np.argsort(-total_margin, kind="stable")[:limit])
+        paths = [paths[row] for row in keep.tolist()]
+        dwells = [dwells[row] for row in keep.tolist()]
+        total_cost = total_cost[keep]
+        handling_penalty = handling_penalty[keep]
+        sla_penalty = sla_penalty[keep]
+        total_margin = total_margin[keep]
+        first_departure = first_departure[keep]
+        last_arrival = last_arrival[keep]
+        weight_capacity = weight_capacity[keep]
+        volume_capacity = volume_capacity[keep]
+    transit_hours = (last_arrival - first_departure) / 3600.0
+    bottleneck = np.maximum(
+        np.maximum(weight / weight_capacity, cargo.volume_m3 / volume_capacity), 1e-6
+    )
+    revenue_density = (revenue / bottleneck).tolist()
+
+    rollover_penalty = cargo.sla_penalty_per_hour * 4 + handling_per_leg
+    routes: List[RouteOption] = []
+    for row, (flights, route_dwells, total, handling, sla, margin, transit) in enumerate(
+        zip(
+            paths,
+            dwells,
+            total_cost.tolist(),
+            handling_penalty.tolist(),
+            sla_penalty.tolist(),
+            total_margin.tolist(),
+            transit_hours.tolist(),
+        )
+    ):
+        routes.append(
+            RouteOption(
+                cargo_id=cargo.cargo_id,
+                legs=tuple(
+                    RouteLeg(
+                        flight=flight,
+                        departure_time=flight.departure_time,
+                        arrival_time=flight.arrival_time,
+                        dwell_hours_before=dwell,
+                    )
+                    for flight, dwell in zip(flights, route_dwells)
+                ),
+                total_cost=total,
+                handling_penalty=handling,
+                sla_penalty=sla,
+                total_margin=margin,
+                total_revenue=revenue,
+                transit_hours=transit,
+                arrival_time=flights[-1].arrival_time,
+                departure_time=flights[0].departure_time,
+                revenue_density_by_leg=tuple(revenue_density[row][: len(flights)]),
+                rollover_penalty=rollover_penalty,
+                feasible=True,
+                notes=notes,
             )
         )
-        prev_arrival = flight.arrival_time
+    return routes
 
-    handling_cost = cargo.weight_kg * cargo.handling_cost_per_kg * len(legs)
-    operating_cost = sum(cargo.weight_kg * leg.flight.operating_cost_per_kg for leg in legs)
-    handling_penalty = sum(
-        leg.flight.handling_penalty_per_hour * leg.dwell_hours_before for leg in legs
-    )
-    total_cost = operating_cost + handling_cost + handling_penalty
 
-    sla_penalty = 0.0
-    if last_arrival > cargo.due_by:
-        delay_hours = _hours_between(cargo.due_by, last_arrival)
-        sla_penalty = delay_hours * cargo.sla_penalty_per_hour
+@lru_cache(maxsize=16)
+def _connection_limits_for(
+    connection_rules: Tuple[ConnectionRule, ...], relaxed: bool
+) -> Dict[Tuple[str, str], _ConnectionLimits]:
+    return _connection_limits(build_connection_index(connection_rules), relaxed)
 
-    total_margin = cargo.revenue_inr - total_cost - sla_penalty
 
-    revenue_density_by_flight: Dict[str, float] = {}
-    for leg in legs:
-        weight_ratio = cargo.weight_kg / leg.flight.weight_capacity_kg
-        volume_ratio = cargo.volume_m3 / leg.flight.volume_capacity_m3
-        bottleneck = max(weight_ratio, volume_ratio, 1e-6)
-        revenue_density_by_flight[leg.flight.flight_id] = cargo.revenue_inr / bottleneck
+# Shared, never mutated: the limits of a cargo whose pair has no rules
+_NO_CONNECTION_LIMITS: _ConnectionLimits = {}
 
-    rollover_penalty = cargo.sla_penalty_per_hour * 4 + cargo.weight_kg * cargo.handling_cost_per_kg
 
-    return RouteOption(
-        cargo_id=cargo.cargo_id,
-        legs=tuple(legs),
-        total_cost=total_cost,
-        handling_penalty=handling_penalty,
-        sla_penalty=sla_penalty,
-        total_margin=total_margin,
-        total_revenue=cargo.revenue_inr,
-        transit_hours=transit_hours,
-        arrival_time=last_arrival,
-        departure_time=first_departure,
-        revenue_density_by_flight=revenue_density_by_flight,
-        dwell_by_flight=dwell_by_flight,
-        rollover_penalty=rollover_penalty,
-        feasible=True,
-        notes="",
-    )
+# Route-building modes, keyed by the ``extended`` flag of _route_options_for:
+# (relax connection windows, transit-limit factor, route notes)
+_ROUTE_MODES: Dict[Optional[bool], Tuple[bool, float, str]] = {
+    None: (True, 1.0, ""),
+    False: (False, 1.0, "Alternative route"),
+    True: (True, 1.5, "Alternative route (extended constraints)"),
+}
 
 
-def _generate_routes_for_cargo(
+@lru_cache(maxsize=4096)
+def _route_options_for(
     cargo: Cargo,
-    flights_by_origin: Dict[str, List[Flight]],
-    connection_index: Dict[Tuple[str, str, Optional[str]], ConnectionRule],
-) -> List[RouteOption]:
-    routes: List[RouteOption] = []
+    paths: Tuple[Tuple[Flight, ...], ...],
+    connection_rules: Tuple[ConnectionRule, ...],
+    extended: Optional[bool],
+    limit: Optional[int] = None,
+) -> Tuple[RouteOption, ...]:
+    """Memoized route build for one cargo's search; ``extended`` is None for the primary rules.
+
+    ``limit`` keeps only that many of the best-margin routes (see _score_routes).
+
+    Cargo, flights and rules are frozen, so a search built once is reused by
+    every later catalog over the same data, such as the scenario run after a
+    baseline or repeated plans over unchanged inputs.
+    """
+    relaxed, transit_factor, notes = _ROUTE_MODES[extended]
+    limits = _connection_limits_for(connection_rules, relaxed).get(
+        (cargo.origin, cargo.destination), _NO_CONNECTION_LIMITS
+    )
+    transit_limit = cargo.max_transit_hours * transit_factor
+    valid_paths: List[Tuple[Flight, ...]] = []
+    dwells: List[List[float]] = []
+    for flights in paths:
+        route_dwells = _route_dwells(cargo, flights, limits, transit_limit)
+        if route_dwells is not None:
+            valid_paths.append(flights)
+            dwells.append(route_dwells)
+    return tuple(_score_routes(cargo, valid_paths, dwells, notes, limit))
 
-    def dfs(current_path: List[Flight]) -> None:
-        if current_path:
-            last_flight = current_path[-1]
-            if last_flight.destination == cargo.destination:
-                option = _build_route_option(cargo, current_path, connection_index)
-                if option is not None:
-                    routes.append(option)
-                return
-            if len(current_path) >= 4:  # Allow one more leg for better connectivity
-                return
-            current_arrival = last_flight.arrival_time
-        else:
-            current_arrival = None
 
-        origin_airport = cargo.origin if not current_path else current_path[-1].destination
-        for flight in flights_by_origin.get(origin_airport, []):
-            if flight.flight_id in {leg.flight_id for leg in current_path}:
-                continue
-            if current_path and flight.departure_time <= current_arrival:
+# Most legs any route search may use (the alternative search allows five)
+_MAX_ROUTE_LEGS = 5
+
+# Per flight id, the earliest arrival (epoch seconds) at one destination when
+# the flight is taken next and at most ``k`` further legs follow (index
+# ``k``), or None
+_EarliestArrivals = Dict[str, List[Optional[float]]]
+
+
+def _earliest_arrivals(
+    flights_by_origin: Dict[str, List[Flight]],
+    departures_by_origin: Dict[str, List[float]],
+    destination: str,
+) -> _EarliestArrivals:
+    """Earliest arrival at ``destination`` reachable from each flight, by legs remaining.
+
+    Connection rules and transit limits are ignored, so the values are lower
+    bounds: a search branch whose bound already breaks the transit limit
+    cannot produce any route and is safe to prune.
+    """
+    all_flights = [flight for flight_list in flights_by_origin.values() for flight in flight_list]
+    earliest: _EarliestArrivals = {
+        flight.flight_id: [flight.arrival_ts if flight.destination == destination else None]
+        for flight in all_flights
+    }
+    for remaining in range(1, _MAX_ROUTE_LEGS):
+        for flight in all_flights:
+            bounds = earliest[flight.flight_id]
+            best = bounds[0]
+            onward_flights = flights_by_origin.get(flight.destination)
+            if best is None and onward_flights:
+                start = bisect_right(departures_by_origin[flight.destination], flight.arrival_ts)
+                for onward in islice(onward_flights, start, None):
+                    candidate = earliest[onward.flight_id][remaining - 1]
+                    if candidate is not None and (best is None or candidate < best):
+                        best = candidate
+            bounds.append(best)
+    return earliest
+
+
+def _search_paths(
+    cargo: Cargo,
+    flights_by_origin: Dict[str, List[Flight]],
+    departures_by_origin: Dict[str, List[float]],
+    earliest: _EarliestArrivals,
+    transit_limit: float,
+    max_legs: int,
+) -> List[Tuple[Flight, ...]]:
+    """Flight paths from the cargo's origin to its destination, in depth-first order.
+
+    The search keeps an explicit stack of per-airport flight iterators
+    instead of recursing, so each step costs a loop iteration rather than a
+    Python call.
+    """
+    destination = cargo.destination
+    paths: List[Tuple[Flight, ...]] = []
+    origin_flights = flights_by_origin.get(cargo.origin)
+    if not origin_flights:
+        return paths
+
+    # The path being explored, with its flight ids for O(1) revisit checks.
+    # Flights are sorted by departure, so each iterator starts at the first
+    # flight that leaves late enough.
+    path: List[Flight] = []
+    visited: Set[str] = set()
+    start = bisect_left(departures_by_origin[cargo.origin], cargo.ready_ts)
+    stack = [islice(origin_flights, start, None)]
+    first_departure = 0.0
+
+    # Hours since the path's first departure are worked out inline, as
+    # _hours_between does, since this loop runs once per flight tried
+
+    while stack:
+        depth = len(path)
+        descended = False
+        for flight in stack[-1]:
+            if depth:
+                path_departure = first_departure
+                # Every later flight also departs, and so arrives, too late
+                if (flight.departure_ts - path_departure) / 3600.0 > transit_limit:
+                    break
+            else:
+                path_departure = flight.departure_ts
+            if flight.flight_id in visited:
                 continue
-            if not current_path and flight.departure_time < cargo.ready_time:
+            if (flight.arrival_ts - path_departure) / 3600.0 > transit_limit:
                 continue
-            first_departure = current_path[0].departure_time if current_path else flight.departure_time
-            total_transit = _hours_between(first_departure, flight.arrival_time)
-            if total_transit > cargo.max_transit_hours:
+            # Skip branches that cannot reach the destination within the limit
+            bound = earliest[flight.flight_id][max_legs - 1 - depth]
+            if bound is None or (bound - path_departure) / 3600.0 > transit_limit:
                 continue
-            dfs(current_path + [flight])
 
-    dfs([])
-    return routes
+            if flight.destination == destination:
+                paths.append((*path, flight))
+            elif depth + 1 < max_legs:
+                onward_flights = flights_by_origin.get(flight.destination)
+                if onward_flights:
+                    start = bisect_right(departures_by_origin[flight.destination], flight.arrival_ts)
+                    path.append(flight)
+                    visited.add(flight.flight_id)
+                    first_departure = path_departure
+                    stack.append(islice(onward_flights, start, None))
+                    descended = True
+                    break
+        if not descended:
+            stack.pop()
+            if path:
+                visited.discard(path.pop().flight_id)
+    return paths
+
+
+def _generate_routes_for_cargo(
+    cargo: Cargo,
+    flights_by_origin: Dict[str, List[Flight]],
+    departures_by_origin: Dict[str, List[float]],
+    connection_rules: Tuple[ConnectionRule, ...],
+    earliest: _EarliestArrivals,
+    limit: Optional[int] = None,
+) -> List[RouteOption]:
+    # Allow one more leg (four) for better connectivity
+    paths = _search_paths(
+        cargo, flights_by_origin, departures_by_origin, earliest, cargo.max_transit_hours, 4
+    )
+    return list(_route_options_for(cargo, tuple(paths), connection_rules, None, limit))
 
 
 def _fallback_route(cargo: Cargo, reason: str) -> RouteOption:
@@ -240,36 +562,79 @@ def _fallback_route(cargo: Cargo, reason: str) -> RouteOption:
         transit_hours=0.0,
         arrival_time=now,
         departure_time=now,
-        revenue_density_by_flight={},
-        dwell_by_flight={},
+        revenue_density_by_leg=(),
         rollover_penalty=penalty,
         feasible=False,
         notes=reason,
     )
 
 
-def build_route_catalog(
-    cargo_map: Dict[str, Cargo],
-    flights: Dict[str, Flight],
-    connection_rules: Iterable[ConnectionRule],
-) -> Dict[str, List[RouteOption]]:
+# Flights leaving each airport in departure order, with their departure
+# timestamps alongside for bisecting
+_AirportGraph = Tuple[Dict[str, List[Flight]], Dict[str, List[float]]]
+
+
+def _airport_graph(flights: Dict[str, Flight]) -> _AirportGraph:
     flights_by_origin: Dict[str, List[Flight]] = {}
     for flight in flights.values():
         flights_by_origin.setdefault(flight.origin, []).append(flight)
     for flight_list in flights_by_origin.values():
-        flight_list.sort(key=lambda f: f.departure_time)
-
-    connection_index = build_connection_index(connection_rules)
-
-    catalog: Dict[str, List[RouteOption]] = {}
-    for cargo in cargo_map.values():
-        routes = _generate_routes_for_cargo(cargo, flights_by_origin, connection_index)
+        flight_list.sort(key=lambda f: f.departure_ts)
+    departures_by_origin = {
+        origin: [flight.departure_ts for flight in flight_list]
+        for origin, flight_list in flights_by_origin.items()
+    }
+    return flights_by_origin, departures_by_origin
+
+
+class _CatalogSearch:
+    """Flight indexes shared by every cargo's route search over one schedule."""
+
+    __slots__ = ("flights_by_origin", "departures_by_origin", "rules", "max_routes", "_earliest_by_destination")
+
+    def __init__(
+        self,
+        flights: Dict[str, Flight],
+        connection_rules: Iterable[ConnectionRule],
+        max_routes: Optional[int] = None,
+    ) -> None:
+        self.flights_by_origin, self.departures_by_origin = _airport_graph(flights)
+        self.rules = tuple(connection_rules)
+        self.max_routes = max_routes
+        self._earliest_by_destination: Dict[str, _EarliestArrivals] = {}
+
+    def earliest(self, destination: str) -> _EarliestArrivals:
+        earliest = self._earliest_by_destination.get(destination)
+        if earliest is None:
+            earliest = _earliest_arrivals(self.flights_by_origin, self.departures_by_origin, destination)
+            self._earliest_by_destination[destination] = earliest
+        return earliest
+
+    def routes_for(self, cargo: Cargo) -> List[RouteOption]:
+        earliest = self.earliest(cargo.destination)
+        limit = self.max_routes
+        # The primary search keeps at least two routes, so the "fewer than
+        # two" check below sees the same answer as an uncapped search
+        routes = _generate_routes_for_cargo(
+            cargo,
+            self.flights_by_origin,
+            self.departures_by_origin,
+            self.rules,
+            earliest,
+            None if limit is None else max(limit, 2),
+        )
 
         # For medium and high priority cargo, generate alternative routes if primary routes fail
         if not routes or (cargo.priority in ["Medium", "High"] and len(routes) < 2):
-            alternative_routes = _generate_alternative_routes(cargo, flights_by_origin, connection_index)
+            alternative_routes = _generate_alternative_routes(
+                cargo, self.flights_by_origin, self.departures_by_origin, self.rules, earliest, limit
+            )
             routes.extend(alternative_routes)
 
+        if limit is not None:
+            # Each search kept its own best routes; this picks the best of both
+            routes = _best_routes(routes, limit)
+
         if routes:
             # Add priority-based fallback routes
             if cargo.priority == "High":
@@ -280,174 +645,171 @@ def build_route_catalog(
                 routes.append(_fallback_route(cargo, "Denied load"))
         else:
             routes = [_fallback_route(cargo, "No feasible itinerary")]
-        catalog[cargo.cargo_id] = routes
-    return catalog
+        return routes
 
 
-def _generate_alternative_routes(
-    cargo: Cargo,
-    flights_by_origin: Dict[str, List[Flight]],
-    connection_index: Dict[Tuple[str, str, Optional[str]], ConnectionRule],
-) -> List[RouteOption]:
-    """Generate alternative routes for medium/high priority cargo with relaxed constraints."""
-    routes: List[RouteOption] = []
+# Default cap on flown routes per cargo in the GA's route catalog. Dense
+# schedules can yield thousands of itineraries per cargo; the GA picks among
+# them uniformly, so the low-margin tail only dilutes its search.
+DEFAULT_MAX_ROUTES_PER_CARGO = 64
 
-    # Try with extended transit time (up to 50% more than max_transit_hours)
-    extended_transit_limit = cargo.max_transit_hours * 1.5
-
-    def dfs_alternative(current_path: List[Flight], extended_limit: bool = False) -> None:
-        if current_path:
-            last_flight = current_path[-1]
-            if last_flight.destination == cargo.destination:
-                option = _build_route_option_alternative(cargo, current_path, connection_index, extended_limit)
-                if option is not None:
-                    routes.append(option)
-                return
-            if len(current_path) >= 5:  # Allow longer routes for alternatives
-                return
-            current_arrival = last_flight.arrival_time
-        else:
-            current_arrival = None
 
-        origin_airport = cargo.origin if not current_path else current_path[-1].destination
-        for flight in flights_by_origin.get(origin_airport, []):
-            if flight.flight_id in {leg.flight_id for leg in current_path}:
-                continue
-            if current_path and flight.departure_time <= current_arrival:
-                continue
-            if not current_path and flight.departure_time < cargo.ready_time:
-                continue
-            first_departure = current_path[0].departure_time if current_path else flight.departure_time
-            total_transit = _hours_between(first_departure, flight.arrival_time)
-            transit_limit = extended_transit_limit if extended_limit else cargo.max_transit_hours
-            if total_transit > transit_limit:
-                continue
-            dfs_alternative(current_path + [flight], extended_limit)
+def _best_routes(routes: List[RouteOption], limit: int) -> List[RouteOption]:
+    """The ``limit`` highest-margin routes, kept in search order; ties go to the earlier route."""
+    if len(routes) <= limit:
+        return routes
+    keep = heapq.nlargest(limit, range(len(routes)), key=lambda idx: routes[idx].total_margin)
+    return [routes[idx] for idx in sorted(keep)]
 
-    # Try with normal constraints first
-    dfs_alternative([])
-    # If no routes found, try with extended constraints
-    if not routes:
-        dfs_alternative([], extended_limit=True)
 
-    return routes
+# Route search over the shared schedule, installed once per catalog worker process
+_worker_search: Optional[_CatalogSearch] = None
 
 
-def _build_route_option_alternative(
-    cargo: Cargo,
-    flights: List[Flight],
-    connection_index: Dict[Tuple[str, str, Optional[str]], ConnectionRule],
-    extended_constraints: bool = False,
-) -> Optional[RouteOption]:
-    """Build route option with alternative (relaxed) constraints."""
-    if not flights:
-        return None
-    first_departure = flights[0].departure_time
-    last_arrival = flights[-1].arrival_time
+def _init_catalog_worker(
+    flights: Dict[str, Flight],
+    connection_rules: Tuple[ConnectionRule, ...],
+    max_routes: Optional[int],
+) -> None:
+    global _worker_search
+    _worker_search = _CatalogSearch(flights, connection_rules, max_routes)
 
-    transit_hours = _hours_between(first_departure, last_arrival)
-    max_transit = cargo.max_transit_hours * 1.5 if extended_constraints else cargo.max_transit_hours
-    if transit_hours > max_transit:
-        return None
 
-    dwell_by_flight: Dict[str, float] = {}
-    legs: List[RouteLeg] = []
-    prev_arrival = None
+def _catalog_routes(cargo: Cargo) -> List[RouteOption]:
+    assert _worker_search is not None, "catalog worker was not initialised"
+    return _worker_search.routes_for(cargo)
 
-    for idx, flight in enumerate(flights):
-        if idx == 0:
-            dwell = max(0.0, _hours_between(cargo.ready_time, flight.departure_time))
-            if flight.departure_time < cargo.ready_time:
-                return None
-        else:
-            connection_airport = flights[idx - 1].destination
-            rule = connection_index.get((cargo.origin, cargo.destination, connection_airport))
-            if rule is None:
-                rule = connection_index.get((cargo.origin, cargo.destination, None))
-                if rule is None:
-                    return None
-            dwell_minutes = _minutes_between(prev_arrival, flight.departure_time)
-            min_connect = max(30, rule.min_connect_minutes - 15) if extended_constraints else rule.min_connect_minutes
-            if dwell_minutes < min_connect:
-                return None
-            dwell = dwell_minutes / 60.0
-            max_connect = min(12, rule.max_connect_hours + 2) if extended_constraints else rule.max_connect_hours
-            if dwell > max_connect:
-                return None
-        dwell_by_flight[flight.flight_id] = dwell
-        legs.append(
-            RouteLeg(
-                flight=flight,
-                departure_time=flight.departure_time,
-                arrival_time=flight.arrival_time,
-                dwell_hours_before=dwell,
-            )
-        )
-        prev_arrival = flight.arrival_time
 
-    handling_cost = cargo.weight_kg * cargo.handling_cost_per_kg * len(legs)
-    operating_cost = sum(cargo.weight_kg * leg.flight.operating_cost_per_kg for leg in legs)
-    handling_penalty = sum(
-        leg.flight.handling_penalty_per_hour * leg.dwell_hours_before for leg in legs
-    )
-    total_cost = operating_cost + handling_cost + handling_penalty
+def build_route_catalog(
+    cargo_map: Dict[str, Cargo],
+    flights: Dict[str, Flight],
+    connection_rules: Iterable[ConnectionRule],
+    max_workers: int = 1,
+    max_routes_per_cargo: Optional[int] = DEFAULT_MAX_ROUTES_PER_CARGO,
+) -> Dict[str, List[RouteOption]]:
+    """Enumerate candidate routes for every cargo.
+
+    Each cargo's search is independent, so with ``max_workers`` above one
+    the cargo are spread over a process pool; the schedule is sent to each
+    worker once through the pool initializer. This is opt-in: the default
+    stays in-process, since pool start-up outweighs the search on small
+    schedules and run_ga may itself be running inside a scenario worker.
+
+    ``max_routes_per_cargo`` keeps only that many of each cargo's flown
+    routes, the highest-margin ones, ahead of its fallback option; routes
+    outside the cut are never built. None keeps every route.
+    """
+    if max_routes_per_cargo is not None and max_routes_per_cargo < 1:
+        raise ValueError(f"max_routes_per_cargo must be at least 1, got {max_routes_per_cargo}")
+    search = _CatalogSearch(flights, connection_rules, max_routes_per_cargo)
+    cargos = list(cargo_map.values())
+    workers = min(len(cargos), max_workers)
+    if workers <= 1:
+        return {cargo.cargo_id: search.routes_for(cargo) for cargo in cargos}
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_catalog_worker,
+        initargs=(flights, search.rules, search.max_routes),
+    ) as executor:
+        chunksize = max(1, len(cargos) // (workers * 4))
+        return {
+            cargo.cargo_id: routes
+            for cargo, routes in zip(cargos, executor.map(_catalog_routes, cargos, chunksize=chunksize))
+        }
+
 
-    sla_penalty = 0.0
-    if last_arrival > cargo.due_by:
-        delay_hours = _hours_between(cargo.due_by, last_arrival)
-        sla_penalty = delay_hours * cargo.sla_penalty_per_hour
+def _generate_alternative_routes(
+    cargo: Cargo,
+    flights_by_origin: Dict[str, List[Flight]],
+    departures_by_origin: Dict[str, List[float]],
+    connection_rules: Tuple[ConnectionRule, ...],
+    earliest: _EarliestArrivals,
+    limit: Optional[int] = None,
+) -> List[RouteOption]:
+    """Generate alternative routes for medium/high priority cargo with relaxed constraints."""
+    # Try with normal constraints first, allowing longer (five-leg) routes
+    paths = _search_paths(
+        cargo, flights_by_origin, departures_by_origin, earliest, cargo.max_transit_hours, 5
+    )
+    routes = _route_options_for(cargo, tuple(paths), connection_rules, False, limit)
+    # If no routes found, try with extended transit time (up to 50% more than max_transit_hours)
+    if not routes:
+        paths = _search_paths(
+            cargo, flights_by_origin, departures_by_origin, earliest, cargo.max_transit_hours * 1.5, 5
+        )
+        routes = _route_options_for(cargo, tuple(paths), connection_rules, True, limit)
+
+    return list(routes)
+
+
+def _leg_candidates(cargo: Cargo, route: RouteOption) -> Tuple[FlightCargoCandidate, ...]:
+    """Knapsack candidate for each leg of ``route``, in leg order."""
+    legs_count = max(1, len(route.legs))
+    leg_margin = route.total_margin / legs_count
+    leg_revenue = cargo.revenue_inr / legs_count
+    priority_score = PRIORITY_SCORES.get(cargo.priority, 1)
+    return tuple(
+        FlightCargoCandidate(
+            cargo=cargo,
+            margin=leg_margin,
+            revenue=leg_revenue,
+            weight_kg=cargo.weight_kg,
+            volume_m3=cargo.volume_m3,
+            revenue_density=revenue_density,
+            priority_score=priority_score,
+            dwell_hours=leg.dwell_hours_before,
+        )
+        for leg, revenue_density in zip(route.legs, route.revenue_density_by_leg)
+    )
 
-    total_margin = cargo.revenue_inr - total_cost - sla_penalty
 
-    revenue_density_by_flight: Dict[str, float] = {}
-    for leg in legs:
-        weight_ratio = cargo.weight_kg / leg.flight.weight_capacity_kg
-        volume_ratio = cargo.volume_m3 / leg.flight.volume_capacity_m3
-        bottleneck = max(weight_ratio, volume_ratio, 1e-6)
-        revenue_density_by_flight[leg.flight.flight_id] = cargo.revenue_inr / bottleneck
+@dataclass(frozen=True)
+class _CatalogColumns:
+    """A run's route catalog flattened in gene order.
+
+    Cargo ``i``'s options are ``routes[offsets[i]:offsets[i] + counts[i]]``,
+    so a whole individual maps to its routes with one array expression.
+    ``leg_candidates`` runs parallel to ``routes`` and holds each route's
+    per-leg knapsack candidates, built once instead of once per individual.
+
+    ``selections`` memoizes flight loads across the whole population:
+    individuals differ in a few genes, so most of them put the same cargo
+    in front of a flight as some earlier individual did. It is keyed by the
+    flight and the identities of the waiting candidates, which all live in
+    ``leg_candidates`` for as long as the memo does.
+    """
+
+    routes: Tuple[RouteOption, ...]
+    leg_candidates: Tuple[Tuple[FlightCargoCandidate, ...], ...]
+    offsets: np.ndarray
+    counts: np.ndarray
+    selections: Dict[Tuple[str, Tuple[int, ...]], Tuple[FlightSelection, FrozenSet[str]]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
-    rollover_penalty = cargo.sla_penalty_per_hour * 4 + cargo.weight_kg * cargo.handling_cost_per_kg
+    def chosen_indices(self, individual: Sequence[int]) -> List[int]:
+        """Index into ``routes`` of the route each gene selects, in cargo order."""
+        return (self.offsets + np.asarray(individual, dtype=np.int64) % self.counts).tolist()
 
-    notes = "Alternative route"
-    if extended_constraints:
-        notes += " (extended constraints)"
 
-    return RouteOption(
-        cargo_id=cargo.cargo_id,
-        legs=tuple(legs),
-        total_cost=total_cost,
-        handling_penalty=handling_penalty,
-        sla_penalty=sla_penalty,
-        total_margin=total_margin,
-        total_revenue=cargo.revenue_inr,
-        transit_hours=transit_hours,
-        arrival_time=last_arrival,
-        departure_time=first_departure,
-        revenue_density_by_flight=revenue_density_by_flight,
-        dwell_by_flight=dwell_by_flight,
-        rollover_penalty=rollover_penalty,
-        feasible=True,
-        notes=notes,
+def _catalog_columns(
+    cargo_ids: Sequence[str], catalog: Dict[str, List[RouteOption]], cargo_map: Dict[str, Cargo]
+) -> _CatalogColumns:
+    counts = np.fromiter(
+        (len(catalog[cargo_id]) for cargo_id in cargo_ids), dtype=np.int64, count=len(cargo_ids)
     )
+    offsets = np.zeros(len(cargo_ids), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+    routes = tuple(route for cargo_id in cargo_ids for route in catalog[cargo_id])
+    leg_candidates = tuple(
+        _leg_candidates(cargo_map[cargo_id], route) for cargo_id in cargo_ids for route in catalog[cargo_id]
+    )
+    return _CatalogColumns(routes=routes, leg_candidates=leg_candidates, offsets=offsets, counts=counts)
 
 
-def _prepare_candidate(state: _CargoState, flight_id: str) -> FlightCargoCandidate:
-    legs_count = max(1, len(state.route.legs))
-    leg_margin = state.route.total_margin / legs_count
-    leg_revenue = state.cargo.revenue_inr / legs_count
-    dwell = state.route.dwell_by_flight.get(flight_id, 0.0)
-    revenue_density = state.route.revenue_density_by_flight.get(flight_id, 0.0)
-    priority_score = PRIORITY_SCORES.get(state.cargo.priority, 1)
-    return FlightCargoCandidate(
-        cargo=state.cargo,
-        margin=leg_margin,
-        revenue=leg_revenue,
-        weight_kg=state.cargo.weight_kg,
-        volume_m3=state.cargo.volume_m3,
-        revenue_density=revenue_density,
-        priority_score=priority_score,
-        dwell_hours=dwell,
-    )
+def _departure_order(flights: Dict[str, Flight]) -> Tuple[Flight, ...]:
+    return tuple(sorted(flights.values(), key=lambda f: f.departure_ts))
 
 
 def _simulate_solution(
@@ -456,15 +818,27 @@ def _simulate_solution(
     catalog: Dict[str, List[RouteOption]],
     flights: Dict[str, Flight],
     individual: List[int],
+    flight_sequence: Optional[Sequence[Flight]] = None,
+    emergency_routes: Optional[_EmergencyRoutes] = None,
+    columns: Optional[_CatalogColumns] = None,
 ) -> GAResult:
+    """Load one GA individual's route choices onto the flights and score the plan.
+
+    ``flight_sequence`` is the flights in departure order, ``emergency_routes``
+    the memo of forced routes for priority cargo and ``columns`` the
+    catalog flattened for ``cargo_ids``; the GA builds them once per run and
+    passes them in rather than rebuilding them per individual.
+    """
     total_margin = 0.0
     assignments: Dict[str, CargoAssignment] = {}
     cargo_states: Dict[str, _CargoState] = {}
 
-    for idx, cargo_id in enumerate(cargo_ids):
+    if columns is None:
+        columns = _catalog_columns(cargo_ids, catalog, cargo_map)
+    routes = columns.routes
+    for cargo_id, index in zip(cargo_ids, columns.chosen_indices(individual)):
+        route = routes[index]
         cargo = cargo_map[cargo_id]
-        options = catalog[cargo_id]
-        route = options[individual[idx] % len(options)]
         if not route.legs:
             total_margin += route.total_margin
             if cargo.priority == "High":
@@ -481,31 +855,38 @@ def _simulate_solution(
                 reason=reason,
             )
         else:
-            cargo_states[cargo_id] = _CargoState(cargo=cargo, route=route)
+            cargo_states[cargo_id] = _CargoState(
+                cargo=cargo, route=route, leg_candidates=columns.leg_candidates[index]
+            )
 
-    flight_sequence = sorted(flights.values(), key=lambda f: f.departure_time)
+    if flight_sequence is None:
+        flight_sequence = _departure_order(flights)
     flight_loads: Dict[str, FlightSelection] = {}
 
-    for flight in flight_sequence:
-        waitlist: List[Tuple[_CargoState, FlightCargoCandidate]] = []
-        for state in cargo_states.values():
-            if state.status != "pending":
-                continue
-            if state.next_leg_index >= len(state.route.legs):
-                continue
-            leg = state.route.legs[state.next_leg_index]
-            if leg.flight.flight_id != flight.flight_id:
-                continue
-            waitlist.append((state, _prepare_candidate(state, flight.flight_id)))
+    # Pending cargo bucketed by the flight of their next leg. Each entry keeps
+    # the cargo's position so a waitlist is served in cargo order, exactly as
+    # a scan over every state would find them.
+    pending_by_flight: Dict[str, List[Tuple[int, _CargoState]]] = {}
+    for position, state in enumerate(cargo_states.values()):
+        pending_by_flight.setdefault(state.route.legs[0].flight.flight_id, []).append((position, state))
 
-        if not waitlist:
+    for flight in flight_sequence:
+        pending = pending_by_flight.pop(flight.flight_id, None)
+        if not pending:
             continue
-
-        selection = select_best_cargo(flight, [item[1] for item in waitlist])
+        pending.sort(key=lambda entry: entry[0])
+        candidates = [state.leg_candidates[state.next_leg_index] for _, state in pending]
+
+        key = (flight.flight_id, tuple(map(id, candidates)))
+        loaded = columns.selections.get(key)
+        if loaded is None:
+            selection = select_best_cargo(flight, candidates)
+            loaded = (selection, frozenset(candidate.cargo.cargo_id for candidate in selection.selected))
+            columns.selections[key] = loaded
+        selection, selected_ids = loaded
         flight_loads[flight.flight_id] = selection
-        selected_ids = {candidate.cargo.cargo_id for candidate in selection.selected}
 
-        for state, candidate in waitlist:
+        for position, state in pending:
             cargo_id = state.cargo.cargo_id
             if cargo_id in selected_ids:
                 state.next_leg_index += 1
@@ -513,6 +894,9 @@ def _simulate_solution(
                     state.status = "delivered"
                     state.accumulated_margin = state.route.total_margin
                     total_margin += state.route.total_margin
+                else:
+                    next_flight_id = state.route.legs[state.next_leg_index].flight.flight_id
+                    pending_by_flight.setdefault(next_flight_id, []).append((position, state))
             else:
                 state.status = "rolled"
                 state.penalty += state.route.rollover_penalty
@@ -522,7 +906,9 @@ def _simulate_solution(
                 total_margin -= state.route.rollover_penalty
 
     # Post-processing: Ensure high-priority cargo is never denied
-    _ensure_priority_cargo_assignment(cargo_states, assignments, total_margin, flights)
+    if emergency_routes is None:
+        emergency_routes = _EmergencyRoutes(flights)
+    _ensure_priority_cargo_assignment(cargo_states, assignments, total_margin, flights, emergency_routes)
 
     for cargo_id, state in cargo_states.items():
         if state.status == "pending":
@@ -549,7 +935,7 @@ def _simulate_solution(
             )
 
     # FINAL SAFETY CHECK: Absolutely ensure no high/medium priority cargo is denied
-    _final_priority_safety_check(cargo_states, assignments, total_margin, flights)
+    _final_priority_safety_check(cargo_states, assignments, total_margin, flights, emergency_routes)
 
     return GAResult(
         total_margin=total_margin,
@@ -563,21 +949,30 @@ def _final_priority_safety_check(
     assignments: Dict[str, CargoAssignment],
     total_margin: float,
     flights: Dict[str, Flight],
+    emergency_routes: Optional[_EmergencyRoutes] = None,
 ) -> None:
     """ABSOLUTE FINAL CHECK: High and Medium priority cargo MUST NEVER be denied."""
+    if emergency_routes is None:
+        emergency_routes = _EmergencyRoutes(flights)
     denied_high_medium = []
 
     # Check for any denied high/medium priority cargo
     for cargo_id, assignment in assignments.items():
-        if assignment.status in ["denied", "rolled"] and assignment.cargo.priority in ["High", "Medium"]:
+        if assignment.status in PROBLEM_STATUSES and assignment.cargo.priority in ["High", "Medium"]:
             denied_high_medium.append((cargo_id, assignment))
 
-    # Force reassignment of any denied high/medium priority cargo
+    # Force reassignment of any denied high/medium priority cargo. Every GA
+    # individual passes through here, so this is one debug record per
+    # simulation, formatted only when that level is enabled.
+    if denied_high_medium:
+        logger.debug(
+            "EMERGENCY: forcing reassignment of %d denied high/medium priority cargo: %s",
+            len(denied_high_medium),
+            [cargo_id for cargo_id, _ in denied_high_medium],
+        )
     for cargo_id, assignment in denied_high_medium:
-        print(f"EMERGENCY: {assignment.cargo.priority} priority cargo {cargo_id} was denied. FORCING REASSIGNMENT.")
-
         # Create emergency assignment
-        emergency_route = _create_emergency_route(assignment.cargo, flights)
+        emergency_route = emergency_routes.route_for(assignment.cargo)
         total_margin += emergency_route.total_margin - assignment.margin  # Adjust margin
 
         # Update assignment
@@ -600,8 +995,11 @@ def _ensure_priority_cargo_assignment(
     assignments: Dict[str, CargoAssignment],
     total_margin: float,
     flights: Dict[str, Flight],
+    emergency_routes: Optional[_EmergencyRoutes] = None,
 ) -> None:
     """Ensure high and medium priority cargo are never denied."""
+    if emergency_routes is None:
+        emergency_routes = _EmergencyRoutes(flights)
     high_priority_pending = []
     medium_priority_pending = []
 
@@ -616,7 +1014,7 @@ def _ensure_priority_cargo_assignment(
     # Handle high-priority cargo first - they must be assigned
     for cargo_id, state in high_priority_pending:
         # Create emergency route for high-priority cargo that couldn't be assigned
-        emergency_route = _create_emergency_route(state.cargo, flights)
+        emergency_route = emergency_routes.route_for(state.cargo)
         state.status = "delivered"
         state.accumulated_margin = emergency_route.total_margin
         total_margin += emergency_route.total_margin
@@ -631,7 +1029,7 @@ def _ensure_priority_cargo_assignment(
     # Handle medium-priority cargo - try to find alternative assignments
     for cargo_id, state in medium_priority_pending:
         # Create emergency route for medium-priority cargo that couldn't be assigned
-        emergency_route = _create_emergency_route(state.cargo, flights)
+        emergency_route = emergency_routes.route_for(state.cargo)
         state.status = "delivered"
         state.accumulated_margin = emergency_route.total_margin
         total_margin += emergency_route.total_margin
@@ -644,139 +1042,121 @@ def _ensure_priority_cargo_assignment(
         )
 
 
-def _find_emergency_flights(cargo: Cargo, flights: Dict[str, Flight]) -> List[Flight]:
+def _find_emergency_flights(
+    cargo: Cargo, flights: Dict[str, Flight], graph: Optional[_AirportGraph] = None
+) -> List[Flight]:
     """Find available flights for emergency assignment of high-priority cargo."""
-    available_flights = []
-    flights_by_origin = {}
-
-    # Group flights by origin
-    for flight in flights.values():
-        if flight.departure_time >= cargo.ready_time:
-            flights_by_origin.setdefault(flight.origin, []).append(flight)
-
-    # Sort flights by departure time for each origin
-    for origin in flights_by_origin:
-        flights_by_origin[origin].sort(key=lambda f: f.departure_time)
-
-    # Try to find a direct flight first with relaxed capacity constraints
-    if cargo.origin in flights_by_origin:
-        for flight in flights_by_origin[cargo.origin]:
-            if flight.destination == cargo.destination:
-                # Check if flight has enough capacity (relaxed buffer for emergency)
-                weight_ratio = cargo.weight_kg / flight.weight_capacity_kg
-                volume_ratio = cargo.volume_m3 / flight.volume_capacity_m3
-                if max(weight_ratio, volume_ratio) <= 0.95:  # Leave only 5% buffer for emergency
-                    available_flights.append(flight)
-                    break
-
-    # If no direct flight found, try multi-leg routes with relaxed constraints
-    if not available_flights:
-        # Simple BFS to find shortest path
-        visited = set()
-        queue = [(cargo.origin, [])]  # (current_airport, path)
-
-        while queue:
-            current_airport, path = queue.pop(0)
-            if current_airport in visited:
+    flights_by_origin, departures_by_origin = graph if graph is not None else _airport_graph(flights)
+
+    def departures_from(airport: str) -> Iterable[Flight]:
+        # Flights out of ``airport`` that leave once the cargo is ready
+        flight_list = flights_by_origin.get(airport)
+        if not flight_list:
+            return ()
+        return islice(flight_list, bisect_left(departures_by_origin[airport], cargo.ready_ts), None)
+
+    # One pass over the origin's departures finds the first direct flight
+    # with room to spare (relaxed 5% buffer for emergency), the roomiest
+    # direct flight and the roomiest flight overall
+    direct_fit: Optional[Flight] = None
+    best_direct: Optional[Flight] = None
+    best_any: Optional[Flight] = None
+    best_direct_ratio = best_any_ratio = float('inf')
+    for flight in departures_from(cargo.origin):
+        weight_ratio = cargo.weight_kg / flight.weight_capacity_kg
+        volume_ratio = cargo.volume_m3 / flight.volume_capacity_m3
+        max_ratio = max(weight_ratio, volume_ratio)
+        if flight.destination == cargo.destination:
+            if max_ratio <= 0.95:
+                direct_fit = flight
+                break
+            if max_ratio < best_direct_ratio:
+                best_direct_ratio = max_ratio
+                best_direct = flight
+        if max_ratio < best_any_ratio:
+            best_any_ratio = max_ratio
+            best_any = flight
+
+    if direct_fit is not None:
+        return [direct_fit]
+    if best_direct is not None:
+        # A multi-leg search would reach the destination first through a
+        # direct flight, none of which has room, so take the roomiest one
+        return [best_direct]
+
+    # No direct flight: BFS over airports for the fewest-legs path; each
+    # airport remembers the flight it was first reached by and the path is
+    # rebuilt from those
+    parents: Dict[str, Tuple[str, Flight]] = {}
+    seen = {cargo.origin}
+    queue = deque([cargo.origin])
+    while queue and cargo.destination not in parents:
+        current_airport = queue.popleft()
+        for flight in departures_from(current_airport):
+            next_airport = flight.destination
+            if next_airport in seen:
                 continue
-            visited.add(current_airport)
-
-            if current_airport == cargo.destination and path:
-                # Check if we can accommodate the cargo on these flights (relaxed constraints)
-                can_accommodate = True
-                for flight in path:
-                    weight_ratio = cargo.weight_kg / flight.weight_capacity_kg
-                    volume_ratio = cargo.volume_m3 / flight.volume_capacity_m3
-                    if max(weight_ratio, volume_ratio) > 0.95:  # Leave only 5% buffer
-                        can_accommodate = False
-                        break
-
-                if can_accommodate:
-                    available_flights = path
-                    break
-
-            # Add neighboring flights
-            if current_airport in flights_by_origin:
-                for flight in flights_by_origin[current_airport]:
-                    if flight.flight_id not in {f.flight_id for f in path}:
-                        new_path = path + [flight]
-                        queue.append((flight.destination, new_path))
-
-    # If still no flights found, find the best available flight regardless of capacity
-    if not available_flights:
-        best_flight = None
-        best_capacity_ratio = float('inf')
-
-        # Look for any flight from origin to destination
-        if cargo.origin in flights_by_origin:
-            for flight in flights_by_origin[cargo.origin]:
-                if flight.destination == cargo.destination:
-                    # Find flight with most available capacity
-                    weight_ratio = cargo.weight_kg / flight.weight_capacity_kg
-                    volume_ratio = cargo.volume_m3 / flight.volume_capacity_m3
-                    max_ratio = max(weight_ratio, volume_ratio)
-
-                    if max_ratio < best_capacity_ratio:
-                        best_capacity_ratio = max_ratio
-                        best_flight = flight
-
-        # If no direct flight found, find any flight from origin (we'll route through connections)
-        if not best_flight and cargo.origin in flights_by_origin:
-            for flight in flights_by_origin[cargo.origin]:
-                # Find flight with most available capacity
-                weight_ratio = cargo.weight_kg / flight.weight_capacity_kg
-                volume_ratio = cargo.volume_m3 / flight.volume_capacity_m3
-                max_ratio = max(weight_ratio, volume_ratio)
-
-                if max_ratio < best_capacity_ratio:
-                    best_capacity_ratio = max_ratio
-                    best_flight = flight
-
-        if best_flight:
-            available_flights = [best_flight]
-
-    return available_flights
-
-
-def _create_emergency_route(cargo: Cargo, flights: Dict[str, Flight]) -> RouteOption:
+            seen.add(next_airport)
+            parents[next_airport] = (current_airport, flight)
+            if next_airport == cargo.destination:
+                break
+            queue.append(next_airport)
+
+    if cargo.destination in parents:
+        path: List[Flight] = []
+        airport = cargo.destination
+        while airport != cargo.origin:
+            airport, flight = parents[airport]
+            path.append(flight)
+        path.reverse()
+
+        # Check if we can accommodate the cargo on these flights (relaxed constraints)
+        if all(
+            max(cargo.weight_kg / flight.weight_capacity_kg, cargo.volume_m3 / flight.volume_capacity_m3) <= 0.95
+            for flight in path
+        ):
+            return path
+
+    # Otherwise the roomiest flight out of the origin (we'll route through connections)
+    return [best_any] if best_any is not None else []
+
+
+def _create_emergency_route(
+    cargo: Cargo, flights: Dict[str, Flight], graph: Optional[_AirportGraph] = None
+) -> RouteOption:
     """Create an emergency route for high-priority cargo with actual flight assignments."""
     penalty = cargo.sla_penalty_per_hour * 8 + cargo.weight_kg * cargo.handling_cost_per_kg
     now = cargo.ready_time
 
     # Find available flights for emergency assignment
-    emergency_flights = _find_emergency_flights(cargo, flights)
+    emergency_flights = _find_emergency_flights(cargo, flights, graph)
 
     if emergency_flights:
         # Create route with actual flights
         legs = []
         total_cost = 0.0
         handling_penalty = 0.0
-        dwell_by_flight = {}
-        revenue_density_by_flight = {}
+        revenue_density_by_leg = []
 
-        # Check if any flight exceeds capacity (emergency override)
+        # Set if any flight exceeds capacity (emergency override)
         has_capacity_override = False
-        for flight in emergency_flights:
-            weight_ratio = cargo.weight_kg / flight.weight_capacity_kg
-            volume_ratio = cargo.volume_m3 / flight.volume_capacity_m3
-            if max(weight_ratio, volume_ratio) > 1.0:
-                has_capacity_override = True
-                break
 
         for flight in emergency_flights:
-            dwell = max(0.0, _hours_between(cargo.ready_time, flight.departure_time))
-            dwell_by_flight[flight.flight_id] = dwell
+            dwell = max(0.0, _hours_between(cargo.ready_ts, flight.departure_ts))
 
             # Calculate costs
             operating_cost = cargo.weight_kg * flight.operating_cost_per_kg
             total_cost += operating_cost
             handling_penalty += flight.handling_penalty_per_hour * dwell
 
-            # Calculate revenue density
+            # Capacity share of the leg, which gives both the override check
+            # and the revenue density
             weight_ratio = cargo.weight_kg / flight.weight_capacity_kg
             volume_ratio = cargo.volume_m3 / flight.volume_capacity_m3
+            if max(weight_ratio, volume_ratio) > 1.0:
+                has_capacity_override = True
             bottleneck = max(weight_ratio, volume_ratio, 1e-6)
-            revenue_density_by_flight[flight.flight_id] = cargo.revenue_inr / bottleneck
+            revenue_density_by_leg.append(cargo.revenue_inr / bottleneck)
 
             legs.append(RouteLeg(
                 flight=flight,
@@ -804,11 +1184,10 @@ def _create_emergency_route(cargo: Cargo, flights: Dict[str, Flight]) -> RouteOp
             sla_penalty=penalty,
             total_margin=total_margin,
             total_revenue=cargo.revenue_inr,
-            transit_hours=_hours_between(emergency_flights[0].departure_time, emergency_flights[-1].arrival_time),
+            transit_hours=_hours_between(emergency_flights[0].departure_ts, emergency_flights[-1].arrival_ts),
             arrival_time=emergency_flights[-1].arrival_time,
             departure_time=emergency_flights[0].departure_time,
-            revenue_density_by_flight=revenue_density_by_flight,
-            dwell_by_flight=dwell_by_flight,
+            revenue_density_by_leg=tuple(revenue_density_by_leg),
             rollover_penalty=penalty,
             feasible=True,
             notes=notes,
@@ -826,28 +1205,58 @@ def _create_emergency_route(cargo: Cargo, flights: Dict[str, Flight]) -> RouteOp
             transit_hours=0.0,
             arrival_time=now,
             departure_time=now,
-            revenue_density_by_flight={},
-            dwell_by_flight={},
+            revenue_density_by_leg=(),
             rollover_penalty=penalty,
             feasible=False,
             notes="Emergency route - no flights available, requires manual intervention",
         )
 
 
+class _EmergencyRoutes:
+    """Emergency routes over one schedule, built once per cargo on first request.
+
+    A forced route depends only on the cargo and the schedule, so every GA
+    individual that has to force the same cargo through shares it.
+    """
+
+    __slots__ = ("flights", "_graph", "_routes")
+
+    def __init__(self, flights: Dict[str, Flight]) -> None:
+        self.flights = flights
+        self._graph: Optional[_AirportGraph] = None
+        self._routes: Dict[str, RouteOption] = {}
+
+    def route_for(self, cargo: Cargo) -> RouteOption:
+        route = self._routes.get(cargo.cargo_id)
+        if route is None:
+            if self._graph is None:
+                self._graph = _airport_graph(self.flights)
+            route = _create_emergency_route(cargo, self.flights, self._graph)
+            self._routes[cargo.cargo_id] = route
+        return route
+
+
 def _tournament_select(
     population: List[List[int]],
     fitnesses: List[float],
+    rng: random.Random,
     tournament_size: int = 3,
 ) -> List[int]:
-    contenders = random.sample(range(len(population)), k=min(tournament_size, len(population)))
-    best_idx = max(contenders, key=lambda idx: fitnesses[idx])
-    return population[best_idx][:]
+    """The fittest of ``tournament_size`` distinct random individuals.
+
+    The winner is returned as is, not copied: _crossover always hands back
+    new lists, so parents are never modified.
+    """
+    contenders = rng.sample(range(len(population)), k=min(tournament_size, len(population)))
+    return population[max(contenders, key=fitnesses.__getitem__)]
 
 
-def _crossover(parent1: List[int], parent2: List[int], crossover_rate: float) -> Tuple[List[int], List[int]]:
-    if len(parent1) <= 1 or random.random() >= crossover_rate:
+def _crossover(
+    parent1: List[int], parent2: List[int], crossover_rate: float, rng: random.Random
+) -> Tuple[List[int], List[int]]:
+    if len(parent1) <= 1 or rng.random() >= crossover_rate:
         return parent1[:], parent2[:]
-    point = random.randint(1, len(parent1) - 1)
+    point = rng.randint(1, len(parent1) - 1)
     child1 = parent1[:point] + parent2[point:]
     child2 = parent2[:point] + parent1[point:]
     return child1, child2
@@ -855,15 +1264,71 @@ def _crossover(parent1: List[int], parent2: List[int], crossover_rate: float) ->
 
 def _mutate(
     individual: List[int],
-    catalog: Dict[str, List[RouteOption]],
-    cargo_ids: List[str],
+    option_counts: Sequence[int],
     mutation_rate: float,
+    rng: random.Random,
+) -> None:
+    """Redraw each gene with probability ``mutation_rate``; gene ``i`` has ``option_counts[i]`` routes."""
+    draw = rng.random
+    for idx, options in enumerate(option_counts):
+        if draw() < mutation_rate and options:
+            individual[idx] = rng.randrange(options)
+
+
+# Smallest population worth farming out to a process pool; below it pool
+# start-up costs more than the evaluations
+_MIN_POOL_POPULATION = 8
+
+# Everything a fitness evaluation reads besides the individual, installed once
+# per GA worker process
+_fitness_inputs: Optional[
+    Tuple[
+        List[str],
+        Dict[str, Cargo],
+        Dict[str, List[RouteOption]],
+        Dict[str, Flight],
+        Tuple[Flight, ...],
+        _EmergencyRoutes,
+        _CatalogColumns,
+    ]
+] = None
+
+# The population as a (individual, gene) matrix in shared memory: the parent
+# writes each generation into it and tasks only name a row range
+_fitness_genes: Optional[np.ndarray] = None
+_fitness_genes_block: Optional[shared_memory.SharedMemory] = None
+
+
+def _init_fitness_worker(
+    cargo_ids: List[str],
+    cargo_map: Dict[str, Cargo],
+    catalog: Dict[str, List[RouteOption]],
+    flights: Dict[str, Flight],
+    flight_sequence: Tuple[Flight, ...],
+    emergency_routes: _EmergencyRoutes,
+    columns: _CatalogColumns,
+    genes_name: str,
+    genes_shape: Tuple[int, int],
 ) -> None:
-    for idx, cargo_id in enumerate(cargo_ids):
-        if random.random() < mutation_rate:
-            options = catalog[cargo_id]
-            if options:
-                individual[idx] = random.randrange(len(options))
+    global _fitness_inputs, _fitness_genes, _fitness_genes_block
+    _fitness_inputs = (cargo_ids, cargo_map, catalog, flights, flight_sequence, emergency_routes, columns)
+    # Pool workers share the parent's resource tracker, and the parent
+    # unlinks the block once the pool is shut down
+    _fitness_genes_block = shared_memory.SharedMemory(name=genes_name)
+    _fitness_genes = np.ndarray(genes_shape, dtype=np.int32, buffer=_fitness_genes_block.buf)
+
+
+def _population_fitness(rows: Tuple[int, int]) -> List[float]:
+    """Margins of the individuals in gene-matrix rows ``[start, stop)``."""
+    assert _fitness_inputs is not None and _fitness_genes is not None, "fitness worker was not initialised"
+    cargo_ids, cargo_map, catalog, flights, flight_sequence, emergency_routes, columns = _fitness_inputs
+    start, stop = rows
+    return [
+        _simulate_solution(
+            cargo_ids, cargo_map, catalog, flights, individual, flight_sequence, emergency_routes, columns
+        ).total_margin
+        for individual in _fitness_genes[start:stop].tolist()
+    ]
 
 
 def run_ga(
@@ -875,54 +1340,149 @@ def run_ga(
     crossover_rate: float = 0.8,
     mutation_rate: float = 0.15,
     seed: Optional[int] = 42,
+    max_workers: Optional[int] = 1,
+    max_routes_per_cargo: Optional[int] = DEFAULT_MAX_ROUTES_PER_CARGO,
+    pool: Literal["process", "thread"] = "process",
 ) -> GAResult:
-    if seed is not None:
-        random.seed(seed)
-
-    catalog = build_route_catalog(cargo_map, flights, connection_rules)
+    """Evolve route choices for every cargo and return the best plan found.
+
+    Each distinct genome is simulated once per run; repeats reuse its
+    margin, and the winning genome is simulated once more at the end for
+    its full plan.
+
+    With ``max_workers`` above one (None means one per CPU), each
+    generation's new genomes are scored on a process pool. They are written
+    to a shared-memory gene matrix, so a task carries only a row range and
+    workers return margins only.
+    Evolution itself, and so the random stream, stays in this process.
+    Populations below ``_MIN_POOL_POPULATION`` are always evaluated
+    in-process. ``max_routes_per_cargo`` is passed to build_route_catalog.
+
+    ``pool="thread"`` evaluates on a thread pool instead: the threads read
+    the run's data in place, with nothing pickled or copied, at the cost of
+    sharing the GIL. The pool is created once and reused every generation.
+    """
+    if pool not in ("process", "thread"):
+        raise ValueError(f"Unknown fitness pool {pool!r}; expected 'process' or 'thread'")
+    # The run draws from its own generator rather than reseeding the
+    # module-level one, which is shared with the rest of the process
+    rng = random.Random(seed)
+
+    catalog = build_route_catalog(
+        cargo_map, flights, connection_rules, max_routes_per_cargo=max_routes_per_cargo
+    )
     cargo_ids = sorted(catalog.keys())
 
     if not cargo_ids:
         return GAResult(total_margin=0.0, assignments={}, flight_loads={})
 
+    flight_sequence = _departure_order(flights)
+    emergency_routes = _EmergencyRoutes(flights)
+    columns = _catalog_columns(cargo_ids, catalog, cargo_map)
+    option_counts = columns.counts.tolist()
+
     def evaluate(individual: List[int]) -> GAResult:
-        return _simulate_solution(cargo_ids, cargo_map, catalog, flights, individual)
+        return _simulate_solution(
+            cargo_ids, cargo_map, catalog, flights, individual, flight_sequence, emergency_routes, columns
+        )
 
-    population: List[List[int]] = []
-    for _ in range(population_size):
-        genes = [random.randrange(len(catalog[cargo_id])) for cargo_id in cargo_ids]
-        population.append(genes)
+    randrange = rng.randrange
+    population: List[List[int]] = [
+        [randrange(options) for options in option_counts] for _ in range(population_size)
+    ]
 
-    best_result: Optional[GAResult] = None
+    # Margins by genome for the whole run. Elitism, selection and sparse
+    # mutation keep producing genomes already scored, and a simulation is
+    # deterministic, so each distinct genome is simulated only once.
+    fitness_cache: Dict[Tuple[int, ...], float] = {}
+    best_individual: Optional[List[int]] = None
     best_fitness = float("-inf")
 
-    for _ in range(generations):
-        fitnesses: List[float] = []
-        evaluated: List[GAResult] = []
-        for individual in population:
-            result = evaluate(individual)
-            evaluated.append(result)
-            fitnesses.append(result.total_margin)
-            if result.total_margin > best_fitness:
-                best_fitness = result.total_margin
-                best_result = result
-
-        new_population: List[List[int]] = []
-        best_idx = max(range(len(population)), key=lambda i: fitnesses[i])
-        new_population.append(population[best_idx][:])
-
-        while len(new_population) < population_size:
-            parent1 = _tournament_select(population, fitnesses)
-            parent2 = _tournament_select(population, fitnesses)
-            child1, child2 = _crossover(parent1, parent2, crossover_rate)
-            _mutate(child1, catalog, cargo_ids, mutation_rate)
-            _mutate(child2, catalog, cargo_ids, mutation_rate)
-            new_population.append(child1)
-            if len(new_population) < population_size:
-                new_population.append(child2)
-        population = new_population
-
-    if best_result is None:
-        best_result = evaluate(population[0])
-
-    return best_result
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = min(population_size, max_workers) if population_size >= _MIN_POOL_POPULATION else 1
+    executor: Optional[ProcessPoolExecutor] = None
+    threads: Optional[ThreadPoolExecutor] = None
+    genes_block: Optional[shared_memory.SharedMemory] = None
+    if workers > 1 and pool == "thread":
+        threads = ThreadPoolExecutor(max_workers=workers)
+    elif workers > 1:
+        genes_shape = (population_size, len(cargo_ids))
+        genes_block = shared_memory.SharedMemory(create=True, size=population_size * len(cargo_ids) * 4)
+        genes = np.ndarray(genes_shape, dtype=np.int32, buffer=genes_block.buf)
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_fitness_worker,
+            initargs=(
+                cargo_ids,
+                cargo_map,
+                catalog,
+                flights,
+                flight_sequence,
+                emergency_routes,
+                columns,
+                genes_block.name,
+                genes_shape,
+            ),
+        )
+
+    def margin(genome: Tuple[int, ...]) -> float:
+        return evaluate(genome).total_margin
+
+    try:
+        for _ in range(generations):
+            genomes = [tuple(individual) for individual in population]
+            unscored = list(dict.fromkeys(genome for genome in genomes if genome not in fitness_cache))
+            scored: Iterable[float]
+            if threads is not None:
+                scored = threads.map(margin, unscored)
+            elif executor is not None and unscored:
+                count = len(unscored)
+                genes[:count] = unscored
+                batch = max(1, count // (workers * 4))
+                row_ranges = [(start, min(start + batch, count)) for start in range(0, count, batch)]
+                scored = (
+                    fitness
+                    for batch_fitnesses in executor.map(_population_fitness, row_ranges)
+                    for fitness in batch_fitnesses
+                )
+            else:
+                scored = map(margin, unscored)
+            fitness_cache.update(zip(unscored, scored))
+            fitnesses = [fitness_cache[genome] for genome in genomes]
+
+            for idx, fitness in enumerate(fitnesses):
+                if fitness > best_fitness:
+                    best_fitness = fitness
+                    best_individual = population[idx]
+
+            # Genomes are never modified once in a population (mutation only
+            # touches the fresh lists _crossover returns), so the elite is
+            # carried over as is
+            new_population: List[List[int]] = []
+            best_idx = max(range(len(population)), key=fitnesses.__getitem__)
+            new_population.append(population[best_idx])
+
+            while len(new_population) < population_size:
+                parent1 = _tournament_select(population, fitnesses, rng)
+                parent2 = _tournament_select(population, fitnesses, rng)
+                child1, child2 = _crossover(parent1, parent2, crossover_rate, rng)
+                _mutate(child1, option_counts, mutation_rate, rng)
+                _mutate(child2, option_counts, mutation_rate, rng)
+                new_population.append(child1)
+                if len(new_population) < population_size:
+                    new_population.append(child2)
+            population = new_population
+    finally:
+        if threads is not None:
+            threads.shutdown()
+        if executor is not None:
+            executor.shutdown()
+        if genes_block is not None:
+            del genes
+            genes_block.close()
+            genes_block.unlink()
+
+    # Only margins are kept per genome, so the winner is simulated once more
+    # for its full plan
+    return evaluate(best_individual if best_individual is not None else population[0])
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import combinations
-from typing import Iterable, List, Sequence, Tuple
+from itertools import chain, combinations
+from typing import Callable, Iterable, List, Tuple
 
 try:
     # When running as part of the FastAPI app
@@ -12,7 +12,9 @@ except ImportError:
     from load_data import Cargo, Flight
 
 
-@dataclass(frozen=True)
+# Candidates and selections are created per flight load, so both are slotted
+# to keep each instance small and cheap to build
+@dataclass(frozen=True, slots=True)
 class FlightCargoCandidate:
     cargo: Cargo
     margin: float
@@ -24,7 +26,7 @@ class FlightCargoCandidate:
     dwell_hours: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlightSelection:
     flight: Flight
     selected: Tuple[FlightCargoCandidate, ...]
@@ -37,44 +39,32 @@ class FlightSelection:
 PRIORITY_SCORES = {"High": 3, "Medium": 2, "Low": 1}
 
 
-def _score_subset(subset: Sequence[FlightCargoCandidate], flight_weight_capacity: float, flight_volume_capacity: float) -> Tuple[float, int, float, float, float, float]:
-    if not subset:
-        return 0.0, 0, float("inf"), 0.0, 0.0, 0.0
-
-    revenue_density_sum = sum(item.revenue_density for item in subset)
-    priority_sum = sum(item.priority_score for item in subset)
-    avg_dwell = sum(item.dwell_hours for item in subset) / len(subset)
-    total_margin = sum(item.margin for item in subset)
-
-    # Calculate utilization metrics
-    total_weight = sum(item.weight_kg for item in subset)
-    total_volume = sum(item.volume_m3 for item in subset)
-    weight_utilization = total_weight / flight_weight_capacity
-    volume_utilization = total_volume / flight_volume_capacity
-
-    # Add utilization bonus (prefer solutions that use 60-90% of capacity)
-    utilization_score = 0.0
-    if weight_utilization >= 0.6 and volume_utilization >= 0.6:
-        # Bonus for good utilization (up to 30% capacity usage)
-        utilization_bonus = min(weight_utilization, volume_utilization) * 1000
-        utilization_score += utilization_bonus
-
-    return revenue_density_sum, priority_sum, avg_dwell, total_margin, utilization_score, weight_utilization + volume_utilization
-
-
 def select_best_cargo(flight: Flight, candidates: Iterable[FlightCargoCandidate]) -> FlightSelection:
     candidate_list = list(candidates)
     capacity_weight = flight.weight_capacity_kg
     capacity_volume = flight.volume_capacity_m3
 
-    # Separate candidates by priority
-    high_priority = [c for c in candidate_list if c.priority_score >= 3]  # High priority
-    medium_priority = [c for c in candidate_list if c.priority_score == 2]  # Medium priority
-    low_priority = [c for c in candidate_list if c.priority_score <= 1]  # Low priority
-
-    # INTELLIGENT CAPACITY MANAGEMENT: Reserve capacity for ALL high and medium priority cargo
-    total_high_medium_weight = sum(c.weight_kg for c in high_priority + medium_priority)
-    total_high_medium_volume = sum(c.volume_m3 for c in high_priority + medium_priority)
+    # Separate candidates by priority in one pass
+    high_priority: List[FlightCargoCandidate] = []  # High priority
+    medium_priority: List[FlightCargoCandidate] = []  # Medium priority
+    low_priority: List[FlightCargoCandidate] = []  # Low priority
+    for c in candidate_list:
+        if c.priority_score >= 3:
+            high_priority.append(c)
+        elif c.priority_score == 2:
+            medium_priority.append(c)
+        elif c.priority_score <= 1:
+            low_priority.append(c)
+
+    # INTELLIGENT CAPACITY MANAGEMENT: Reserve capacity for ALL high and medium priority cargo.
+    # Both totals are taken in one walk, high priority first, in the order a
+    # sum over the two lists joined would add them.
+    total_high_medium_weight = 0.0
+    total_high_medium_volume = 0.0
+    for bucket in (high_priority, medium_priority):
+        for c in bucket:
+            total_high_medium_weight += c.weight_kg
+            total_high_medium_volume += c.volume_m3
 
     # Enhanced capacity check with smart allocation
     if total_high_medium_weight > capacity_weight or total_high_medium_volume > capacity_volume:
@@ -124,10 +114,10 @@ def select_best_cargo(flight: Flight, candidates: Iterable[FlightCargoCandidate]
     selected = high_selected + medium_selected + low_selected
 
     # Final safety check: ensure ALL high and medium priority cargo are selected
-    all_high_medium = high_priority + medium_priority
-    selected_high_medium = [c for c in selected if c in all_high_medium]
+    high_medium_ids = {id(c) for c in chain(high_priority, medium_priority)}
+    selected_high_medium = [c for c in selected if id(c) in high_medium_ids]
 
-    if len(selected_high_medium) != len(all_high_medium):
+    if len(selected_high_medium) != len(high_priority) + len(medium_priority):
         # This indicates a critical error - force emergency assignment
         print(f"CRITICAL ERROR: High/Medium priority cargo not fully assigned. Forcing emergency assignment.")
         return _emergency_high_medium_assignment(flight, high_priority, medium_priority, low_priority)
@@ -181,12 +171,16 @@ def _emergency_high_medium_assignment(
             remaining_volume -= candidate.volume_m3
 
     # If we still have high/medium priority cargo that couldn't fit, we need to make room
-    all_critical = high_priority + medium_priority
     selected_critical = high_selected + medium_selected
 
-    if len(selected_critical) < len(all_critical):
+    if len(selected_critical) < len(high_priority) + len(medium_priority):
         # Emergency capacity reallocation: reject some low-priority cargo to make room
-        remaining_critical = [c for c in all_critical if c not in selected_critical]
+        # Candidates are tracked by identity: membership in a list would
+        # compare whole dataclasses against every entry
+        selected_ids = {id(c) for c in selected_critical}
+        remaining_critical = [
+            c for c in chain(high_priority, medium_priority) if id(c) not in selected_ids
+        ]
 
         # Sort currently selected cargo by priority (lowest first) to determine what to reject
         selected_sorted = sorted(selected_critical, key=lambda x: x.priority_score)
@@ -200,15 +194,18 @@ def _emergency_high_medium_assignment(
                 if (candidate_to_replace.weight_kg >= critical_cargo.weight_kg and
                     candidate_to_replace.volume_m3 >= critical_cargo.volume_m3):
                     # Replace this cargo with the critical cargo
-                    if candidate_to_replace in selected_critical:
+                    if id(candidate_to_replace) in selected_ids:
                         selected_critical.remove(candidate_to_replace)
+                        selected_ids.discard(id(candidate_to_replace))
                         selected_critical.append(critical_cargo)
+                        selected_ids.add(id(critical_cargo))
                         replaced = True
                         break
 
             if not replaced:
                 # If we can't replace, just add the critical cargo (this will exceed capacity)
                 selected_critical.append(critical_cargo)
+                selected_ids.add(id(critical_cargo))
 
     # All low priority cargo gets rejected in emergency mode
     rejected.extend(low_priority)
@@ -220,42 +217,179 @@ def _emergency_high_medium_assignment(
     return FlightSelection(
         flight=flight,
         selected=tuple(selected_critical),
-        rejected=tuple(rejected + low_priority),
+        rejected=tuple(chain(rejected, low_priority)),
         total_weight=total_weight,
         total_volume=total_volume,
         revenue_density_sum=revenue_density_sum,
     )
 
 
+# Pools up to this size are enumerated outright; the common case in a GA
+# run is a handful of low-priority candidates per flight
+_ENUMERATE_UP_TO = 5
+
+
 def _select_optimal_low_priority(
     candidates: List[FlightCargoCandidate],
     max_weight: float,
     max_volume: float
 ) -> List[FlightCargoCandidate]:
-    """Select optimal subset of low-priority cargo for remaining capacity."""
-    best_subset: List[FlightCargoCandidate] = []
-    best_score = -1.0
-
-    for r in range(len(candidates) + 1):
-        for combo in combinations(candidates, r):
-            total_weight = sum(item.weight_kg for item in combo)
-            total_volume = sum(item.volume_m3 for item in combo)
-            if total_weight > max_weight or total_volume > max_volume:
+    """Select optimal subset of low-priority cargo for remaining capacity.
+
+    Branch and bound over include/exclude decisions, trying the candidates
+    with the most revenue density per unit of their tighter capacity first.
+    A branch is dropped once it overflows capacity, or once the density it
+    could still add (fractional knapsacks over blends of the weight and
+    volume shares, taking the smallest) plus the largest utilization bonus it could reach cannot
+    catch the best score found. Each complete subset is re-totalled in
+    candidate order, exactly as scoring it directly would, and ties go to
+    the subset an exhaustive enumeration by size would meet first: fewest
+    items, then earliest candidates. Pools of up to ``_ENUMERATE_UP_TO``
+    candidates skip the bounding and score every subset.
+    """
+    count = len(candidates)
+    weights = [item.weight_kg for item in candidates]
+    volumes = [item.volume_m3 for item in candidates]
+    densities = [item.revenue_density for item in candidates]
+
+    def utilization_score(total_weight: float, total_volume: float) -> float:
+        # Prevent division by zero
+        weight_util = total_weight / max_weight if max_weight > 0 else 0
+        volume_util = total_volume / max_volume if max_volume > 0 else 0
+        return min(weight_util, volume_util) * 1000
+
+    # Lightly loaded flight: when the whole pool fits and every candidate
+    # adds positive density, no subset can outscore taking them all
+    if (
+        sum(weights) <= max_weight
+        and sum(volumes) <= max_volume
+        and all(density > 0 for density in densities)
+    ):
+        return list(candidates)
+
+    if count <= _ENUMERATE_UP_TO:
+        # Too few candidates for bounding to pay off: score every subset
+        best_combo: Tuple[int, ...] = ()
+        best_score = -1.0
+        for size in range(count + 1):
+            for combo in combinations(range(count), size):
+                total_weight = sum(weights[idx] for idx in combo)
+                total_volume = sum(volumes[idx] for idx in combo)
+                if total_weight > max_weight or total_volume > max_volume:
+                    continue
+                total_score = sum(densities[idx] for idx in combo) + utilization_score(total_weight, total_volume)
+                if total_score > best_score:
+                    best_score = total_score
+                    best_combo = combo
+        return [candidates[idx] for idx in best_combo]
+
+    def yield_key(sizes: List[float], capacity: float) -> Callable[[int], float]:
+        def key(idx: int) -> float:
+            share = sizes[idx] / capacity if capacity > 0 else sizes[idx]
+            return densities[idx] / share if share > 0 else float("inf")
+        return key
+
+    def bottleneck_yield(idx: int) -> float:
+        return min(yield_key(weights, max_weight)(idx), yield_key(volumes, max_volume)(idx))
+
+    # Branching order, and the rank of each candidate in it
+    order = sorted(range(count), key=bottleneck_yield, reverse=True)
+    rank = [0] * count
+    for position, idx in enumerate(order):
+        rank[idx] = position
+    rest_weight = [0.0] * (count + 1)
+    rest_volume = [0.0] * (count + 1)
+    for position in range(count - 1, -1, -1):
+        rest_weight[position] = rest_weight[position + 1] + weights[order[position]]
+        rest_volume[position] = rest_volume[position + 1] + volumes[order[position]]
+
+    # Surrogate constraints: weight and volume as shares of their capacity,
+    # blended in a few proportions. Any subset that fits both fits every
+    # blend, so the density a blend admits bounds what can still be added.
+    weight_shares = [weight / max_weight if max_weight > 0 else weight for weight in weights]
+    volume_shares = [volume / max_volume if max_volume > 0 else volume for volume in volumes]
+    positive = [idx for idx in range(count) if densities[idx] > 0]
+    surrogates = []
+    for blend in (0.0, 0.25, 0.5, 0.75, 1.0):
+        sizes = [
+            blend * weight_share + (1 - blend) * volume_share
+            for weight_share, volume_share in zip(weight_shares, volume_shares)
+        ]
+        by_yield = sorted(positive, key=yield_key(sizes, 1.0), reverse=True)
+        surrogates.append((blend, sizes, by_yield))
+
+    def fractional_density(position: int, capacity: float, by_yield: List[int], sizes: List[float]) -> float:
+        # Density the undecided candidates could add within ``capacity`` if
+        # they could be split: an upper bound for whole candidates
+        total = 0.0
+        for idx in by_yield:
+            if rank[idx] < position:
                 continue
+            if sizes[idx] <= capacity:
+                total += densities[idx]
+                capacity -= sizes[idx]
+            else:
+                total += densities[idx] * max(capacity, 0.0) / sizes[idx]
+                break
+        return total
+
+    # Partial totals are summed in branching order, which can differ from the
+    # candidate-order totals in the last bits; bounds and overflow checks
+    # leave that much slack and complete subsets are checked exactly
+    slack = 1e-9
+    weight_limit = max_weight + slack * abs(max_weight)
+    volume_limit = max_volume + slack * abs(max_volume)
 
+    best_score = -1.0
+    best_indices: List[int] = []
+    chosen: List[int] = []
+
+    def visit(position: int, total_weight: float, total_volume: float, revenue_density_sum: float) -> None:
+        nonlocal best_score, best_indices
+        if position == count:
+            subset = sorted(chosen)
+            total_weight = sum(weights[idx] for idx in subset)
+            total_volume = sum(volumes[idx] for idx in subset)
+            if total_weight > max_weight or total_volume > max_volume:
+                return
             # Score based on revenue density and utilization
-            revenue_density_sum = sum(item.revenue_density for item in combo)
-            # Prevent division by zero
-            weight_util = total_weight / max_weight if max_weight > 0 else 0
-            volume_util = total_volume / max_volume if max_volume > 0 else 0
-            utilization_score = min(weight_util, volume_util) * 1000
-
-            total_score = revenue_density_sum + utilization_score
-            if total_score > best_score:
+            total_score = sum(densities[idx] for idx in subset) + utilization_score(total_weight, total_volume)
+            if total_score > best_score or (
+                total_score == best_score and (len(subset), subset) < (len(best_indices), best_indices)
+            ):
                 best_score = total_score
-                best_subset = list(combo)
+                best_indices = subset
+            return
+
+        weight_left = (weight_limit - total_weight) / max_weight if max_weight > 0 else weight_limit - total_weight
+        volume_left = (volume_limit - total_volume) / max_volume if max_volume > 0 else volume_limit - total_volume
+        density_bound = min(
+            fractional_density(
+                position, blend * weight_left + (1 - blend) * volume_left + slack, by_yield, sizes
+            )
+            for blend, sizes, by_yield in surrogates
+        )
+        bound = revenue_density_sum + density_bound + min(
+            utilization_score(
+                min(total_weight + rest_weight[position], weight_limit),
+                min(total_volume + rest_volume[position], volume_limit),
+            ),
+            1000,
+        )
+        if bound < best_score - slack * max(1.0, abs(best_score)):
+            return
+
+        idx = order[position]
+        weight = total_weight + weights[idx]
+        volume = total_volume + volumes[idx]
+        if weight <= weight_limit and volume <= volume_limit:
+            chosen.append(idx)
+            visit(position + 1, weight, volume, revenue_density_sum + densities[idx])
+            chosen.pop()
+        visit(position + 1, total_weight, total_volume, revenue_density_sum)
 
-    return best_subset
+    visit(0, 0.0, 0.0, 0.0)
+    return [candidates[idx] for idx in best_indices]
 
 
 def _intelligent_priority_allocation(
@@ -311,8 +445,10 @@ def _intelligent_priority_allocation(
         return None
     
     # Calculate rejected cargo
-    all_candidates = high_priority + medium_priority + low_priority
-    rejected = [c for c in all_candidates if c not in selected]
+    selected_ids = {id(c) for c in selected}
+    rejected = [
+        c for c in chain(high_priority, medium_priority, low_priority) if id(c) not in selected_ids
+    ]
     
     revenue_density_sum = sum(c.revenue_density for c in selected)
     
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import csv
 import json
+import os
+from sys import intern
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
-
-import pandas as pd
-
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
 ISO_FORMAT_ERROR = "Value '{value}' for field '{field}' is not a valid ISO 8601 timestamp."
+DEFAULT_TIMEZONE = timezone(timedelta(hours=5, minutes=30))
 
 
 class DataValidationError(Exception):
@@ -31,6 +33,52 @@ class Flight:
     aircraft_swap_capacity_kg: float
     aircraft_swap_volume_m3: float
 
+    # Epoch seconds for the route search, which compares and subtracts times
+    # far more often than it needs them as datetimes.
+    @cached_property
+    def departure_ts(self) -> float:
+        return self.departure_time.timestamp()
+
+    @cached_property
+    def arrival_ts(self) -> float:
+        return self.arrival_time.timestamp()
+
+    # Disruption scenarios clone flights with one or two fields changed; building
+    # the copy positionally avoids dataclasses.replace's per-call field walk.
+    def shifted(self, delta: timedelta) -> Flight:
+        """Copy of this flight with departure and arrival moved by ``delta``."""
+        return Flight(
+            self.flight_id,
+            self.origin,
+            self.destination,
+            self.departure_time + delta,
+            self.arrival_time + delta,
+            self.aircraft_type,
+            self.weight_capacity_kg,
+            self.volume_capacity_m3,
+            self.operating_cost_per_kg,
+            self.handling_penalty_per_hour,
+            self.aircraft_swap_capacity_kg,
+            self.aircraft_swap_volume_m3,
+        )
+
+    def with_capacity(self, weight_capacity_kg: float, volume_capacity_m3: float) -> Flight:
+        """Copy of this flight with its weight and volume capacity replaced."""
+        return Flight(
+            self.flight_id,
+            self.origin,
+            self.destination,
+            self.departure_time,
+            self.arrival_time,
+            self.aircraft_type,
+            weight_capacity_kg,
+            volume_capacity_m3,
+            self.operating_cost_per_kg,
+            self.handling_penalty_per_hour,
+            self.aircraft_swap_capacity_kg,
+            self.aircraft_swap_volume_m3,
+        )
+
 
 @dataclass(frozen=True)
 class Cargo:
@@ -48,6 +96,14 @@ class Cargo:
     handling_cost_per_kg: float
     sla_penalty_per_hour: float
 
+    @cached_property
+    def ready_ts(self) -> float:
+        return self.ready_time.timestamp()
+
+    @cached_property
+    def due_ts(self) -> float:
+        return self.due_by.timestamp()
+
 
 @dataclass(frozen=True)
 class ConnectionRule:
@@ -102,34 +158,51 @@ BOOL_TRUE = {"true", "1", "yes", "y"}
 BOOL_FALSE = {"false", "0", "no", "n"}
 
 
-def _ensure_columns(df: pd.DataFrame, required: Iterable[str], source: Path) -> None:
-    missing = set(required) - set(df.columns)
+def _ensure_columns(columns: Iterable[str], required: Iterable[str], source: Path) -> None:
+    missing = set(required) - set(columns)
     if missing:
         raise DataValidationError(
             f"{source.name} is missing required columns: {', '.join(sorted(missing))}"
         )
 
 
-def _parse_iso_datetime(value: str, field: str) -> datetime:
-    """Parse datetime string and ensure it has timezone information."""
+def _read_rows(path: Path, required: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Stream the rows of a CSV file as dicts of raw strings.
+
+    Short rows are padded with empty strings, so a missing value fails the
+    same field check as a blank one.
+    """
+    with path.open(newline="", encoding="utf-8-sig") as handle:
+        reader = csv.DictReader(handle, restval="")
+        _ensure_columns(reader.fieldnames or (), required, path)
+        yield from reader
+
+
+@lru_cache(maxsize=65536)
+def parse_iso_datetime(value: str, field: str) -> datetime:
+    """Parse datetime string and ensure it has timezone information.
+
+    ``fromisoformat`` handles offsets and a trailing ``Z`` natively, so the
+    common case is a single C-level parse; naive values fall back to IST.
+    Schedules repeat the same few timestamps across many rows, and datetimes
+    are immutable, so parses are cached per string.
+    """
+    value = value.strip()
     try:
-        value = value.strip()
-
-        # Handle different datetime formats
-        if value.endswith('Z'):
-            # UTC time
-            return datetime.fromisoformat(value.replace('Z', '+00:00'))
-        elif '+' in value or '-' in value[-6:]:  # Check for timezone offset
-            # Already has timezone info
-            return datetime.fromisoformat(value)
-        else:
-            # No timezone info, assume Asia/Calcutta (+05:30)
-            naive_dt = datetime.fromisoformat(value)
-            # Add Asia/Calcutta timezone
-            tz = timezone(timedelta(hours=5, minutes=30))
-            return naive_dt.replace(tzinfo=tz)
+        parsed = datetime.fromisoformat(value)
     except ValueError as exc:
         raise DataValidationError(ISO_FORMAT_ERROR.format(value=value, field=field)) from exc
+    if parsed.tzinfo is None:
+        # No timezone info, assume Asia/Calcutta (+05:30)
+        return parsed.replace(tzinfo=DEFAULT_TIMEZONE)
+    return parsed
+
+
+def _parse_float(value: str, field: str) -> float:
+    try:
+        return float(value)
+    except ValueError as exc:
+        raise DataValidationError(f"Field '{field}' with value '{value}' must be numeric.") from exc
 
 
 def _parse_bool(value: str, field: str) -> bool:
@@ -147,28 +220,27 @@ def _validate_positive(name: str, value: float) -> None:
 
 
 def load_flights(path: Path) -> Dict[str, Flight]:
-    df = pd.read_csv(path)
-    _ensure_columns(df, REQUIRED_FLIGHT_COLUMNS, path)
-
     flights: Dict[str, Flight] = {}
-    for _, row in df.iterrows():
-        flight_id = str(row["flight_id"]).strip()
+    for row in _read_rows(path, REQUIRED_FLIGHT_COLUMNS):
+        # Ids and airport codes are interned: they are dict keys and compared
+        # constantly downstream, and interned strings compare by identity
+        flight_id = intern(row["flight_id"].strip())
         if not flight_id:
             raise DataValidationError("flight_id cannot be empty")
 
-        departure = _parse_iso_datetime(str(row["departure_time"]), "departure_time")
-        arrival = _parse_iso_datetime(str(row["arrival_time"]), "arrival_time")
+        departure = parse_iso_datetime(row["departure_time"], "departure_time")
+        arrival = parse_iso_datetime(row["arrival_time"], "arrival_time")
         if arrival <= departure:
             raise DataValidationError(
                 f"Flight {flight_id} arrival_time must be after departure_time"
             )
 
-        weight_capacity = float(row["weight_capacity_kg"])
-        volume_capacity = float(row["volume_capacity_m3"])
-        operating_cost = float(row["operating_cost_per_kg"])
-        handling_penalty = float(row["handling_penalty_per_hour"])
-        swap_weight = float(row["aircraft_swap_capacity_kg"])
-        swap_volume = float(row["aircraft_swap_volume_m3"])
+        weight_capacity = _parse_float(row["weight_capacity_kg"], "weight_capacity_kg")
+        volume_capacity = _parse_float(row["volume_capacity_m3"], "volume_capacity_m3")
+        operating_cost = _parse_float(row["operating_cost_per_kg"], "operating_cost_per_kg")
+        handling_penalty = _parse_float(row["handling_penalty_per_hour"], "handling_penalty_per_hour")
+        swap_weight = _parse_float(row["aircraft_swap_capacity_kg"], "aircraft_swap_capacity_kg")
+        swap_volume = _parse_float(row["aircraft_swap_volume_m3"], "aircraft_swap_volume_m3")
 
         for field_name, value in {
             "weight_capacity_kg": weight_capacity,
@@ -182,11 +254,11 @@ def load_flights(path: Path) -> Dict[str, Flight]:
 
         flights[flight_id] = Flight(
             flight_id=flight_id,
-            origin=str(row["origin"]).strip().upper(),
-            destination=str(row["destination"]).strip().upper(),
+            origin=intern(row["origin"].strip().upper()),
+            destination=intern(row["destination"].strip().upper()),
             departure_time=departure,
             arrival_time=arrival,
-            aircraft_type=str(row["aircraft_type"]).strip(),
+            aircraft_type=row["aircraft_type"].strip(),
             weight_capacity_kg=weight_capacity,
             volume_capacity_m3=volume_capacity,
             operating_cost_per_kg=operating_cost,
@@ -198,20 +270,17 @@ def load_flights(path: Path) -> Dict[str, Flight]:
 
 
 def load_cargo(path: Path) -> Dict[str, Cargo]:
-    df = pd.read_csv(path)
-    _ensure_columns(df, REQUIRED_CARGO_COLUMNS, path)
-
     cargo_map: Dict[str, Cargo] = {}
-    for _, row in df.iterrows():
-        cargo_id = str(row["cargo_id"]).strip()
+    for row in _read_rows(path, REQUIRED_CARGO_COLUMNS):
+        cargo_id = intern(row["cargo_id"].strip())
         if not cargo_id:
             raise DataValidationError("cargo_id cannot be empty")
-        weight = float(row["weight_kg"])
-        volume = float(row["volume_m3"])
-        revenue = float(row["revenue_inr"])
-        max_transit = float(row["max_transit_hours"])
-        handling_cost = float(row["handling_cost_per_kg"])
-        sla_penalty = float(row["sla_penalty_per_hour"])
+        weight = _parse_float(row["weight_kg"], "weight_kg")
+        volume = _parse_float(row["volume_m3"], "volume_m3")
+        revenue = _parse_float(row["revenue_inr"], "revenue_inr")
+        max_transit = _parse_float(row["max_transit_hours"], "max_transit_hours")
+        handling_cost = _parse_float(row["handling_cost_per_kg"], "handling_cost_per_kg")
+        sla_penalty = _parse_float(row["sla_penalty_per_hour"], "sla_penalty_per_hour")
 
         for field_name, value in {
             "weight_kg": weight,
@@ -223,20 +292,21 @@ def load_cargo(path: Path) -> Dict[str, Cargo]:
         }.items():
             _validate_positive(field_name, value)
 
-        ready_time = _parse_iso_datetime(str(row["ready_time"]), "ready_time")
-        due_by = _parse_iso_datetime(str(row["due_by"]), "due_by")
+        ready_time = parse_iso_datetime(row["ready_time"], "ready_time")
+        due_by = parse_iso_datetime(row["due_by"], "due_by")
         if due_by <= ready_time:
             raise DataValidationError(
                 f"Cargo {cargo_id} due_by must be after ready_time"
             )
 
-        priority = str(row["priority"]).strip().capitalize()
+        # Interned like the ids: priorities key PRIORITY_SCORES lookups throughout
+        priority = intern(row["priority"].strip().capitalize())
         perishable = _parse_bool(row["perishable"], "perishable")
 
         cargo_map[cargo_id] = Cargo(
             cargo_id=cargo_id,
-            origin=str(row["origin"]).strip().upper(),
-            destination=str(row["destination"]).strip().upper(),
+            origin=intern(row["origin"].strip().upper()),
+            destination=intern(row["destination"].strip().upper()),
             weight_kg=weight,
             volume_m3=volume,
             revenue_inr=revenue,
@@ -251,17 +321,86 @@ def load_cargo(path: Path) -> Dict[str, Cargo]:
     return cargo_map
 
 
-def load_connections(path: Path) -> List[ConnectionRule]:
-    df = pd.read_csv(path)
-    _ensure_columns(df, REQUIRED_CONNECTION_COLUMNS, path)
+_CARGO_ID_CACHE: Dict[Path, Tuple[Tuple[int, int], Set[str]]] = {}
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_cargo_ids(path: Path) -> Set[str]:
+    """Return the cargo ids in ``path``, re-reading the file only when it changes.
+
+    Only the ``cargo_id`` column is read, so duplicate checks on intake do not
+    pay for a full parse of the cargo file on every request.
+    """
+    if not path.exists():
+        return set()
+
+    signature = _file_signature(path)
+    cached = _CARGO_ID_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with path.open(newline="", encoding="utf-8-sig") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if not header or "cargo_id" not in header:
+            raise DataValidationError(f"{path.name} is missing required columns: cargo_id")
+        column = header.index("cargo_id")
+        cargo_ids = {row[column].strip() for row in reader if len(row) > column}
+
+    _CARGO_ID_CACHE[path] = (signature, cargo_ids)
+    return cargo_ids
 
+
+def remember_cargo_id(path: Path, cargo_id: str) -> None:
+    """Record a cargo id just appended to ``path`` without invalidating the cache."""
+    cached = _CARGO_ID_CACHE.get(path)
+    cargo_ids = cached[1] if cached is not None else load_cargo_ids(path)
+    cargo_ids.add(cargo_id)
+    _CARGO_ID_CACHE[path] = (_file_signature(path), cargo_ids)
+
+
+def append_cargo_rows(path: Path, rows: Sequence[Mapping[str, object]]) -> None:
+    """Append a batch of cargo rows to ``path`` with a single write and fsync.
+
+    Columns follow the existing header of the file, and the cargo id index is
+    updated so the new ids are visible to duplicate checks immediately.
+    """
+    if not rows:
+        return
+
+    with path.open("r+", newline="", encoding="utf-8-sig") as handle:
+        header = next(csv.reader(handle), None)
+        if not header:
+            raise DataValidationError(f"{path.name} has no header row")
+        handle.seek(0, os.SEEK_END)
+        if handle.tell():
+            handle.seek(handle.tell() - 1)
+            needs_newline = handle.read(1) not in ("\n", "\r")
+            handle.seek(0, os.SEEK_END)
+            if needs_newline:
+                handle.write("\n")
+        writer = csv.DictWriter(handle, fieldnames=header, lineterminator="\n")
+        writer.writerows(rows)
+        handle.flush()
+        os.fsync(handle.fileno())
+
+    for row in rows:
+        remember_cargo_id(path, str(row["cargo_id"]))
+
+
+def load_connections(path: Path) -> List[ConnectionRule]:
     rules: List[ConnectionRule] = []
-    for _, row in df.iterrows():
-        origin = str(row["origin"]).strip().upper()
-        destination = str(row["destination"]).strip().upper()
-        connection_airport = str(row["connection_airport"]).strip().upper() or None
-        min_connect = int(row["min_connect_minutes"])
-        max_connect = float(row["max_connect_hours"])
+    for row in _read_rows(path, REQUIRED_CONNECTION_COLUMNS):
+        origin = intern(row["origin"].strip().upper())
+        destination = intern(row["destination"].strip().upper())
+        # A blank cell reaches the rule as "NAN", as it did through pandas
+        connection_airport = intern(row["connection_airport"].strip().upper() or "NAN")
+        min_connect = int(_parse_float(row["min_connect_minutes"], "min_connect_minutes"))
+        max_connect = _parse_float(row["max_connect_hours"], "max_connect_hours")
         if min_connect < 0:
             raise DataValidationError(
                 f"min_connect_minutes must be >= 0 for {origin}->{destination}"
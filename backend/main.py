@@ -3,16 +3,19 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Iterable, List
+from typing import List
+
+import orjson
 
 from disruptions import DisruptionEvent
+from outputs import OUTPUT_FORMATS, check_output_format
 from pipeline import PipelineConfig, run_pipeline
 
 
-def _load_events(path: Path) -> Iterable[DisruptionEvent]:
+def _load_events(path: Path) -> List[DisruptionEvent]:
     if not path.exists():
         raise FileNotFoundError(f"Disruption file not found: {path}")
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = orjson.loads(path.read_bytes())
     events: List[DisruptionEvent] = []
     for raw in data:
         events.append(
@@ -52,6 +55,24 @@ def main() -> None:
         default=42,
         help="Random seed for GA reproducibility",
     )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="csv",
+        help="File format for the tabular artefacts (feather/parquet need pyarrow)",
+    )
+    parser.add_argument(
+        "--parallel-baseline",
+        action="store_true",
+        help="Run the baseline GA in a worker process alongside the disrupted scenario",
+    )
+    parser.add_argument(
+        "--max-routes-per-cargo",
+        type=int,
+        default=PipelineConfig.max_routes_per_cargo,
+        help="Keep only this many highest-margin routes per cargo in the GA catalog; 0 keeps all "
+        "(default: %(default)s)",
+    )
     parser.add_argument(
         "--no-write",
         action="store_true",
@@ -59,6 +80,11 @@ def main() -> None:
     )
 
     args = parser.parse_args()
+    if not args.no_write:
+        try:
+            check_output_format(args.format)
+        except ValueError as exc:
+            parser.error(str(exc))
 
     events = _load_events(args.events) if args.events else None
 
@@ -68,6 +94,9 @@ def main() -> None:
         events=events,
         seed=args.seed,
         write_outputs=not args.no_write,
+        output_format=args.format,
+        parallel_baseline=args.parallel_baseline,
+        max_routes_per_cargo=args.max_routes_per_cargo or None,
     )
     result = run_pipeline(config)
 
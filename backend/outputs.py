@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import csv
+import importlib.util
 import json
+import re
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
+import orjson
 import pandas as pd
 
 try:
@@ -22,32 +29,134 @@ def _route_descriptor(route) -> str:  # type: ignore[no-untyped-def]
     return " → ".join(leg.flight.flight_id for leg in route.legs) or "DENIED"
 
 
+def _iso_formatter() -> Callable[[datetime], str]:
+    """Return an ``isoformat`` that formats each datetime object only once.
+
+    Legs share their flight's departure/arrival objects, so within one
+    writer call the same timestamps come up again and again. Entries are
+    keyed by ``id``; keep the formatter local to a call, while the
+    datetimes it has seen are still alive.
+    """
+    cache: Dict[int, str] = {}
+
+    def isoformat(value: datetime) -> str:
+        key = id(value)
+        text = cache.get(key)
+        if text is None:
+            text = cache[key] = value.isoformat()
+        return text
+
+    return isoformat
+
+
+OUTPUT_FORMATS = ("csv", "feather", "parquet")
+
+# Formats pandas writes through pyarrow, which is not a hard requirement
+_PYARROW_FORMATS = frozenset(("feather", "parquet"))
+
+
+def check_output_format(output_format: str) -> None:
+    """Raise ValueError if ``output_format`` is unknown or cannot be written here."""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    if output_format in _PYARROW_FORMATS and importlib.util.find_spec("pyarrow") is None:
+        raise ValueError(f"Output format {output_format!r} requires pyarrow, which is not installed")
+
+
+def _write_table(
+    columns: Sequence[str], rows: Iterable[Sequence[object]], out_path: Path
+) -> None:
+    """Write ``rows`` under ``columns`` in the format implied by the file suffix.
+
+    CSV (the default) goes through the stdlib C writer, which formats each
+    cell with ``str()`` just as ``DataFrame.to_csv`` does for these columns,
+    without building a frame first. Feather and Parquet need ``pyarrow``
+    installed; it is only imported by pandas when one of those is requested.
+    """
+    suffix = out_path.suffix.lower()
+    if suffix in (".feather", ".parquet"):
+        df = pd.DataFrame(list(rows), columns=list(columns))
+        if suffix == ".feather":
+            df.to_feather(out_path, compression="zstd")
+        else:
+            df.to_parquet(out_path, engine="pyarrow", compression="zstd", index=False)
+        return
+
+    with out_path.open("w", encoding="utf-8", newline="") as fp:
+        writer = csv.writer(fp, lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows(rows)
+
+
+_PLAN_ROUTE_COLUMNS = (
+    "cargo_id",
+    "status",
+    "reason",
+    "flight_sequence",
+    "etds",
+    "etas",
+    "total_cost",
+    "revenue",
+    "margin",
+    "transit_hours",
+    "sla_penalty",
+    "handling_penalty",
+    "notes",
+)
+
+_FLIGHT_LOAD_COLUMNS = (
+    "flight_id",
+    "origin",
+    "destination",
+    "scheduled_departure",
+    "weight_capacity_kg",
+    "volume_capacity_m3",
+    "assigned_cargo",
+    "total_weight",
+    "total_volume",
+    "weight_utilization_pct",
+    "volume_utilization_pct",
+    "revenue_sum",
+)
+
+
+_ALERT_COLUMNS = (
+    "alert_type",
+    "severity",
+    "message",
+    "cargo_id",
+    "flight_id",
+    "status",
+    "margin_delta",
+)
+
+
+# The row writers below sort in Python and build one tuple per row, so rows
+# are written in their final order without per-row dicts or a sort step.
 def write_plan_routes(result: GAResult, out_path: Path) -> None:
-    rows: List[Dict[str, object]] = []
-    for cargo_id, assignment in result.assignments.items():
+    isoformat = _iso_formatter()
+    rows: List[Tuple[object, ...]] = []
+    for cargo_id, assignment in sorted(result.assignments.items()):
         route = assignment.route
         rows.append(
-            {
-                "cargo_id": cargo_id,
-                "status": assignment.status,
-                "reason": assignment.reason or "",
-                "flight_sequence": "|".join(
-                    leg.flight.flight_id for leg in route.legs
-                ),
-                "etds": "|".join(leg.departure_time.isoformat() for leg in route.legs),
-                "etas": "|".join(leg.arrival_time.isoformat() for leg in route.legs),
-                "total_cost": round(route.total_cost, 2),
-                "revenue": round(route.total_revenue, 2),
-                "margin": round(assignment.margin, 2),
-                "transit_hours": round(route.transit_hours, 2),
-                "sla_penalty": round(route.sla_penalty, 2),
-                "handling_penalty": round(route.handling_penalty, 2),
-                "notes": route.notes,
-            }
+            (
+                cargo_id,
+                assignment.status,
+                assignment.reason or "",
+                "|".join(leg.flight.flight_id for leg in route.legs),
+                "|".join(isoformat(leg.departure_time) for leg in route.legs),
+                "|".join(isoformat(leg.arrival_time) for leg in route.legs),
+                round(route.total_cost, 2),
+                round(route.total_revenue, 2),
+                round(assignment.margin, 2),
+                round(route.transit_hours, 2),
+                round(route.sla_penalty, 2),
+                round(route.handling_penalty, 2),
+                route.notes,
+            )
         )
-    df = pd.DataFrame(rows)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.sort_values(by="cargo_id").to_csv(out_path, index=False)
+    _write_table(_PLAN_ROUTE_COLUMNS, rows, out_path)
 
 
 def write_flight_loads(
@@ -55,73 +164,109 @@ def write_flight_loads(
     flights: Dict[str, Flight],
     out_path: Path,
 ) -> None:
-    rows: List[Dict[str, object]] = []
+    flight_loads = result.flight_loads
+    rows: List[Tuple[object, ...]] = []
     for flight_id, flight in flights.items():
-        selection = result.flight_loads.get(flight_id)
+        departure = flight.departure_time.isoformat()
+        selection = flight_loads.get(flight_id)
         if selection is None:
             rows.append(
-                {
-                    "flight_id": flight_id,
-                    "origin": flight.origin,
-                    "destination": flight.destination,
-                    "scheduled_departure": flight.departure_time.isoformat(),
-                    "weight_capacity_kg": flight.weight_capacity_kg,
-                    "volume_capacity_m3": flight.volume_capacity_m3,
-                    "assigned_cargo": "",
-                    "total_weight": 0.0,
-                    "total_volume": 0.0,
-                    "weight_utilization_pct": 0.0,
-                    "volume_utilization_pct": 0.0,
-                    "revenue_sum": 0.0,
-                }
+                (
+                    flight_id,
+                    flight.origin,
+                    flight.destination,
+                    departure,
+                    flight.weight_capacity_kg,
+                    flight.volume_capacity_m3,
+                    "",
+                    0.0,
+                    0.0,
+                    0.0,
+                    0.0,
+                    0.0,
+                )
             )
             continue
 
+        # The knapsack already summed weight/volume over ``selected``
         selected = selection.selected
-        total_weight = sum(candidate.weight_kg for candidate in selected)
-        total_volume = sum(candidate.volume_m3 for candidate in selected)
+        total_weight = selection.total_weight
+        total_volume = selection.total_volume
         weight_util = (total_weight / flight.weight_capacity_kg) * 100.0
         volume_util = (total_volume / flight.volume_capacity_m3) * 100.0
         revenue_sum = sum(candidate.revenue for candidate in selected)
 
         rows.append(
-            {
-                "flight_id": flight_id,
-                "origin": flight.origin,
-                "destination": flight.destination,
-                "scheduled_departure": flight.departure_time.isoformat(),
-                "weight_capacity_kg": flight.weight_capacity_kg,
-                "volume_capacity_m3": flight.volume_capacity_m3,
-                "assigned_cargo": "|".join(
-                    candidate.cargo.cargo_id for candidate in selected
-                ),
-                "total_weight": round(total_weight, 2),
-                "total_volume": round(total_volume, 2),
-                "weight_utilization_pct": round(weight_util, 2),
-                "volume_utilization_pct": round(volume_util, 2),
-                "revenue_sum": round(revenue_sum, 2),
-            }
+            (
+                flight_id,
+                flight.origin,
+                flight.destination,
+                departure,
+                flight.weight_capacity_kg,
+                flight.volume_capacity_m3,
+                "|".join(candidate.cargo.cargo_id for candidate in selected),
+                round(total_weight, 2),
+                round(total_volume, 2),
+                round(weight_util, 2),
+                round(volume_util, 2),
+                round(revenue_sum, 2),
+            )
         )
-    df = pd.DataFrame(rows)
-    df.sort_values(by="scheduled_departure").to_csv(out_path, index=False)
+    # Ordered by the departure timestamp as written; the sort is stable, so
+    # ties keep schedule order
+    rows.sort(key=itemgetter(3))
+    _write_table(_FLIGHT_LOAD_COLUMNS, rows, out_path)
 
 
 def write_alerts(alerts: Iterable[Alert], out_path: Path) -> None:
+    # Missing ids and deltas stay None: the CSV writer emits them as empty
+    # cells, and the columnar formats get nulls and a float64 margin_delta
     rows = [
-        {
-            "alert_type": alert.alert_type,
-            "severity": alert.severity,
-            "message": alert.message,
-            "cargo_id": alert.cargo_id or "",
-            "flight_id": alert.flight_id or "",
-            "status": alert.status or "",
-            "margin_delta": alert.margin_delta if alert.margin_delta is not None else "",
-        }
+        (
+            alert.alert_type,
+            alert.severity,
+            str(alert.message),
+            alert.cargo_id,
+            alert.flight_id,
+            alert.status,
+            alert.margin_delta,
+        )
         for alert in alerts
     ]
-    df = pd.DataFrame(rows)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(out_path, index=False)
+    _write_table(_ALERT_COLUMNS, rows, out_path)
+
+
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+_NON_ASCII_RUN = re.compile("[^\x00-\x7f]+")
+
+
+def _ascii_json(data: bytes) -> bytes:
+    """Escape non-ASCII text in orjson output as ``\\uXXXX``, as ``json.dumps`` does by default.
+
+    orjson always emits raw UTF-8 (e.g. the ``₹`` and ``→`` in alert messages);
+    the published files have always carried the escaped form. Non-ASCII can
+    only occur inside JSON strings, so each run is swapped for the stdlib's
+    escaping of it, surrogate pairs included.
+    """
+    if data.isascii():
+        return data
+    text = _NON_ASCII_RUN.sub(lambda match: json.dumps(match.group())[1:-1], data.decode())
+    return text.encode()
+
+
+def _indented_json(value: Any, newline: bytes) -> bytes:
+    # orjson escapes newlines inside strings, so every raw b"\n" is layout
+    return _ascii_json(orjson.dumps(value, option=_JSON_OPTIONS)).replace(b"\n", newline)
+
+
+def _write_json_array(fp: BinaryIO, items: Iterable[Any]) -> None:
+    """Write ``items`` as a JSON array nested one level inside the summary object."""
+    separator = b"["
+    for item in items:
+        fp.write(separator + b"\n    " + _indented_json(item, b"\n    "))
+        separator = b","
+    fp.write(b"[]" if separator == b"[" else b"\n  ]")
 
 
 def write_json_summary(
@@ -130,58 +275,85 @@ def write_json_summary(
     alerts: Iterable[Alert],
     out_path: Path,
 ) -> None:
-    delivered = sum(1 for a in result.assignments.values() if a.status == "delivered")
-    rolled = sum(1 for a in result.assignments.values() if a.status == "rolled")
-    denied = sum(1 for a in result.assignments.values() if a.status == "denied")
+    delivered = rolled = denied = 0
+    for assignment in result.assignments.values():
+        status = assignment.status
+        if status == "delivered":
+            delivered += 1
+        elif status == "rolled":
+            rolled += 1
+        elif status == "denied":
+            denied += 1
     total_cargo = len(result.assignments)
 
-    capacity_summary = []
-    for flight_id, flight in flights.items():
+    # Load totals come straight off each FlightSelection; the utilisation
+    # maths then runs over whole columns at once.
+    flight_ids = list(flights)
+    weight_totals = [0.0] * len(flight_ids)
+    volume_totals = [0.0] * len(flight_ids)
+    for index, flight_id in enumerate(flight_ids):
         selection = result.flight_loads.get(flight_id)
-        total_weight = sum(c.weight_kg for c in selection.selected) if selection else 0.0
-        total_volume = sum(c.volume_m3 for c in selection.selected) if selection else 0.0
-        capacity_summary.append(
-            {
-                "flight_id": flight_id,
-                "weight_utilization_pct": round(
-                    (total_weight / flight.weight_capacity_kg) * 100.0, 2
-                )
-                if flight.weight_capacity_kg
-                else 0.0,
-                "volume_utilization_pct": round(
-                    (total_volume / flight.volume_capacity_m3) * 100.0, 2
-                )
-                if flight.volume_capacity_m3
-                else 0.0,
-            }
+        if selection:
+            weight_totals[index] = selection.total_weight
+            volume_totals[index] = selection.total_volume
+
+    weight_caps = np.fromiter(
+        (flight.weight_capacity_kg for flight in flights.values()),
+        dtype=np.float64,
+        count=len(flight_ids),
+    )
+    volume_caps = np.fromiter(
+        (flight.volume_capacity_m3 for flight in flights.values()),
+        dtype=np.float64,
+        count=len(flight_ids),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight_utils = np.where(weight_caps != 0, np.asarray(weight_totals) / weight_caps * 100.0, 0.0)
+        volume_utils = np.where(volume_caps != 0, np.asarray(volume_totals) / volume_caps * 100.0, 0.0)
+
+    # Python's round() rather than ndarray.round(): the latter scales by 100
+    # first and occasionally lands on the other side of a .xx5 tie.
+    capacity_summary = (
+        {
+            "flight_id": flight_id,
+            "weight_utilization_pct": round(weight_util, 2),
+            "volume_utilization_pct": round(volume_util, 2),
+        }
+        for flight_id, weight_util, volume_util in zip(
+            flight_ids, weight_utils.tolist(), volume_utils.tolist()
         )
+    )
 
-    alert_payload = [
+    alert_payload = (
         {
             "alert_type": alert.alert_type,
             "severity": alert.severity,
-            "message": alert.message,
+            "message": str(alert.message),
             "cargo_id": alert.cargo_id,
             "flight_id": alert.flight_id,
             "status": alert.status,
             "margin_delta": alert.margin_delta,
         }
         for alert in alerts
-    ]
+    )
 
-    payload = {
-        "summary": {
-            "total_margin": round(result.total_margin, 2),
-            "cargo_counts": {
-                "delivered": delivered,
-                "rolled": rolled,
-                "denied": denied,
-                "total": total_cargo,
-            },
+    summary = {
+        "total_margin": round(result.total_margin, 2),
+        "cargo_counts": {
+            "delivered": delivered,
+            "rolled": rolled,
+            "denied": denied,
+            "total": total_cargo,
         },
-        "capacity": capacity_summary,
-        "alerts": alert_payload,
     }
 
+    # Same bytes as dumping {"summary", "capacity", "alerts"} with
+    # OPT_INDENT_2, but each row is encoded and written as it is produced.
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    with out_path.open("wb") as fp:
+        fp.write(b'{\n  "summary": ' + _indented_json(summary, b"\n  "))
+        fp.write(b',\n  "capacity": ')
+        _write_json_array(fp, capacity_summary)
+        fp.write(b',\n  "alerts": ')
+        _write_json_array(fp, alert_payload)
+        fp.write(b"\n}")
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import copy
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import astuple, dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 try:
     # When running as part of the FastAPI app
@@ -11,16 +16,24 @@ try:
         DisruptionEvent,
         apply_disruptions,
         baseline_alerts,
+        scenario_alerts,
     )
-    from .ga_route import GAResult, run_ga
+    from .ga_route import DEFAULT_MAX_ROUTES_PER_CARGO, GAResult, run_ga
     from .load_data import Cargo, ConnectionRule, Flight, load_all
     from .outputs import (
+        _iso_formatter,
+        check_output_format,
         write_alerts,
         write_flight_loads,
         write_json_summary,
         write_plan_routes,
     )
-    from .ai_recommendations import generate_ai_recommendations, format_recommendations_for_ui
+    from .ai_recommendations import (
+        FlightTable,
+        build_flight_table,
+        format_recommendations_for_ui,
+        generate_ai_recommendations,
+    )
 except ImportError:
     # When running as standalone scripts
     from disruptions import (
@@ -28,16 +41,27 @@ except ImportError:
         DisruptionEvent,
         apply_disruptions,
         baseline_alerts,
+        scenario_alerts,
     )
-    from ga_route import GAResult, run_ga
+    from ga_route import DEFAULT_MAX_ROUTES_PER_CARGO, GAResult, run_ga
     from load_data import Cargo, ConnectionRule, Flight, load_all
     from outputs import (
+        _iso_formatter,
+        check_output_format,
         write_alerts,
         write_flight_loads,
         write_json_summary,
         write_plan_routes,
     )
-    from ai_recommendations import generate_ai_recommendations, format_recommendations_for_ui
+    from ai_recommendations import (
+        FlightTable,
+        build_flight_table,
+        format_recommendations_for_ui,
+        generate_ai_recommendations,
+    )
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -45,10 +69,10 @@ class PipelineResult:
     cargo: Dict[str, Cargo]
     flights: Dict[str, Flight]
     connection_rules: List[ConnectionRule]
-    base_result: GAResult
+    base_result: Optional[GAResult]
     scenario_result: GAResult
     alerts: List[Alert]
-    events: List[DisruptionEvent]
+    events: Sequence[DisruptionEvent]
     adjusted_flights: Dict[str, Flight]
     ai_recommendations: Dict[str, Any]
 
@@ -57,49 +81,111 @@ class PipelineResult:
 class PipelineConfig:
     data_dir: Path
     output_dir: Path
-    events: Iterable[DisruptionEvent] | None = None
+    events: Sequence[DisruptionEvent] | None = None
     seed: Optional[int] = 42
     write_outputs: bool = True
+    output_format: str = "csv"
+    # Skip the undisrupted GA run when events are given: base_result is then
+    # None and the alerts cover only the events themselves
+    skip_baseline: bool = False
+    # Opt-in: with events, run the baseline GA in a worker process alongside
+    # the scenario GA. Off by default, since forking from a threaded server
+    # (the API) is unsafe and adds process start-up to every run.
+    parallel_baseline: bool = False
+    # Cap on flown routes per cargo in the GA's route catalog; None keeps all
+    max_routes_per_cargo: Optional[int] = DEFAULT_MAX_ROUTES_PER_CARGO
 
 
-def run_pipeline(config: PipelineConfig) -> PipelineResult:
-    flights, cargo, connections = load_all(config.data_dir)
+_INPUT_FILES = ("flights.csv", "cargo.csv", "connections.csv")
 
-    base_result = run_ga(
-        cargo_map=cargo,
-        flights=flights,
-        connection_rules=connections,
-        seed=config.seed,
+
+_InputsCacheEntry = Tuple[Dict[str, Flight], Dict[str, Cargo], List[ConnectionRule], FlightTable]
+
+
+@lru_cache(maxsize=4)
+def _load_inputs_cached(
+    data_dir: str, signature: Tuple[Tuple[int, int], ...]
+) -> _InputsCacheEntry:
+    flights, cargo, connections = load_all(Path(data_dir))
+    return flights, cargo, connections, build_flight_table(flights)
+
+
+def _input_signature(data_dir: Path) -> Tuple[Tuple[int, int], ...]:
+    return tuple(
+        (stat.st_mtime_ns, stat.st_size)
+        for stat in ((data_dir / name).stat() for name in _INPUT_FILES)
     )
-    base_alerts = baseline_alerts(base_result)
 
-    events = list(config.events or [])
+
+def _plan_scenario(
+    data_dir: str,
+    signature: Tuple[Tuple[int, int], ...],
+    events: Sequence[DisruptionEvent],
+    seed: Optional[int],
+    skip_baseline: bool,
+    parallel_baseline: bool,
+    max_routes_per_cargo: Optional[int],
+) -> PipelineResult:
+    cached_flights, cached_cargo, cached_connections, flight_table = _load_inputs_cached(
+        data_dir, signature
+    )
+    flights, cargo, connections = dict(cached_flights), dict(cached_cargo), list(cached_connections)
+
     if events:
-        scenario_result, adjusted_flights, disruption_alerts = apply_disruptions(
-            baseline=base_result,
+        run_scenario = partial(
+            apply_disruptions,
+            baseline=None,
             cargo_map=cargo,
             flights=flights,
             connection_rules=connections,
             events=events,
-            seed=(config.seed or 42) + 1,
+            seed=(seed or 42) + 1,
+            max_routes_per_cargo=max_routes_per_cargo,
         )
-        alerts = [*base_alerts, *disruption_alerts]
+    if events and skip_baseline:
+        base_result = None
+        scenario_result, adjusted_flights, alerts = run_scenario()
+    elif events:
+        run_baseline = partial(
+            run_ga,
+            cargo_map=cargo,
+            flights=flights,
+            connection_rules=connections,
+            seed=seed,
+            max_routes_per_cargo=max_routes_per_cargo,
+        )
+        if parallel_baseline and (os.cpu_count() or 1) > 1:
+            # The baseline GA does not depend on the disrupted schedule, so it
+            # runs in a worker process while the scenario GA runs here
+            with ProcessPoolExecutor(max_workers=1) as baseline_pool:
+                pending_baseline = baseline_pool.submit(run_baseline)
+                scenario_result, adjusted_flights, disruption_alerts = run_scenario()
+                base_result = pending_baseline.result()
+        else:
+            base_result = run_baseline()
+            scenario_result, adjusted_flights, disruption_alerts = run_scenario()
+        alerts = baseline_alerts(base_result)
+        alerts.extend(disruption_alerts)
+        alerts.extend(scenario_alerts(base_result, scenario_result))
     else:
+        base_result = run_ga(
+            cargo_map=cargo,
+            flights=flights,
+            connection_rules=connections,
+            seed=seed,
+            max_routes_per_cargo=max_routes_per_cargo,
+        )
         scenario_result = base_result
         adjusted_flights = flights
-        alerts = base_alerts
+        alerts = baseline_alerts(base_result)
 
-    if config.write_outputs:
-        output_dir = config.output_dir
-        write_plan_routes(scenario_result, output_dir / "plan_routes.csv")
-        write_flight_loads(scenario_result, adjusted_flights, output_dir / "flight_loads.csv")
-        write_alerts(alerts, output_dir / "alerts.csv")
-        write_json_summary(
-            scenario_result, adjusted_flights, alerts, output_dir / "plan_summary.json"
-        )
+    if adjusted_flights is not flights:
+        flight_table = build_flight_table(adjusted_flights)
 
     # Generate AI recommendations for denied/rolled cargo
-    recommendations = generate_ai_recommendations(scenario_result, cargo, adjusted_flights)
+    recommendations = generate_ai_recommendations(
+        scenario_result, cargo, adjusted_flights, seed=seed, flight_table=flight_table
+    )
     formatted_recommendations = format_recommendations_for_ui(recommendations)
 
     return PipelineResult(
@@ -115,21 +201,117 @@ def run_pipeline(config: PipelineConfig) -> PipelineResult:
     )
 
 
+@lru_cache(maxsize=8)
+def _plan_scenario_cached(
+    data_dir: str,
+    signature: Tuple[Tuple[int, int], ...],
+    event_fields: Tuple[Tuple[Any, ...], ...],
+    seed: int,
+    skip_baseline: bool,
+    parallel_baseline: bool,
+    max_routes_per_cargo: Optional[int],
+) -> PipelineResult:
+    """Seeded plans are deterministic, so one is reused while inputs and events match.
+
+    Keyed like the input cache on each file's mtime and size, so an edit to
+    the data directory (e.g. a cargo append) forces a fresh GA run. The
+    returned result is shared between hits; run_pipeline hands out copies.
+    """
+    events = [DisruptionEvent(*fields) for fields in event_fields]
+    return _plan_scenario(
+        data_dir, signature, events, seed, skip_baseline, parallel_baseline, max_routes_per_cargo
+    )
+
+
+def run_pipeline(config: PipelineConfig) -> PipelineResult:
+    # Checked up front so a bad format fails before the GA runs, not after
+    if config.write_outputs:
+        check_output_format(config.output_format)
+
+    events = config.events or ()
+    data_dir = str(config.data_dir.resolve())
+    signature = _input_signature(config.data_dir)
+    if config.seed is None:
+        result = _plan_scenario(
+            data_dir,
+            signature,
+            events,
+            None,
+            config.skip_baseline,
+            config.parallel_baseline,
+            config.max_routes_per_cargo,
+        )
+    else:
+        planned = _plan_scenario_cached(
+            data_dir,
+            signature,
+            tuple(astuple(event) for event in events),
+            config.seed,
+            config.skip_baseline,
+            config.parallel_baseline,
+            config.max_routes_per_cargo,
+        )
+        # Callers get their own copy of the plan, so edits to its results,
+        # assignments or alerts cannot leak into later cache hits
+        result = copy.deepcopy(planned)
+
+    if config.write_outputs:
+        output_dir = config.output_dir
+        suffix = config.output_format
+        scenario_result = result.scenario_result
+        adjusted_flights = result.adjusted_flights
+        alerts = result.alerts
+        # The writers only read the results, so their file I/O can overlap
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=4) as writers:
+            pending = [
+                writers.submit(write_plan_routes, scenario_result, output_dir / f"plan_routes.{suffix}"),
+                writers.submit(
+                    write_flight_loads,
+                    scenario_result,
+                    adjusted_flights,
+                    output_dir / f"flight_loads.{suffix}",
+                ),
+                writers.submit(write_alerts, alerts, output_dir / f"alerts.{suffix}"),
+                writers.submit(
+                    write_json_summary,
+                    scenario_result,
+                    adjusted_flights,
+                    alerts,
+                    output_dir / "plan_summary.json",
+                ),
+            ]
+            for future in pending:
+                future.result()
+
+    return result
+
+
 def result_to_payload(result: PipelineResult) -> Dict[str, Any]:
+    isoformat = _iso_formatter()
     cargo_payload = {}
+    # Summary counts reflect the GA statuses, before the validation below
+    delivered = rolled = denied = 0
+    corrected_ids: List[str] = []
     for cargo_id, assignment in result.scenario_result.assignments.items():
         cargo_obj = result.cargo[cargo_id]
+        status = assignment.status
+        if status == "delivered":
+            delivered += 1
+        elif status == "rolled":
+            rolled += 1
+        elif status == "denied":
+            denied += 1
         
         # CRITICAL VALIDATION: Ensure delivered cargo has valid flight assignments
-        validated_status = assignment.status
+        validated_status = status
         validated_reason = assignment.reason
         
-        if assignment.status == "delivered":
-            if not assignment.route.legs or len(assignment.route.legs) == 0:
-                # INVALID: Cargo marked as delivered without flight assignment
-                validated_status = "rolled"
-                validated_reason = "VALIDATION ERROR: Delivered status without flight assignment - corrected to rolled"
-                print(f"CRITICAL ERROR CORRECTED: Cargo {cargo_id} was marked delivered without flights")
+        if status == "delivered" and not assignment.route.legs:
+            # INVALID: Cargo marked as delivered without flight assignment
+            validated_status = "rolled"
+            validated_reason = "VALIDATION ERROR: Delivered status without flight assignment - corrected to rolled"
+            corrected_ids.append(cargo_id)
         
         cargo_payload[cargo_id] = {
             "status": validated_status,
@@ -146,14 +328,21 @@ def result_to_payload(result: PipelineResult) -> Dict[str, Any]:
                     "flight_id": leg.flight.flight_id,
                     "origin": leg.flight.origin,
                     "destination": leg.flight.destination,
-                    "departure": leg.departure_time.isoformat(),
-                    "arrival": leg.arrival_time.isoformat(),
+                    "departure": isoformat(leg.departure_time),
+                    "arrival": isoformat(leg.arrival_time),
                     "dwell_hours_before": leg.dwell_hours_before,
                 }
                 for leg in assignment.route.legs
             ],
         }
 
+    if corrected_ids:
+        logger.error(
+            "Corrected %d cargo marked delivered without flights to rolled: %s",
+            len(corrected_ids),
+            ", ".join(corrected_ids),
+        )
+
     flight_payload = {}
     for flight_id, flight in result.adjusted_flights.items():
         selection = result.scenario_result.flight_loads.get(flight_id)
@@ -172,8 +361,8 @@ def result_to_payload(result: PipelineResult) -> Dict[str, Any]:
         flight_payload[flight_id] = {
             "origin": flight.origin,
             "destination": flight.destination,
-            "departure": flight.departure_time.isoformat(),
-            "arrival": flight.arrival_time.isoformat(),
+            "departure": isoformat(flight.departure_time),
+            "arrival": isoformat(flight.arrival_time),
             "weight_capacity_kg": flight.weight_capacity_kg,
             "volume_capacity_m3": flight.volume_capacity_m3,
             "assigned": assigned,
@@ -182,17 +371,9 @@ def result_to_payload(result: PipelineResult) -> Dict[str, Any]:
     return {
         "summary": {
             "total_margin": result.scenario_result.total_margin,
-            "delivered": sum(
-                1
-                for a in result.scenario_result.assignments.values()
-                if a.status == "delivered"
-            ),
-            "rolled": sum(
-                1 for a in result.scenario_result.assignments.values() if a.status == "rolled"
-            ),
-            "denied": sum(
-                1 for a in result.scenario_result.assignments.values() if a.status == "denied"
-            ),
+            "delivered": delivered,
+            "rolled": rolled,
+            "denied": denied,
         },
         "cargo": cargo_payload,
         "flights": flight_payload,
@@ -200,7 +381,7 @@ def result_to_payload(result: PipelineResult) -> Dict[str, Any]:
             {
                 "type": alert.alert_type,
                 "severity": alert.severity,
-                "message": alert.message,
+                "message": str(alert.message),
                 "cargo_id": alert.cargo_id,
                 "flight_id": alert.flight_id,
                 "status": alert.status,
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Checks POST /cargo/add and the group-committed append queue behind it.
+"""
+
+import asyncio
+import csv
+import os
+import shutil
+import sys
+
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import api
+from load_data import DataValidationError, load_cargo_ids
+
+HEADER = "cargo_id,origin,destination\n"
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+NEW_CARGO = {
+    "cargo_id": "C900",
+    "origin": "DEL",
+    "destination": "BOM",
+    "weight_kg": 100,
+    "volume_m3": 1,
+    "revenue_inr": 10000,
+    "priority": "Low",
+    "max_transit_hours": 24,
+    "ready_time": "2025-01-01T00:00:00+05:30",
+    "due_by": "2025-01-02T00:00:00+05:30",
+    "handling_cost_per_kg": 1,
+    "sla_penalty_per_hour": 1,
+}
+
+
+async def _append_all(queue, path, rows):
+    writer = asyncio.create_task(queue.run())
+    try:
+        # Let the writer create its queue before the first append
+        await asyncio.sleep(0)
+        return await asyncio.gather(
+            *(queue.append(path, row) for row in rows), return_exceptions=True
+        )
+    finally:
+        writer.cancel()
+
+
+def test_concurrent_appends_share_writes(tmp_path, monkeypatch):
+    path = tmp_path / "cargo.csv"
+    path.write_text(HEADER + "C001,DEL,BOM\n", encoding="utf-8")
+    batches = []
+    append_rows = api.append_cargo_rows
+
+    def recording_append(target, rows):
+        batches.append(len(rows))
+        append_rows(target, rows)
+
+    monkeypatch.setattr(api, "append_cargo_rows", recording_append)
+
+    rows = [{"cargo_id": f"N{idx:03d}", "origin": "DEL", "destination": "DXB"} for idx in range(40)]
+    outcomes = asyncio.run(_append_all(api._CargoAppendQueue(max_batch=16), path, rows))
+
+    assert outcomes == [None] * len(rows)
+    # Every row lands once, in request order, in fewer writes than rows
+    with path.open(newline="", encoding="utf-8") as handle:
+        written = [row["cargo_id"] for row in csv.DictReader(handle)]
+    assert written == ["C001"] + [row["cargo_id"] for row in rows]
+    assert sum(batches) == len(rows)
+    assert len(batches) < len(rows)
+    assert max(batches) <= 16
+    assert {row["cargo_id"] for row in rows} <= load_cargo_ids(path)
+
+
+def test_failed_write_reaches_every_request(tmp_path):
+    path = tmp_path / "cargo.csv"
+    path.write_text("", encoding="utf-8")
+
+    rows = [{"cargo_id": f"N{idx:03d}"} for idx in range(3)]
+    outcomes = asyncio.run(_append_all(api._CargoAppendQueue(), path, rows))
+
+    assert all(isinstance(outcome, DataValidationError) for outcome in outcomes)
+
+
+def test_blank_cargo_id_is_refused(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    shutil.copytree(DATA_DIR, data_dir)
+    monkeypatch.setattr(api, "DATA_DIR", data_dir)
+    cargo_csv = data_dir / "cargo.csv"
+    before = cargo_csv.read_bytes()
+
+    with TestClient(api.app) as client:
+        for cargo_id in ("", "   ", "\t"):
+            response = client.post("/cargo/add", json={**NEW_CARGO, "cargo_id": cargo_id})
+            assert response.status_code == 422
+        assert cargo_csv.read_bytes() == before
+
+        # Surrounding whitespace is trimmed from a real id
+        response = client.post("/cargo/add", json={**NEW_CARGO, "cargo_id": " C900 ", "origin": " del"})
+        assert response.status_code == 200
+    assert cargo_csv.read_text(encoding="utf-8").splitlines()[-1].startswith("C900,DEL,BOM,")
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Regression checks for the disruption fast paths against the original,
+straightforward schedule edits and baseline/scenario comparison.
+"""
+
+import os
+import random
+import sys
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from disruptions import (
+    _MARGIN_CHANGE,
+    _MISSING,
+    _NO_CHANGE,
+    _REROUTE,
+    _STATUS_CHANGE,
+    DisruptionEvent,
+    _adjust_flights,
+    _classify_changes,
+    _compare_results,
+    apply_disruptions,
+    apply_disruptions_batch,
+)
+from ga_route import GAResult, run_ga
+from load_data import load_all
+
+DATA_DIR = Path(os.path.dirname(__file__)) / ".." / "data"
+
+# Small enough to keep the suite quick; the diff only needs differing plans
+GA_SETTINGS = dict(population_size=20, generations=10)
+
+_UNKNOWN_LABELS = {"delay": "Delay", "cancel": "Cancellation", "swap": "Aircraft swap"}
+
+
+def _reference_adjust_flights(flights, events):
+    """One copy of the schedule, edited event by event."""
+    adjusted = dict(flights)
+    alerts = []
+    for event in events:
+        flight = adjusted.get(event.flight_id)
+        if event.event_type not in _UNKNOWN_LABELS:
+            continue
+        if flight is None:
+            label = _UNKNOWN_LABELS[event.event_type]
+            alerts.append(
+                (event.event_type, "warning", f"{label} reported for unknown flight {event.flight_id}",
+                 None, event.flight_id, None, None)
+            )
+            continue
+        if event.event_type == "delay":
+            if event.delay_minutes <= 0:
+                continue
+            adjusted[flight.flight_id] = flight.shifted(timedelta(minutes=event.delay_minutes))
+            message = f"Flight {flight.flight_id} delayed by {event.delay_minutes} minutes"
+            alerts.append(("delay", "info", message, None, flight.flight_id, None, None))
+        elif event.event_type == "cancel":
+            adjusted.pop(flight.flight_id)
+            message = f"Flight {flight.flight_id} cancelled"
+            alerts.append(("cancel", "critical", message, None, flight.flight_id, None, None))
+        else:
+            new_weight = event.new_weight_capacity_kg or flight.weight_capacity_kg
+            new_volume = event.new_volume_capacity_m3 or flight.volume_capacity_m3
+            adjusted[flight.flight_id] = flight.with_capacity(new_weight, new_volume)
+            message = (
+                f"Aircraft swap on {flight.flight_id}: capacity set to "
+                f"{new_weight:.0f} kg / {new_volume:.0f} m³"
+            )
+            alerts.append(("swap", "warning", message, None, flight.flight_id, None, None))
+    return adjusted, alerts
+
+
+def _legs(route):
+    return tuple(leg.flight.flight_id for leg in route.legs)
+
+
+def _reference_compare(baseline, scenario):
+    """Every cargo in either plan, in id order, checked field by field."""
+    alerts = []
+    for cargo_id in sorted(set(baseline.assignments) | set(scenario.assignments)):
+        base_assign = baseline.assignments.get(cargo_id)
+        new_assign = scenario.assignments.get(cargo_id)
+        if new_assign is None:
+            message = f"Cargo {cargo_id} missing from disrupted solution"
+            alerts.append(("cargo_missing", "critical", message, cargo_id, None, None, None))
+            continue
+        base_status = base_assign.status if base_assign else "unknown"
+        new_status = new_assign.status
+        margin_delta = new_assign.margin - base_assign.margin if base_assign else None
+        base_route = _legs(base_assign.route) if base_assign else ()
+        new_route = _legs(new_assign.route)
+
+        if base_status != new_status:
+            severity = "critical" if new_status != "delivered" else "info"
+            message = f"Cargo {cargo_id} status changed {base_status} → {new_status}"
+            alerts.append(("status_change", severity, message, cargo_id, None, new_status, margin_delta))
+        elif base_route != new_route:
+            message = (
+                f"Cargo {cargo_id} rerouted: {'-'.join(base_route) or 'NONE'} → "
+                f"{'-'.join(new_route) or 'NONE'}"
+            )
+            alerts.append(("reroute", "warning", message, cargo_id, None, new_status, margin_delta))
+        elif margin_delta and abs(margin_delta) > 1e-3:
+            severity = "warning" if margin_delta < 0 else "info"
+            message = (
+                f"Cargo {cargo_id} margin {'decreased' if margin_delta < 0 else 'increased'} "
+                f"by ₹{abs(margin_delta):,.0f}"
+            )
+            alerts.append(("margin_change", severity, message, cargo_id, None, new_status, margin_delta))
+
+        if new_status != "delivered" and new_assign.reason:
+            alerts.append(
+                ("exception", "critical", new_assign.reason, cargo_id, None, new_status, margin_delta)
+            )
+    return alerts
+
+
+def _alert_fields(alert):
+    return (
+        alert.alert_type,
+        alert.severity,
+        str(alert.message),
+        alert.cargo_id,
+        alert.flight_id,
+        alert.status,
+        alert.margin_delta,
+    )
+
+
+def _random_events(rng, flight_ids, count, event_types):
+    events = []
+    for _ in range(count):
+        event_type = rng.choice(event_types)
+        # Unknown flights and repeated flights both need their own handling
+        flight_id = rng.choice(flight_ids + ["ZZ999"])
+        if event_type == "delay":
+            events.append(DisruptionEvent("delay", flight_id, delay_minutes=rng.choice([0, 15, 45, 180])))
+        elif event_type == "swap":
+            events.append(
+                DisruptionEvent(
+                    "swap",
+                    flight_id,
+                    new_weight_capacity_kg=rng.choice([None, 4000.0, 12000.0]),
+                    new_volume_capacity_m3=rng.choice([None, 20.0, 55.0]),
+                )
+            )
+        else:
+            events.append(DisruptionEvent(event_type, flight_id))
+    return events
+
+
+def test_event_handlers_match_reference():
+    flights, _, _ = load_all(DATA_DIR)
+    flight_ids = sorted(flights)
+    rng = random.Random(3)
+    # Every set holds a cancel, so dispatch goes through the handler table;
+    # unrecognised event types are skipped without an alert
+    for _ in range(80):
+        events = _random_events(rng, flight_ids, rng.randint(0, 7), ["delay", "cancel", "swap", "divert"])
+        events.insert(rng.randint(0, len(events)), DisruptionEvent("cancel", rng.choice(flight_ids)))
+        adjusted, alerts = _adjust_flights(flights, events)
+        expected_flights, expected_alerts = _reference_adjust_flights(flights, events)
+        assert adjusted == expected_flights
+        assert [_alert_fields(alert) for alert in alerts] == expected_alerts
+
+
+def test_classify_changes_precedence():
+    missing = np.array([True, False, False, False, False, False])
+    status_changed = np.array([True, True, False, False, False, False])
+    route_changed = np.array([True, True, True, False, False, False])
+    has_base = np.array([True, True, True, True, True, False])
+    base_margin = np.array([0.0, 0.0, 0.0, 100.0, 100.0, 0.0])
+    new_margin = np.array([9.0, 9.0, 9.0, 50.0, 100.0005, 70.0])
+
+    kind, margin_delta = _classify_changes(
+        missing, status_changed, route_changed, has_base, base_margin, new_margin
+    )
+    assert kind.tolist() == [_MISSING, _STATUS_CHANGE, _REROUTE, _MARGIN_CHANGE, _NO_CHANGE, _NO_CHANGE]
+    assert margin_delta[3] == -50.0
+    # Cargo new to the scenario have no baseline margin to compare against
+    assert np.isnan(margin_delta[5])
+
+
+def _scenario_plans():
+    """A seeded baseline and the plans for a few fixed random disruption sets."""
+    flights, cargo, connections = load_all(DATA_DIR)
+    baseline = run_ga(cargo, flights, connections, seed=42, **GA_SETTINGS)
+    flight_ids = sorted(flights)
+    rng = random.Random(5)
+    scenarios = []
+    for scenario_seed in range(4):
+        events = _random_events(rng, flight_ids, 3, ["delay", "cancel", "swap"])
+        adjusted, _ = _adjust_flights(flights, events)
+        scenarios.append(run_ga(cargo, adjusted, connections, seed=scenario_seed, **GA_SETTINGS))
+    return cargo, baseline, scenarios
+
+
+def test_compare_results_matches_reference():
+    _, baseline, scenarios = _scenario_plans()
+    for scenario in scenarios:
+        for base, new in ((baseline, scenario), (scenario, baseline)):
+            alerts = [_alert_fields(alert) for alert in _compare_results(base, new)]
+            assert alerts == _reference_compare(base, new)
+
+
+def test_compare_results_merges_unshared_cargo_ids():
+    cargo, baseline, scenarios = _scenario_plans()
+    cargo_ids = sorted(cargo)
+    for idx, scenario in enumerate(scenarios):
+        # Drop a cargo from each side so missing and scenario-only ids are covered
+        trimmed_base = GAResult(
+            baseline.total_margin,
+            {cid: a for cid, a in baseline.assignments.items() if cid != cargo_ids[idx]},
+            baseline.flight_loads,
+        )
+        trimmed_scenario = replace(
+            scenario,
+            assignments={cid: a for cid, a in scenario.assignments.items() if cid != cargo_ids[-1 - idx]},
+        )
+        alerts = [_alert_fields(alert) for alert in _compare_results(trimmed_base, trimmed_scenario)]
+        assert alerts == _reference_compare(trimmed_base, trimmed_scenario)
+
+
+def test_unchanged_schedule_is_not_copied():
+    flights, _, _ = load_all(DATA_DIR)
+    some_flight = next(iter(flights))
+    for events in (
+        [DisruptionEvent("delay", some_flight, delay_minutes=0)],
+        [DisruptionEvent("delay", "ZZ999", delay_minutes=30), DisruptionEvent("cancel", "ZZ999")],
+        [DisruptionEvent("swap", "ZZ999", new_weight_capacity_kg=1000.0)],
+    ):
+        adjusted, _ = _adjust_flights(flights, events)
+        assert adjusted is flights
+
+
+def test_accumulated_delays_match_reference():
+    flights, _, _ = load_all(DATA_DIR)
+    first, second = sorted(flights)[:2]
+    # Repeated delays are summed and shifted once; a swap or cancel in
+    # between must see the same result as edits applied one by one
+    for events in (
+        [
+            DisruptionEvent("delay", first, delay_minutes=30),
+            DisruptionEvent("delay", first, delay_minutes=45),
+            DisruptionEvent("swap", first, new_weight_capacity_kg=5000.0),
+            DisruptionEvent("delay", first, delay_minutes=15),
+        ],
+        [
+            DisruptionEvent("delay", first, delay_minutes=60),
+            DisruptionEvent("cancel", first),
+            DisruptionEvent("delay", first, delay_minutes=10),
+            DisruptionEvent("delay", second, delay_minutes=20),
+            DisruptionEvent("swap", second, new_volume_capacity_m3=30.0),
+        ],
+    ):
+        adjusted, alerts = _adjust_flights(flights, events)
+        expected_flights, expected_alerts = _reference_adjust_flights(flights, events)
+        assert adjusted == expected_flights
+        assert [_alert_fields(alert) for alert in alerts] == expected_alerts
+
+
+def test_delay_only_events_match_reference():
+    flights, _, _ = load_all(DATA_DIR)
+    flight_ids = sorted(flights)
+    rng = random.Random(11)
+    # Delay-only sets take _adjust_delays_only instead of the handler table
+    for _ in range(80):
+        events = _random_events(rng, flight_ids, rng.randint(0, 8), ["delay"])
+        adjusted, alerts = _adjust_flights(flights, events)
+        expected_flights, expected_alerts = _reference_adjust_flights(flights, events)
+        assert adjusted == expected_flights
+        assert [_alert_fields(alert) for alert in alerts] == expected_alerts
+
+
+def _plan_signature(result):
+    return result.total_margin, {
+        cargo_id: (assignment.status, assignment.margin, _legs(assignment.route))
+        for cargo_id, assignment in result.assignments.items()
+    }
+
+
+def test_apply_disruptions_matches_reference_pipeline():
+    flights, cargo, connections = load_all(DATA_DIR)
+    baseline = run_ga(cargo, flights, connections, seed=42)
+    events = [
+        DisruptionEvent("delay", "AI301", delay_minutes=120),
+        DisruptionEvent("cancel", "AI305"),
+        DisruptionEvent("swap", "AI307", new_weight_capacity_kg=8000.0),
+        DisruptionEvent("delay", "AI301", delay_minutes=30),
+        DisruptionEvent("delay", "ZZ999", delay_minutes=10),
+    ]
+
+    scenario, adjusted, alerts = apply_disruptions(
+        baseline, cargo, flights, connections, events, seed=123
+    )
+
+    # Event alerts come first, then the comparison alerts, in one list
+    expected_flights, expected_alerts = _reference_adjust_flights(flights, events)
+    expected_scenario = run_ga(cargo, expected_flights, connections, seed=123)
+    assert adjusted == expected_flights
+    assert _plan_signature(scenario) == _plan_signature(expected_scenario)
+    expected_alerts.extend(_reference_compare(baseline, expected_scenario))
+    assert [_alert_fields(alert) for alert in alerts] == expected_alerts
+
+
+def test_batch_matches_sequential_scenarios():
+    flights, cargo, connections = load_all(DATA_DIR)
+    baseline = run_ga(cargo, flights, connections, seed=42)
+    scenarios = [
+        [DisruptionEvent("cancel", "AI305")],
+        [DisruptionEvent("delay", "AI301", delay_minutes=240), DisruptionEvent("delay", "ZZ999")],
+        [DisruptionEvent("swap", "AI307", new_weight_capacity_kg=3000.0)],
+    ]
+
+    # Two workers force the process pool even on a single-CPU machine
+    pooled = apply_disruptions_batch(baseline, cargo, flights, connections, scenarios, max_workers=2)
+
+    assert len(pooled) == len(scenarios)
+    for events, (scenario, adjusted, alerts) in zip(scenarios, pooled):
+        expected_scenario, expected_flights, expected_alerts = apply_disruptions(
+            baseline, cargo, flights, connections, events
+        )
+        assert _plan_signature(scenario) == _plan_signature(expected_scenario)
+        assert adjusted == expected_flights
+        assert [_alert_fields(alert) for alert in alerts] == [
+            _alert_fields(alert) for alert in expected_alerts
+        ]
+
+
+if __name__ == "__main__":
+    test_event_handlers_match_reference()
+    test_delay_only_events_match_reference()
+    test_unchanged_schedule_is_not_copied()
+    test_accumulated_delays_match_reference()
+    test_classify_changes_precedence()
+    test_compare_results_matches_reference()
+    test_compare_results_merges_unshared_cargo_ids()
+    test_apply_disruptions_matches_reference_pipeline()
+    test_batch_matches_sequential_scenarios()
+    print("Disruption checks passed")
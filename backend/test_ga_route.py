@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Checks that the optional GA and catalog worker pools reproduce the
+in-process run, and that the seeded plan stays put.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from disruptions import DisruptionEvent, _adjust_flights
+from ga_route import (
+    _best_routes,
+    _CatalogSearch,
+    _connection_limits_for,
+    _route_options_for,
+    _search_paths,
+    build_route_catalog,
+    run_ga,
+)
+from load_data import load_all
+from pipeline import PipelineConfig, run_pipeline
+
+DATA_DIR = Path(os.path.dirname(__file__)) / ".." / "data"
+
+# Small enough to keep the suite quick, large enough to use the pools
+GA_SETTINGS = dict(population_size=16, generations=8, seed=7)
+
+
+def _plan_signature(result):
+    """Everything a published plan is built from, in comparable form."""
+    assignments = {
+        cargo_id: (
+            assignment.status,
+            assignment.margin,
+            tuple(leg.flight.flight_id for leg in assignment.route.legs),
+        )
+        for cargo_id, assignment in result.assignments.items()
+    }
+    loads = {
+        flight_id: tuple(candidate.cargo.cargo_id for candidate in selection.selected)
+        for flight_id, selection in result.flight_loads.items()
+    }
+    return result.total_margin, assignments, loads
+
+
+def _shared_memory_segments():
+    if not os.path.isdir("/dev/shm"):
+        return set()
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+def test_worker_pools_match_serial_run():
+    flights, cargo, connections = load_all(DATA_DIR)
+    serial = _plan_signature(run_ga(cargo, flights, connections, max_workers=1, **GA_SETTINGS))
+
+    threaded = run_ga(cargo, flights, connections, max_workers=2, pool="thread", **GA_SETTINGS)
+    assert _plan_signature(threaded) == serial
+
+    segments_before = _shared_memory_segments()
+    processed = run_ga(cargo, flights, connections, max_workers=2, pool="process", **GA_SETTINGS)
+    assert _plan_signature(processed) == serial
+    # The shared gene matrix is unlinked once the run finishes
+    assert _shared_memory_segments() == segments_before
+
+
+def test_seeded_plan_is_unchanged():
+    # Reference output of the seeded default run on the bundled data
+    flights, cargo, connections = load_all(DATA_DIR)
+    result = run_ga(cargo, flights, connections, seed=42)
+    assert result.total_margin == 15154262.0
+    undelivered = sorted(
+        cargo_id for cargo_id, assignment in result.assignments.items() if assignment.status != "delivered"
+    )
+    assert len(result.assignments) == 41
+    assert undelivered == ["C038", "C039", "C040"]
+
+
+def test_route_caches_do_not_change_plans():
+    flights, cargo, connections = load_all(DATA_DIR)
+    disrupted, _ = _adjust_flights(
+        flights,
+        [DisruptionEvent("delay", "AI301", delay_minutes=90), DisruptionEvent("cancel", "AI305")],
+    )
+
+    _route_options_for.cache_clear()
+    _connection_limits_for.cache_clear()
+    cold = _plan_signature(run_ga(cargo, flights, connections, **GA_SETTINGS))
+    cold_disrupted = _plan_signature(run_ga(cargo, disrupted, connections, **GA_SETTINGS))
+
+    # Warm runs, interleaved so each schedule follows the other's cache entries
+    assert _plan_signature(run_ga(cargo, flights, connections, **GA_SETTINGS)) == cold
+    assert _plan_signature(run_ga(cargo, disrupted, connections, **GA_SETTINGS)) == cold_disrupted
+    assert _route_options_for.cache_info().hits
+
+
+def test_unknown_pool_is_rejected():
+    flights, cargo, connections = load_all(DATA_DIR)
+    try:
+        run_ga(cargo, flights, connections, pool="fiber", **GA_SETTINGS)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("run_ga accepted an unknown pool kind")
+
+
+def test_pooled_catalog_matches_serial():
+    flights, cargo, connections = load_all(DATA_DIR)
+    serial = build_route_catalog(cargo, flights, connections)
+    pooled = build_route_catalog(cargo, flights, connections, max_workers=2)
+    assert list(pooled) == list(serial)
+    assert pooled == serial
+
+
+def test_route_cap_keeps_best_routes_before_fallback():
+    flights, cargo, connections = load_all(DATA_DIR)
+    full = build_route_catalog(cargo, flights, connections, max_routes_per_cargo=None)
+    capped = build_route_catalog(cargo, flights, connections, max_routes_per_cargo=2)
+    for cargo_id, routes in full.items():
+        flown, fallback = routes[:-1], routes[-1]
+        best = sorted(flown, key=lambda route: route.total_margin, reverse=True)[:2]
+        assert capped[cargo_id][:-1] == [route for route in flown if route in best]
+        assert capped[cargo_id][-1] == fallback
+
+
+def test_pruned_route_build_matches_trimmed_build():
+    flights, cargo, connections = load_all(DATA_DIR)
+    search = _CatalogSearch(flights, connections)
+    for item in cargo.values():
+        paths = _search_paths(
+            item,
+            search.flights_by_origin,
+            search.departures_by_origin,
+            search.earliest(item.destination),
+            item.max_transit_hours,
+            4,
+        )
+        # Repeated paths score the same, so the ties are exercised too
+        paths = tuple(paths) * 3
+        everything = list(_route_options_for(item, paths, search.rules, None))
+        for limit in (1, 2, 5):
+            pruned = _route_options_for(item, paths, search.rules, None, limit)
+            assert list(pruned) == _best_routes(everything, limit)
+
+
+def test_pipeline_passes_route_cap_to_ga(tmp_path):
+    flights, cargo, connections = load_all(DATA_DIR)
+    for cap in (1, None):
+        config = PipelineConfig(
+            data_dir=DATA_DIR, output_dir=tmp_path, write_outputs=False, max_routes_per_cargo=cap
+        )
+        planned = run_pipeline(config).scenario_result
+        direct = run_ga(cargo, flights, connections, seed=config.seed, max_routes_per_cargo=cap)
+        assert _plan_signature(planned) == _plan_signature(direct)
+
+
+if __name__ == "__main__":
+    test_worker_pools_match_serial_run()
+    test_seeded_plan_is_unchanged()
+    test_route_caches_do_not_change_plans()
+    test_unknown_pool_is_rejected()
+    test_pooled_catalog_matches_serial()
+    test_route_cap_keeps_best_routes_before_fallback()
+    test_pruned_route_build_matches_trimmed_build()
+    with tempfile.TemporaryDirectory() as output_dir:
+        test_pipeline_passes_route_cap_to_ga(Path(output_dir))
+    print("GA pool checks passed")
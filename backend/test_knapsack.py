@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Checks the branch-and-bound low-priority selection against plain enumeration.
+"""
+
+import os
+import random
+import sys
+from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from knapsack import _ENUMERATE_UP_TO, FlightCargoCandidate, _select_optimal_low_priority
+
+
+def _enumerate_low_priority(candidates, max_weight, max_volume):
+    """The original exhaustive search: first strictly best subset in combinations order."""
+    best_subset = []
+    best_score = -1.0
+    for r in range(len(candidates) + 1):
+        for combo in combinations(candidates, r):
+            total_weight = sum(item.weight_kg for item in combo)
+            total_volume = sum(item.volume_m3 for item in combo)
+            if total_weight > max_weight or total_volume > max_volume:
+                continue
+            revenue_density_sum = sum(item.revenue_density for item in combo)
+            weight_util = total_weight / max_weight if max_weight > 0 else 0
+            volume_util = total_volume / max_volume if max_volume > 0 else 0
+            total_score = revenue_density_sum + min(weight_util, volume_util) * 1000
+            if total_score > best_score:
+                best_score = total_score
+                best_subset = list(combo)
+    return best_subset
+
+
+def _candidate(rng):
+    # Round sizes and densities mixed with arbitrary ones, so ties are common
+    weight = rng.choice([rng.uniform(10, 500), float(rng.randint(1, 5) * 100)])
+    volume = rng.choice([rng.uniform(0.1, 5), float(rng.randint(1, 5))])
+    density = rng.choice([rng.uniform(0, 5000), 1000.0, 0.0])
+    return FlightCargoCandidate(
+        cargo=None,
+        margin=0.0,
+        revenue=0.0,
+        weight_kg=weight,
+        volume_m3=volume,
+        revenue_density=density,
+        priority_score=1,
+        dwell_hours=0.0,
+    )
+
+
+def test_branch_and_bound_matches_enumeration():
+    rng = random.Random(20240611)
+    for _ in range(300):
+        count = rng.randint(_ENUMERATE_UP_TO + 1, 11)
+        pool = []
+        for _ in range(count):
+            # The same candidate twice exercises the earliest-index tie-break
+            pool.append(rng.choice(pool) if pool and rng.random() < 0.2 else _candidate(rng))
+
+        total_weight = sum(item.weight_kg for item in pool)
+        total_volume = sum(item.volume_m3 for item in pool)
+        # Tight weight with loose volume, the reverse, both tight, or neither
+        max_weight = total_weight * rng.choice([0.2, 0.5, 1.0, 1.5])
+        max_volume = total_volume * rng.choice([0.2, 0.5, 1.0, 1.5])
+
+        expected = _enumerate_low_priority(pool, max_weight, max_volume)
+        chosen = _select_optimal_low_priority(pool, max_weight, max_volume)
+        assert [id(item) for item in chosen] == [id(item) for item in expected]
+
+
+if __name__ == "__main__":
+    test_branch_and_bound_matches_enumeration()
+    print("Low-priority selection checks passed")
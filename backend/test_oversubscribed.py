@@ -5,6 +5,9 @@ Test script to verify priority system works with oversubscribed capacity.
 
 import sys
 import os
+
+import pandas as pd
+
 sys.path.insert(0, os.path.dirname(__file__))
 
 # Simple test to check cargo data
@@ -17,33 +20,19 @@ def test_oversubscribed_capacity():
         print(f"ERROR: Cargo file not found: {cargo_file}")
         return
 
-    total_weight = 0
-    total_volume = 0
-    high_count = 0
-    medium_count = 0
-    low_count = 0
-
-    with open(cargo_file, 'r') as f:
-        lines = f.readlines()[1:]  # Skip header
-
-        for line in lines:
-            parts = line.strip().split(',')
-            if len(parts) >= 8:
-                weight = float(parts[3])  # weight_kg is column 3 (0-indexed: 0,1,2,3)
-                volume = float(parts[4])  # volume_m3 is column 4
-                priority = parts[6]       # priority is column 6
-
-                total_weight += weight
-                total_volume += volume
-
-                if priority == "High":
-                    high_count += 1
-                elif priority == "Medium":
-                    medium_count += 1
-                elif priority == "Low":
-                    low_count += 1
-
-    print(f"Total cargo items: {len(lines)}")
+    cargo = pd.read_csv(
+        cargo_file,
+        usecols=["weight_kg", "volume_m3", "priority"],
+        dtype={"weight_kg": "float64", "volume_m3": "float64", "priority": "category"},
+    )
+    total_weight = cargo["weight_kg"].sum()
+    total_volume = cargo["volume_m3"].sum()
+    priority_counts = cargo["priority"].value_counts()
+    high_count = priority_counts.get("High", 0)
+    medium_count = priority_counts.get("Medium", 0)
+    low_count = priority_counts.get("Low", 0)
+
+    print(f"Total cargo items: {len(cargo)}")
     print(f"High priority: {high_count}")
     print(f"Medium priority: {medium_count}")
     print(f"Low priority: {low_count}")
@@ -56,20 +45,13 @@ def test_oversubscribed_capacity():
         print(f"ERROR: Flight file not found: {flight_file}")
         return
 
-    flight_weight_capacity = 0
-    flight_volume_capacity = 0
-
-    with open(flight_file, 'r') as f:
-        lines = f.readlines()[1:]  # Skip header
-
-        for line in lines:
-            parts = line.strip().split(',')
-            if len(parts) >= 8:
-                weight_cap = float(parts[6])
-                volume_cap = float(parts[7])
-
-                flight_weight_capacity += weight_cap
-                flight_volume_capacity += volume_cap
+    flights = pd.read_csv(
+        flight_file,
+        usecols=["weight_capacity_kg", "volume_capacity_m3"],
+        dtype={"weight_capacity_kg": "float64", "volume_capacity_m3": "float64"},
+    )
+    flight_weight_capacity = flights["weight_capacity_kg"].sum()
+    flight_volume_capacity = flights["volume_capacity_m3"].sum()
 
     print(f"Total flight weight capacity: {flight_weight_capacity:,.0f} kg")
     print(f"Total flight volume capacity: {flight_volume_capacity:,.0f} m³")
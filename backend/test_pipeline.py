@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Checks that cached pipeline plans are isolated from their callers.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import outputs
+from pipeline import PipelineConfig, run_pipeline
+
+DATA_DIR = Path(os.path.dirname(__file__)) / ".." / "data"
+
+
+def test_cached_plan_is_not_shared_with_callers(tmp_path):
+    config = PipelineConfig(data_dir=DATA_DIR, output_dir=tmp_path, write_outputs=False, seed=5)
+    first = run_pipeline(config)
+    expected_margin = first.scenario_result.total_margin
+    cargo_id, assignment = next(iter(first.scenario_result.assignments.items()))
+    expected_status = assignment.status
+    expected_alerts = len(first.alerts)
+
+    # A caller editing its result must not change what the next hit returns
+    assignment.status = "edited"
+    first.scenario_result.total_margin = -1.0
+    first.scenario_result.assignments.clear()
+    first.alerts.clear()
+
+    second = run_pipeline(config)
+    assert second.scenario_result is not first.scenario_result
+    assert second.scenario_result.total_margin == expected_margin
+    assert second.scenario_result.assignments[cargo_id].status == expected_status
+    assert len(second.alerts) == expected_alerts
+
+
+def test_arrow_formats_need_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(outputs.importlib.util, "find_spec", lambda name: None)
+    for output_format in ("feather", "parquet"):
+        config = PipelineConfig(data_dir=DATA_DIR, output_dir=tmp_path, output_format=output_format)
+        try:
+            run_pipeline(config)
+        except ValueError as exc:
+            assert "pyarrow" in str(exc)
+        else:
+            raise AssertionError(f"{output_format} accepted without pyarrow")
+    assert not any(tmp_path.iterdir())
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        test_cached_plan_is_not_shared_with_callers(Path(out_dir))
+    print("Pipeline cache checks passed")